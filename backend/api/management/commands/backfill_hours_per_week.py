@@ -0,0 +1,50 @@
+"""
+回填每周可投入小时数
+按 post_id 分批解析 Skill_information.spend_time，写入 hours_per_week / hours_parsed
+
+用法:
+    python manage.py backfill_hours_per_week                # 只处理尚未解析的旧数据
+    python manage.py backfill_hours_per_week --all          # 解析规则调整后全部重新解析
+    python manage.py backfill_hours_per_week --batch-size 2000
+"""
+from django.core.management.base import BaseCommand
+
+from api.models import SkillInformation
+
+
+class Command(BaseCommand):
+    help = '解析个人技能的可投入时间并回填每周小时数'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='每批处理的记录数')
+        parser.add_argument('--all', action='store_true', help='重新解析全部记录，而不只是尚未解析的')
+
+    def handle(self, *args, **options):
+        from api.views.project import parse_spend_time
+
+        batch_size = max(1, options['batch_size'])
+        queryset = SkillInformation.objects.all() if options['all'] else SkillInformation.objects.filter(hours_parsed__isnull=True)
+
+        processed = 0
+        unparsed = 0
+        last_id = 0
+        while True:
+            rows = list(
+                queryset.filter(post_id__gt=last_id)
+                .order_by('post_id')
+                .values_list('post_id', 'spend_time')[:batch_size]
+            )
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            changed = []
+            for post_id, spend_time in rows:
+                hours, parsed = parse_spend_time(spend_time)
+                if not parsed:
+                    unparsed += 1
+                changed.append(SkillInformation(post_id=post_id, hours_per_week=hours, hours_parsed=parsed))
+            SkillInformation.objects.bulk_update(changed, ['hours_per_week', 'hours_parsed'], batch_size=500)
+            processed += len(rows)
+            self.stdout.write(f'已处理 {processed}，无法解析 {unparsed}')
+
+        self.stdout.write(self.style.SUCCESS(f'回填完成：处理 {processed}，无法解析 {unparsed}'))
@@ -0,0 +1,82 @@
+"""
+招募分配优化基准
+在随机数据上校验 assign_students 与穷举结果一致，并测量不同规模下的耗时
+
+用法:
+    python manage.py bench_assignment
+    python manage.py bench_assignment --students 1000 5000 --projects 10 --density 0.3
+    python manage.py bench_assignment --students 2000 --projects 50 --verify 2000
+"""
+import itertools
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.utils.assignment import assign_students
+
+
+def brute_force_total(weights, capacities):
+    """穷举所有分配（作为对照，仅适用于很小的规模）"""
+    best = 0.0
+    options = [[None] + list(edges) for edges in weights]
+    for choice in itertools.product(*options):
+        used = [0] * len(capacities)
+        total = 0.0
+        for student, project in enumerate(choice):
+            if project is None:
+                continue
+            used[project] += 1
+            total += weights[student][project]
+        if all(count <= capacity for count, capacity in zip(used, capacities)):
+            best = max(best, total)
+    return best
+
+
+def make_instance(students, projects, density, rng, max_capacity):
+    """生成随机实例：匹配度 = 技能评分（0~10）+ 时间匹配度（0~2）"""
+    weights = []
+    for _ in range(students):
+        edges = {
+            project: round(rng.uniform(0, 10) + rng.uniform(0, 2), 2)
+            for project in range(projects) if rng.random() < density
+        }
+        weights.append(edges)
+    capacities = [rng.randint(1, max_capacity) for _ in range(projects)]
+    return weights, capacities
+
+
+class Command(BaseCommand):
+    help = '校验并测量招募分配优化的耗时'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, nargs='+', default=[500, 1000, 2000, 5000], help='学生数')
+        parser.add_argument('--projects', type=int, default=10, help='项目数')
+        parser.add_argument('--density', type=float, default=0.3, help='每个学生可分配到某项目的概率')
+        parser.add_argument('--capacity', type=int, default=0, help='单个项目最大招募数（默认学生数的 1/项目数）')
+        parser.add_argument('--verify', type=int, default=200, help='穷举校验的小规模随机实例数')
+        parser.add_argument('--seed', type=int, default=42, help='随机种子')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+
+        for _ in range(options['verify']):
+            weights, capacities = make_instance(rng.randint(1, 7), rng.randint(1, 3), 0.7, rng, 3)
+            _, total = assign_students(weights, capacities)
+            expected = brute_force_total(weights, capacities)
+            if abs(total - expected) > 1e-6:
+                raise CommandError(f'结果与穷举不一致: {total} != {expected}, 实例 {weights} {capacities}')
+        self.stdout.write(f'穷举校验通过：{options["verify"]} 个随机实例')
+
+        projects = max(1, options['projects'])
+        self.stdout.write(f'{"学生数":>8} {"项目数":>6} {"总名额":>8} {"已分配":>8} {"耗时(ms)":>10}')
+        for students in options['students']:
+            max_capacity = options['capacity'] or max(1, students // projects)
+            weights, capacities = make_instance(students, projects, options['density'], rng, max_capacity)
+            started = time.perf_counter()
+            assignment, _ = assign_students(weights, capacities)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            assigned = sum(1 for project in assignment if project is not None)
+            self.stdout.write(
+                f'{students:>8} {projects:>6} {sum(capacities):>8} {assigned:>8} {elapsed_ms:>10.1f}'
+            )
@@ -0,0 +1,97 @@
+"""
+关键词打分微基准
+对比逐词 `in` 扫描与 Aho–Corasick 匹配器在不同词表规模下的耗时，并校验两者得分一致
+
+用法:
+    python manage.py bench_keyword_score
+    python manage.py bench_keyword_score --sizes 100 1000 10000 --texts 500
+"""
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.utils.keyword_matcher import KeywordMatcher
+
+_CJK_CHARS = '数据分析机器学习深度网络模型训练推理视觉语言处理系统开发前端后端算法优化检测识别控制嵌入式硬件云计算安全'
+_ASCII_CHARS = 'abcdefghijklmnopqrstuvwxyz'
+
+
+def loop_keyword_score(entries, text):
+    """原有实现：逐组逐词做子串判断（作为对照）"""
+    if not text:
+        return 0.0
+    text_lower = text.lower()
+    score = 0.0
+    for item in entries:
+        names = [item.get('name', '')]
+        aliases = item.get('aliases') or []
+        keywords = [kw for kw in names + aliases if kw]
+        for keyword in keywords:
+            if keyword.lower() in text_lower:
+                score += float(item.get('base_weight', 0))
+                break  # 同一组命中一次即可
+    return score
+
+
+def make_entries(size, rng):
+    """生成随机词表：中文词 + 英文别名"""
+    entries = []
+    for _ in range(size):
+        name = ''.join(rng.choice(_CJK_CHARS) for _ in range(rng.randint(2, 5)))
+        aliases = [
+            ''.join(rng.choice(_ASCII_CHARS) for _ in range(rng.randint(2, 8)))
+            for _ in range(rng.randint(0, 2))
+        ]
+        entries.append({'name': name, 'aliases': aliases, 'base_weight': rng.randint(1, 6)})
+    return entries
+
+
+def make_texts(entries, count, rng):
+    """生成与项目经历长度相近的文本，混入若干词表中的词"""
+    texts = []
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(3, 8)):
+            item = rng.choice(entries)
+            parts.append(rng.choice([item['name']] + item['aliases']).upper())
+            parts.append(''.join(rng.choice(_CJK_CHARS) for _ in range(rng.randint(5, 20))))
+        texts.append('，'.join(parts)[:255])
+    return texts
+
+
+class Command(BaseCommand):
+    help = '对比关键词打分的逐词扫描与 Aho–Corasick 实现'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000], help='词表规模')
+        parser.add_argument('--texts', type=int, default=200, help='每种规模打分的文本数')
+        parser.add_argument('--seed', type=int, default=42, help='随机种子')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        self.stdout.write(f'{"词表规模":>8} {"编译(ms)":>10} {"逐词(ms/条)":>12} {"自动机(ms/条)":>14} {"加速比":>8}')
+        for size in options['sizes']:
+            entries = make_entries(size, rng)
+            texts = make_texts(entries, max(1, options['texts']), rng)
+
+            started = time.perf_counter()
+            matcher = KeywordMatcher(entries)
+            compile_ms = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            expected = [loop_keyword_score(entries, text) for text in texts]
+            loop_ms = (time.perf_counter() - started) * 1000 / len(texts)
+
+            started = time.perf_counter()
+            actual = [matcher.score(text) for text in texts]
+            matcher_ms = (time.perf_counter() - started) * 1000 / len(texts)
+
+            if expected != actual:
+                mismatches = sum(1 for a, b in zip(expected, actual) if a != b)
+                raise CommandError(f'词表规模 {size}: {mismatches} 条文本得分不一致')
+
+            self.stdout.write(
+                f'{size:>8} {compile_ms:>10.1f} {loop_ms:>12.3f} {matcher_ms:>14.3f} '
+                f'{loop_ms / matcher_ms if matcher_ms else 0:>7.1f}x'
+            )
@@ -0,0 +1,219 @@
+"""
+批量导入学生/教师账号
+流式读取 CSV 或 JSONL，分块校验、批量查重、批量写库，密码哈希在进程池中并行计算
+
+CSV 表头: identity,account,name,password,grade,title
+JSONL 每行: {"identity": 0, "account": "2023001", "name": "张三", "password": "...", "extra": {"grade": 1}}
+           （也可直接在顶层提供 grade / title）
+
+用法:
+    python manage.py import_accounts accounts.csv
+    python manage.py import_accounts accounts.jsonl --chunk-size 2000 --workers 8
+    python manage.py import_accounts accounts.csv --dry-run
+"""
+import csv
+import json
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from api.models import User, StudentEntity, TeacherEntity
+from api.serializers import RegisterSerializer
+
+
+def _init_worker():
+    """子进程初始化（spawn 启动方式下需要重新加载 Django）"""
+    django.setup()
+
+
+def _hash_password(raw_password):
+    return make_password(raw_password)
+
+
+def iter_rows(path):
+    """按行流式读取，产出 (行号, 原始记录)"""
+    if path.endswith('.jsonl') or path.endswith('.ndjson'):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield line_no, json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield line_no, {'__error__': f'JSON 解析失败: {e}'}
+    else:
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            # 表头为第 1 行，数据从第 2 行开始
+            for line_no, row in enumerate(csv.DictReader(f), start=2):
+                yield line_no, row
+
+
+def normalize_row(row):
+    """把 CSV/JSONL 记录整理为 RegisterSerializer 的输入格式"""
+    extra = dict(row.get('extra') or {})
+    for key in ('grade', 'title'):
+        if row.get(key) not in (None, '') and key not in extra:
+            extra[key] = row[key]
+    return {
+        'identity': row.get('identity'),
+        'account': row.get('account'),
+        'name': row.get('name'),
+        'password': row.get('password'),
+        'extra': extra,
+    }
+
+
+class Command(BaseCommand):
+    help = '从 CSV/JSONL 批量导入学生和教师账号'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV 或 JSONL 文件路径')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='每块处理的记录数')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='密码哈希进程数')
+        parser.add_argument('--dry-run', action='store_true', help='只校验，不写库')
+        parser.add_argument('--max-errors', type=int, default=50, help='最多输出的错误行数')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not os.path.exists(path):
+            raise CommandError(f'文件不存在: {path}')
+
+        chunk_size = max(1, options['chunk_size'])
+        self.dry_run = options['dry_run']
+        self.max_errors = options['max_errors']
+        self.error_count = 0
+        self.created = 0
+        self.skipped = 0
+
+        self.workers = max(1, options['workers'])
+
+        started = time.monotonic()
+        rows = iter_rows(path)
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker) as pool:
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                self.import_chunk(chunk, pool)
+                elapsed = time.monotonic() - started
+                self.stdout.write(
+                    f'已导入 {self.created}，跳过 {self.skipped}，错误 {self.error_count}'
+                    f'（{self.created / elapsed if elapsed else 0:.1f} 条/秒）'
+                )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{"校验" if self.dry_run else "导入"}完成：新建 {self.created}，'
+            f'已存在跳过 {self.skipped}，错误 {self.error_count}'
+        ))
+
+    def report_error(self, line_no, errors):
+        self.error_count += 1
+        if self.error_count <= self.max_errors:
+            self.stderr.write(f'第 {line_no} 行: {errors}')
+
+    def import_chunk(self, chunk, pool):
+        """校验、查重并写入一块记录"""
+        valid = []
+        seen = set()
+        for line_no, row in chunk:
+            if '__error__' in row:
+                self.report_error(line_no, row['__error__'])
+                continue
+            serializer = RegisterSerializer(data=normalize_row(row))
+            if not serializer.is_valid():
+                self.report_error(line_no, serializer.errors)
+                continue
+            data = serializer.validated_data
+            try:
+                account = int(data['account'])
+            except (ValueError, TypeError):
+                self.report_error(line_no, {'account': '账号格式错误，必须是数字'})
+                continue
+            key = (data['identity'], account)
+            if key in seen:
+                self.report_error(line_no, {'account': '文件内账号重复'})
+                continue
+            seen.add(key)
+            valid.append((account, data))
+
+        # 每块每种身份一次 IN 查询查重
+        student_accounts = [account for account, data in valid if data['identity'] == 0]
+        teacher_accounts = [account for account, data in valid if data['identity'] == 1]
+        existing_students = set(
+            StudentEntity.objects.filter(student_id__in=student_accounts).values_list('student_id', flat=True)
+        ) if student_accounts else set()
+        existing_teachers = set(
+            TeacherEntity.objects.filter(teacher_id__in=teacher_accounts).values_list('teacher_id', flat=True)
+        ) if teacher_accounts else set()
+
+        pending = []
+        for account, data in valid:
+            existing = existing_students if data['identity'] == 0 else existing_teachers
+            if account in existing:
+                self.skipped += 1
+                continue
+            pending.append((account, data))
+
+        if not pending or self.dry_run:
+            self.created += len(pending)
+            return
+
+        # 密码哈希是 CPU 密集型操作，交给进程池并行
+        hashed_passwords = list(pool.map(
+            _hash_password,
+            [data['password'] for account, data in pending],
+            chunksize=max(1, len(pending) // (self.workers * 4))
+        ))
+
+        with transaction.atomic():
+            users = self.create_users(pending, hashed_passwords)
+            students = []
+            teachers = []
+            for user, (account, data) in zip(users, pending):
+                if data['identity'] == 0:
+                    students.append(StudentEntity(
+                        student_id=account,
+                        user_id=user.user_id,
+                        student_name=data['name'],
+                        grade=int(data['extra']['grade'])
+                    ))
+                else:
+                    teachers.append(TeacherEntity(
+                        teacher_id=account,
+                        user_id=user.user_id,
+                        teacher_name=data['name'],
+                        title=data['extra']['title']
+                    ))
+            StudentEntity.objects.bulk_create(students)
+            TeacherEntity.objects.bulk_create(teachers)
+
+        self.created += len(pending)
+
+    def create_users(self, pending, hashed_passwords):
+        """批量插入 User 并拿回主键
+
+        MySQL 的 bulk_create 不返回自增主键，此时用临时 token 标记本批记录再查回
+        """
+        returns_pk = connection.features.can_return_rows_from_bulk_insert
+        markers = [None if returns_pk else f'import:{uuid.uuid4().hex}' for _ in pending]
+        users = [
+            User(identity=data['identity'], password=password, token=marker or '')
+            for (account, data), password, marker in zip(pending, hashed_passwords, markers)
+        ]
+        users = User.objects.bulk_create(users)
+        if returns_pk:
+            return users
+
+        ids_by_marker = dict(User.objects.filter(token__in=markers).values_list('token', 'user_id'))
+        User.objects.filter(token__in=markers).update(token='')
+        for user, marker in zip(users, markers):
+            user.user_id = ids_by_marker[marker]
+        return users
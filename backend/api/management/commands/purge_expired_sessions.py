@@ -0,0 +1,45 @@
+"""
+清理过期登录会话
+分批删除，避免长事务和大范围锁
+
+用法:
+    python manage.py purge_expired_sessions
+    python manage.py purge_expired_sessions --batch-size 5000 --sleep 0.1
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.models import UserSession
+
+
+class Command(BaseCommand):
+    help = '分批删除已过期的登录会话'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='每批删除的会话数')
+        parser.add_argument('--sleep', type=float, default=0.0, help='每批之间的休眠秒数')
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        pause = max(0.0, options['sleep'])
+        now = timezone.now()
+
+        total = 0
+        while True:
+            # 走 expires_at 索引取一批主键，再按主键删除
+            session_ids = list(
+                UserSession.objects.filter(expires_at__lte=now)
+                .order_by('expires_at')
+                .values_list('id', flat=True)[:batch_size]
+            )
+            if not session_ids:
+                break
+            deleted, _ = UserSession.objects.filter(id__in=session_ids).delete()
+            total += deleted
+            self.stdout.write(f'已删除 {total} 条过期会话')
+            if pause:
+                time.sleep(pause)
+
+        self.stdout.write(self.style.SUCCESS(f'清理完成，共删除 {total} 条过期会话'))
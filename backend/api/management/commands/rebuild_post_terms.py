@@ -0,0 +1,53 @@
+"""
+重建推荐词项向量
+按 post_id 顺序分批重建 Post_term（上线后首次执行，或调整词项权重之后）
+
+用法:
+    python manage.py rebuild_post_terms
+    python manage.py rebuild_post_terms --batch-size 1000
+    python manage.py rebuild_post_terms --post-id 12 --post-id 13
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.models import PostEntity
+from api.utils.recommend import refresh_post_terms
+
+
+class Command(BaseCommand):
+    help = '重建推荐词项向量'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='每批重建的 post 数')
+        parser.add_argument('--post-id', type=int, action='append', dest='post_ids', help='只重建指定 post（可重复）')
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        started = time.monotonic()
+
+        if options['post_ids']:
+            rows = refresh_post_terms(options['post_ids'])
+            self.stdout.write(self.style.SUCCESS(f'已重建 {rows} 个词项'))
+            return
+
+        last_id = 0
+        posts = 0
+        rows = 0
+        while True:
+            post_ids = list(
+                PostEntity.objects.filter(post_id__gt=last_id)
+                .order_by('post_id')
+                .values_list('post_id', flat=True)[:batch_size]
+            )
+            if not post_ids:
+                break
+            rows += refresh_post_terms(post_ids)
+            posts += len(post_ids)
+            last_id = post_ids[-1]
+            self.stdout.write(f'已处理 {posts} 个 post，{rows} 个词项')
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'重建完成：{posts} 个 post，{rows} 个词项，用时 {elapsed:.1f} 秒'
+        ))
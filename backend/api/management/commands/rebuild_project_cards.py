@@ -0,0 +1,53 @@
+"""
+重建项目列表卡片
+按 post_id 顺序分批重建 Project_card（上线后首次执行，或发布人改名等未覆盖的写路径之后校正）
+
+用法:
+    python manage.py rebuild_project_cards
+    python manage.py rebuild_project_cards --batch-size 1000
+    python manage.py rebuild_project_cards --post-id 12 --post-id 13
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.models import PostEntity
+from api.utils.project_card import refresh_project_cards
+
+
+class Command(BaseCommand):
+    help = '重建项目列表卡片'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='每批重建的 post 数')
+        parser.add_argument('--post-id', type=int, action='append', dest='post_ids', help='只重建指定 post（可重复）')
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        started = time.monotonic()
+
+        if options['post_ids']:
+            cards = refresh_project_cards(options['post_ids'])
+            self.stdout.write(self.style.SUCCESS(f'已重建 {len(cards)} 张卡片'))
+            return
+
+        last_id = 0
+        posts = 0
+        cards = 0
+        while True:
+            post_ids = list(
+                PostEntity.objects.filter(post_id__gt=last_id)
+                .order_by('post_id')
+                .values_list('post_id', flat=True)[:batch_size]
+            )
+            if not post_ids:
+                break
+            cards += len(refresh_project_cards(post_ids))
+            posts += len(post_ids)
+            last_id = post_ids[-1]
+            self.stdout.write(f'已处理 {posts} 个 post，{cards} 张卡片')
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'重建完成：{posts} 个 post，{cards} 张卡片，用时 {elapsed:.1f} 秒'
+        ))
@@ -0,0 +1,65 @@
+"""
+重建发布信息搜索索引
+按 post_id 顺序分批重建 Post_search_term，最后全量重算 BM25 统计
+（post 被删除时索引行随级联删除，但统计不会减少，可定期执行 --stats-only 校正）
+
+用法:
+    python manage.py rebuild_search_index
+    python manage.py rebuild_search_index --batch-size 1000
+    python manage.py rebuild_search_index --post-id 12 --post-id 13
+    python manage.py rebuild_search_index --stats-only
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.models import PostEntity, PostSearchTerm
+from api.utils.search_index import index_posts, rebuild_search_stats
+
+
+class Command(BaseCommand):
+    help = '重建发布信息搜索索引'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='每批重建的 post 数')
+        parser.add_argument('--post-id', type=int, action='append', dest='post_ids', help='只重建指定 post（可重复）')
+        parser.add_argument('--stats-only', action='store_true', help='只重算文档频率和字段长度统计')
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        started = time.monotonic()
+
+        if options['stats_only']:
+            rebuild_search_stats()
+            self.stdout.write(self.style.SUCCESS('BM25 统计已重算'))
+            return
+
+        if options['post_ids']:
+            rows = index_posts(options['post_ids'])
+            self.stdout.write(self.style.SUCCESS(f'已重建 {len(options["post_ids"])} 个 post，共 {rows} 条索引'))
+            return
+
+        # 清理已不存在的 post 遗留的索引（正常情况下由级联删除处理）
+        PostSearchTerm.objects.exclude(post_id__in=PostEntity.objects.values('post_id')).delete()
+
+        last_id = 0
+        posts = 0
+        rows = 0
+        while True:
+            post_ids = list(
+                PostEntity.objects.filter(post_id__gt=last_id)
+                .order_by('post_id')
+                .values_list('post_id', flat=True)[:batch_size]
+            )
+            if not post_ids:
+                break
+            rows += index_posts(post_ids)
+            posts += len(post_ids)
+            last_id = post_ids[-1]
+            self.stdout.write(f'已处理 {posts} 个 post，{rows} 条索引')
+
+        rebuild_search_stats()
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'重建完成：{posts} 个 post，{rows} 条索引，用时 {elapsed:.1f} 秒'
+        ))
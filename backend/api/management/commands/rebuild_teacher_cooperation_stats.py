@@ -0,0 +1,58 @@
+"""
+重建教师合作统计
+从 Teacher_student_cooperation 全量聚合，覆盖 Teacher_cooperation_stats
+
+用法:
+    python manage.py rebuild_teacher_cooperation_stats
+    python manage.py rebuild_teacher_cooperation_stats --dry-run
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from api.models import TeacherStudentCooperation, TeacherCooperationStats
+
+
+class Command(BaseCommand):
+    help = '根据合作记录重建教师合作统计'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='只报告差异，不写库')
+
+    def handle(self, *args, **options):
+        rows = TeacherStudentCooperation.objects.values('teacher_id').annotate(
+            total=Count('cooperation_id'),
+            pending=Count('cooperation_id', filter=Q(status=2)),
+            confirmed=Count('cooperation_id', filter=Q(status=3)),
+            rejected=Count('cooperation_id', filter=Q(status=4)),
+            canceled=Count('cooperation_id', filter=Q(status=5)),
+        ).order_by()
+        expected = {row.pop('teacher_id'): row for row in rows}
+
+        current = {
+            stats.teacher_id: {field: getattr(stats, field) for field in ('total', 'pending', 'confirmed', 'rejected', 'canceled')}
+            for stats in TeacherCooperationStats.objects.all()
+        }
+        drifted = [
+            teacher_id for teacher_id in set(expected) | set(current)
+            if expected.get(teacher_id, {}) != current.get(teacher_id, {})
+        ]
+        for teacher_id in sorted(drifted):
+            self.stdout.write(f'教师 {teacher_id}: {current.get(teacher_id)} -> {expected.get(teacher_id)}')
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'dry-run：{len(drifted)} 位教师的统计存在差异'))
+            return
+
+        now = timezone.now()
+        with transaction.atomic():
+            TeacherCooperationStats.objects.all().delete()
+            TeacherCooperationStats.objects.bulk_create(
+                [TeacherCooperationStats(teacher_id=teacher_id, updated_at=now, **counts) for teacher_id, counts in expected.items()],
+                batch_size=1000
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'重建完成：{len(expected)} 位教师，修正 {len(drifted)} 位'
+        ))
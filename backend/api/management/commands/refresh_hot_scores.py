@@ -0,0 +1,54 @@
+"""
+增量刷新热度分
+只处理点赞/收藏/评论后被标记为待重算（hot_dirty）的发布，按主键分批，适合由 cron 定期执行
+
+用法:
+    python manage.py refresh_hot_scores
+    python manage.py refresh_hot_scores --batch-size 2000 --sleep 0.1
+    python manage.py refresh_hot_scores --all          # 修改权重或衰减尺度后全量重算
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.models import PostEntity
+from api.utils.hot_score import refresh_hot_scores
+from api.utils.list_cache import invalidate_project_list
+
+
+class Command(BaseCommand):
+    help = '增量重算发布的热度分'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='每批处理的发布数')
+        parser.add_argument('--sleep', type=float, default=0.0, help='每批之间的休眠秒数')
+        parser.add_argument('--all', action='store_true', help='重算全部发布，而不只是待重算的')
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        pause = max(0.0, options['sleep'])
+
+        queryset = PostEntity.objects.all() if options['all'] else PostEntity.objects.filter(hot_dirty=True)
+        processed = 0
+        updated = 0
+        last_id = 0
+        while True:
+            # 走 (hot_dirty, post_id) 索引按主键键集取一批
+            post_ids = list(
+                queryset.filter(post_id__gt=last_id)
+                .order_by('post_id')
+                .values_list('post_id', flat=True)[:batch_size]
+            )
+            if not post_ids:
+                break
+            last_id = post_ids[-1]
+            updated += refresh_hot_scores(post_ids)
+            processed += len(post_ids)
+            self.stdout.write(f'已处理 {processed}，分数变化 {updated}')
+            if pause:
+                time.sleep(pause)
+
+        if updated:
+            # 热度排序结果已变，列表缓存全部失效
+            invalidate_project_list()
+        self.stdout.write(self.style.SUCCESS(f'刷新完成：处理 {processed}，分数变化 {updated}'))
@@ -0,0 +1,209 @@
+"""
+批量重算个人技能评分
+词权重表或 ALPHA_WEIGHT/BETA_WEIGHT 调整后，按 post_id 分块流式读取 Skill_information 及其技能，
+在进程池中并行打分，bulk_update 回写（同步列表卡片），支持断点续跑
+
+用法:
+    python manage.py rescore_skill_posts
+    python manage.py rescore_skill_posts --chunk-size 2000 --workers 8 --threshold 2
+    python manage.py rescore_skill_posts --checkpoint /tmp/rescore.json          # 中断后原命令再次执行即可续跑
+    python manage.py rescore_skill_posts --checkpoint /tmp/rescore.json --restart
+    python manage.py rescore_skill_posts --dry-run
+"""
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from api.models import SkillInformation, StudentSkill, ProjectCard
+from api.utils.list_cache import invalidate_project_list
+from api.utils.project_card import update_cards
+from api.utils.word_weights import word_weight_store
+
+SCORE_FIELDS = ['skill_score', 'keyword_score', 'proficiency_score', 'score_version']
+
+
+def _init_worker():
+    """子进程初始化（spawn 启动方式下需要重新加载 Django）"""
+    django.setup()
+
+
+def _score_chunk(rows):
+    """在子进程中为一块记录打分
+
+    Args:
+        rows: [(post_id, project_experience, [proficiency, ...]), ...]
+    返回:
+        [(post_id, total_score, keyword_score, proficiency_score, version), ...]
+    """
+    from api.views.project import calculate_skill_score
+
+    results = []
+    for post_id, project_experience, proficiencies in rows:
+        payload = calculate_skill_score(
+            project_experience,
+            [{'proficiency': proficiency} for proficiency in proficiencies]
+        )
+        results.append((
+            post_id,
+            payload['total_score'],
+            payload['keyword_score'],
+            payload['proficiency_score'],
+            payload['word_weight_version'] or '',
+        ))
+    return results
+
+
+def load_checkpoint(path):
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise CommandError(f'断点文件无法读取: {e}')
+
+
+def save_checkpoint(path, state):
+    """先写临时文件再替换，避免中断时留下半个文件"""
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+class Command(BaseCommand):
+    help = '并行重算全部个人技能发布的技能评分'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000, help='每块处理的记录数')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='打分进程数')
+        parser.add_argument('--threshold', type=float, default=1.0, help='总分变化超过该值时输出明细')
+        parser.add_argument('--max-report', type=int, default=50, help='最多输出的变化明细条数')
+        parser.add_argument('--checkpoint', help='断点文件路径，存在时从上次位置继续')
+        parser.add_argument('--restart', action='store_true', help='忽略已有断点，从头开始')
+        parser.add_argument('--dry-run', action='store_true', help='只统计变化，不写库')
+
+    def handle(self, *args, **options):
+        chunk_size = max(1, options['chunk_size'])
+        workers = max(1, options['workers'])
+        self.threshold = options['threshold']
+        self.max_report = options['max_report']
+        self.dry_run = options['dry_run']
+        checkpoint_path = options['checkpoint']
+
+        version = word_weight_store.current().version
+        state = None if options['restart'] else load_checkpoint(checkpoint_path)
+        if state:
+            if state.get('version') != version:
+                self.stderr.write(
+                    f'词表版本已由 {state.get("version")} 变为 {version}，'
+                    f'断点之前的记录不会按新版本重算（如需全部重算请加 --restart）'
+                )
+            self.stdout.write(f'从断点继续：post_id > {state["last_post_id"]}')
+        else:
+            state = {'last_post_id': 0, 'processed': 0, 'updated': 0, 'reported': 0}
+        state['version'] = version
+        self.state = state
+        self.written = 0  # 本次运行实际回写的条数
+
+        started = time.monotonic()
+        processed_at_start = state['processed']
+        in_flight = deque()  # (last_post_id, 原分数, future)，按提交顺序回写
+        last_id = state['last_post_id']
+        exhausted = False
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            while in_flight or not exhausted:
+                # 保持每个进程最多两块在途，主进程读库与子进程打分重叠
+                while not exhausted and len(in_flight) < workers * 2:
+                    rows, old_scores = self.fetch_chunk(last_id, chunk_size)
+                    if not rows:
+                        exhausted = True
+                        break
+                    last_id = rows[-1][0]
+                    in_flight.append((last_id, old_scores, pool.submit(_score_chunk, rows)))
+                if not in_flight:
+                    break
+
+                chunk_last_id, old_scores, future = in_flight.popleft()
+                self.write_chunk(future.result(), old_scores)
+                state['last_post_id'] = chunk_last_id
+                if checkpoint_path and not self.dry_run:
+                    save_checkpoint(checkpoint_path, state)
+
+                elapsed = time.monotonic() - started
+                done = state['processed'] - processed_at_start
+                self.stdout.write(
+                    f'已处理 {state["processed"]}，更新 {state["updated"]}，'
+                    f'当前 post_id {chunk_last_id}（{done / elapsed if elapsed else 0:.1f} 条/秒）'
+                )
+
+        if self.written:
+            # skill_score 排序和卡片内容已变，列表缓存全部失效
+            invalidate_project_list()
+        self.stdout.write(self.style.SUCCESS(
+            f'{"统计" if self.dry_run else "重算"}完成：处理 {state["processed"]}，'
+            f'分数变化 {state["updated"]}，变化超过 {self.threshold} 的 {state["reported"]}，'
+            f'词表版本 {version}'
+        ))
+
+    def fetch_chunk(self, last_id, chunk_size):
+        """按 post_id 键集读取一块记录及其技能熟练度（两次查询）"""
+        skills = list(
+            SkillInformation.objects.filter(post_id__gt=last_id)
+            .order_by('post_id')
+            .values_list('post_id', 'project_experience', *SCORE_FIELDS)[:chunk_size]
+        )
+        if not skills:
+            return [], {}
+        proficiencies = {}
+        for post_id, proficiency in StudentSkill.objects.filter(
+            post_id__in=[row[0] for row in skills]
+        ).values_list('post_id', 'proficiency'):
+            proficiencies.setdefault(post_id, []).append(proficiency)
+
+        rows = [(row[0], row[1], proficiencies.get(row[0], [])) for row in skills]
+        old_scores = {row[0]: tuple(row[2:]) for row in skills}
+        return rows, old_scores
+
+    def write_chunk(self, results, old_scores):
+        """回写有变化的记录，并输出变化超过阈值的明细"""
+        changed = []
+        for post_id, total, keyword, proficiency, version in results:
+            old = old_scores[post_id]
+            new = (total, keyword, proficiency, version)
+            if old == new:
+                continue
+            changed.append(SkillInformation(
+                post_id=post_id,
+                skill_score=total,
+                keyword_score=keyword,
+                proficiency_score=proficiency,
+                score_version=version
+            ))
+            if abs(total - old[0]) > self.threshold:
+                self.state['reported'] += 1
+                if self.state['reported'] <= self.max_report:
+                    self.stdout.write(f'  post {post_id}: {old[0]} -> {total}')
+
+        self.state['processed'] += len(results)
+        self.state['updated'] += len(changed)
+        if not changed or self.dry_run:
+            return
+
+        with transaction.atomic():
+            SkillInformation.objects.bulk_update(changed, SCORE_FIELDS, batch_size=500)
+            ProjectCard.objects.bulk_update(
+                [ProjectCard(post_id=row.post_id, skill_score=row.skill_score) for row in changed],
+                ['skill_score'],
+                batch_size=500
+            )
+            # 卡片内容已变，递增版本号使片段缓存失效
+            update_cards([row.post_id for row in changed])
+        self.written += len(changed)
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 14:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_merge_20260104_1203'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='token_version',
+            field=models.PositiveIntegerField(default=0, help_text='递增后吊销已签发的签名令牌', verbose_name='令牌版本'),
+        ),
+    ]
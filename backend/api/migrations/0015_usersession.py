@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-17 14:54
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_user_token_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='token',
+            field=models.CharField(blank=True, db_index=True, help_text='旧版单会话令牌，新登录使用 UserSession', max_length=64, null=True, verbose_name='认证令牌'),
+        ),
+        migrations.CreateModel(
+            name='UserSession',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False, verbose_name='会话ID')),
+                ('token_hash', models.CharField(max_length=64, unique=True, verbose_name='令牌摘要')),
+                ('device', models.CharField(blank=True, default='', max_length=255, verbose_name='设备信息')),
+                ('created_at', models.DateTimeField(verbose_name='创建时间')),
+                ('expires_at', models.DateTimeField(db_index=True, verbose_name='过期时间')),
+                ('last_seen', models.DateTimeField(verbose_name='最近活跃时间')),
+                ('user', models.ForeignKey(db_column='user_id', on_delete=django.db.models.deletion.CASCADE, related_name='sessions', to='api.user', verbose_name='用户ID')),
+            ],
+            options={
+                'verbose_name': '登录会话',
+                'verbose_name_plural': '登录会话',
+                'db_table': 'User_session',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.7 on 2026-10-17 14:54
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+import django.db.models.deletion
+import django.utils.timezone
+
+
+def backfill_teacher_cooperation_stats(apps, schema_editor):
+    """根据已有合作记录初始化统计表"""
+    Cooperation = apps.get_model('api', 'TeacherStudentCooperation')
+    Stats = apps.get_model('api', 'TeacherCooperationStats')
+    rows = Cooperation.objects.values('teacher_id').annotate(
+        total=Count('cooperation_id'),
+        pending=Count('cooperation_id', filter=Q(status=2)),
+        confirmed=Count('cooperation_id', filter=Q(status=3)),
+        rejected=Count('cooperation_id', filter=Q(status=4)),
+        canceled=Count('cooperation_id', filter=Q(status=5)),
+    ).order_by()
+    now = django.utils.timezone.now()
+    Stats.objects.bulk_create([Stats(updated_at=now, **row) for row in rows], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_usersession'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TeacherCooperationStats',
+            fields=[
+                ('teacher', models.OneToOneField(db_column='teacher_id', on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='api.teacherentity', verbose_name='教师ID')),
+                ('total', models.IntegerField(default=0, verbose_name='合作总数')),
+                ('pending', models.IntegerField(default=0, verbose_name='待确认数')),
+                ('confirmed', models.IntegerField(default=0, verbose_name='已确认数')),
+                ('rejected', models.IntegerField(default=0, verbose_name='已拒绝数')),
+                ('canceled', models.IntegerField(default=0, verbose_name='已取消数')),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='更新时间')),
+            ],
+            options={
+                'verbose_name': '教师合作统计',
+                'verbose_name_plural': '教师合作统计',
+                'db_table': 'Teacher_cooperation_stats',
+                'ordering': ['teacher'],
+            },
+        ),
+        migrations.RunPython(backfill_teacher_cooperation_stats, migrations.RunPython.noop),
+    ]
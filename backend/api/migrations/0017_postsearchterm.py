@@ -0,0 +1,111 @@
+# Generated by Django 4.2.7 on 2026-10-17 14:57
+
+import re
+import unicodedata
+from collections import Counter, defaultdict
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# 切分规则在此冻结一份，迁移不依赖 search_index 的后续改动
+FIELD_TITLE, FIELD_DIRECTION, FIELD_STACK, FIELD_TAG, FIELD_TEXT = 1, 2, 3, 4, 5
+RUN_RE = re.compile(r'[^\W_]+')
+BATCH_SIZE = 500  # 每批处理的 post 数
+
+
+def tokenize(text):
+    """归一化（NFKC + 大小写折叠 + 去重音）后按连续片段切分为字符二元组"""
+    if not text:
+        return []
+    text = unicodedata.normalize('NFKD', unicodedata.normalize('NFKC', text).casefold())
+    text = unicodedata.normalize('NFC', ''.join(ch for ch in text if not unicodedata.combining(ch)))
+    terms = []
+    for run in RUN_RE.findall(text):
+        terms.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return terms
+
+
+def collect_post_fields(apps, post_ids):
+    """批量读取一批 post 的可搜索文本：{post_id: {field: [text, ...]}}"""
+    fields = defaultdict(lambda: defaultdict(list))
+    for post_id, name, outcome in apps.get_model('api', 'ResearchProject').objects.filter(
+        post_id__in=post_ids
+    ).values_list('post_id', 'research_name', 'outcome'):
+        fields[post_id][FIELD_TITLE].append(name)
+        fields[post_id][FIELD_TEXT].append(outcome)
+    for post_id, name, team_require, reward in apps.get_model('api', 'CompetitionProject').objects.filter(
+        post_id__in=post_ids
+    ).values_list('post_id', 'competition_name', 'team_require', 'reward'):
+        fields[post_id][FIELD_TITLE].append(name)
+        fields[post_id][FIELD_TEXT].extend([team_require, reward])
+    for post_id, project_experience in apps.get_model('api', 'SkillInformation').objects.filter(
+        post_id__in=post_ids
+    ).values_list('post_id', 'project_experience'):
+        fields[post_id][FIELD_TEXT].append(project_experience)
+    for model, field, lookup in (
+        ('PostDirection', FIELD_DIRECTION, 'direction__direction_name'),
+        ('PostStack', FIELD_STACK, 'stack__tech_stack'),
+        ('PostTag', FIELD_TAG, 'tag__name'),
+    ):
+        for post_id, name in apps.get_model('api', model).objects.filter(
+            post_id__in=post_ids
+        ).values_list('post_id', lookup):
+            fields[post_id][field].append(name)
+    return fields
+
+
+def backfill_search_terms(apps, schema_editor):
+    """为已有发布信息建立倒排索引（按 post_id 分批 bulk_create）"""
+    PostEntity = apps.get_model('api', 'PostEntity')
+    PostSearchTerm = apps.get_model('api', 'PostSearchTerm')
+
+    def flush(post_ids):
+        rows = []
+        for post_id, field_texts in collect_post_fields(apps, post_ids).items():
+            for field, texts in field_texts.items():
+                counts = Counter()
+                for text in texts:
+                    counts.update(tokenize(text))
+                rows.extend(
+                    PostSearchTerm(post_id=post_id, field=field, term=term, tf=tf)
+                    for term, tf in counts.items()
+                )
+        PostSearchTerm.objects.bulk_create(rows, batch_size=1000)
+
+    batch = []
+    for post_id in PostEntity.objects.order_by('post_id').values_list('post_id', flat=True).iterator():
+        batch.append(post_id)
+        if len(batch) >= BATCH_SIZE:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_teachercooperationstats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False, verbose_name='索引ID')),
+                ('term', models.CharField(max_length=8, verbose_name='词项')),
+                ('field', models.SmallIntegerField(choices=[(1, '标题'), (2, '方向'), (3, '技术栈'), (4, '标签'), (5, '正文')], verbose_name='字段')),
+                ('tf', models.IntegerField(default=1, verbose_name='词频')),
+                ('post', models.ForeignKey(db_column='post_id', on_delete=django.db.models.deletion.CASCADE, to='api.postentity', verbose_name='发布信息ID')),
+            ],
+            options={
+                'verbose_name': '搜索索引',
+                'verbose_name_plural': '搜索索引',
+                'db_table': 'Post_search_term',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['term', 'post'], name='post_search_term_idx')],
+                'unique_together': {('post', 'field', 'term')},
+            },
+        ),
+        migrations.RunPython(backfill_search_terms, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,101 @@
+# Generated by Django 4.2.7 on 2026-10-17 14:57
+
+from collections import Counter, defaultdict
+
+from django.db import migrations, models
+
+FIELD_ALL = 0      # SearchFieldStat 中记录总文档数的行
+BATCH_SIZE = 500   # 每批处理的 post 数
+
+
+def backfill_search_stats(apps, schema_editor):
+    """根据已有索引回填字段长度（该 post 该字段的词频之和）以及文档频率、字段统计"""
+    PostSearchTerm = apps.get_model('api', 'PostSearchTerm')
+    SearchTermStat = apps.get_model('api', 'SearchTermStat')
+    SearchFieldStat = apps.get_model('api', 'SearchFieldStat')
+
+    term_df = Counter()
+    field_totals = defaultdict(lambda: [0, 0])  # field -> [doc_count, total_length]
+    doc_count = 0
+
+    def flush(post_ids):
+        rows = list(PostSearchTerm.objects.filter(post_id__in=post_ids).only('id', 'post_id', 'field', 'term', 'tf'))
+        lengths = Counter()
+        post_terms = defaultdict(set)
+        for row in rows:
+            lengths[(row.post_id, row.field)] += row.tf
+            post_terms[row.post_id].add(row.term)
+        for row in rows:
+            row.field_len = lengths[(row.post_id, row.field)]
+        PostSearchTerm.objects.bulk_update(rows, ['field_len'], batch_size=1000)
+        for (post_id, field), length in lengths.items():
+            field_totals[field][0] += 1
+            field_totals[field][1] += length
+        for terms in post_terms.values():
+            term_df.update(terms)
+        return len(post_terms)
+
+    batch = []
+    for post_id in (
+        PostSearchTerm.objects.order_by('post_id').values_list('post_id', flat=True).distinct().iterator()
+    ):
+        batch.append(post_id)
+        if len(batch) >= BATCH_SIZE:
+            doc_count += flush(batch)
+            batch = []
+    if batch:
+        doc_count += flush(batch)
+
+    SearchTermStat.objects.bulk_create(
+        [SearchTermStat(term=term, df=df) for term, df in term_df.items()], batch_size=1000
+    )
+    SearchFieldStat.objects.bulk_create(
+        [SearchFieldStat(field=FIELD_ALL, doc_count=doc_count)] +
+        [
+            SearchFieldStat(field=field, doc_count=count, total_length=length)
+            for field, (count, length) in field_totals.items()
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_postsearchterm'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchFieldStat',
+            fields=[
+                ('field', models.SmallIntegerField(primary_key=True, serialize=False, verbose_name='字段')),
+                ('doc_count', models.IntegerField(default=0, verbose_name='文档数')),
+                ('total_length', models.BigIntegerField(default=0, verbose_name='总长度')),
+            ],
+            options={
+                'verbose_name': '字段统计',
+                'verbose_name_plural': '字段统计',
+                'db_table': 'Search_field_stat',
+                'ordering': ['field'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchTermStat',
+            fields=[
+                ('term', models.CharField(max_length=8, primary_key=True, serialize=False, verbose_name='词项')),
+                ('df', models.IntegerField(default=0, verbose_name='文档频率')),
+            ],
+            options={
+                'verbose_name': '词项统计',
+                'verbose_name_plural': '词项统计',
+                'db_table': 'Search_term_stat',
+                'ordering': ['term'],
+            },
+        ),
+        migrations.AddField(
+            model_name='postsearchterm',
+            name='field_len',
+            field=models.IntegerField(default=0, help_text='该 post 该字段的词项总数（BM25 文档长度）', verbose_name='字段长度'),
+        ),
+        migrations.RunPython(backfill_search_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0018_search_stats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='postentity',
+            index=models.Index(fields=['create_time', 'post_id'], name='post_create_time_idx'),
+        ),
+    ]
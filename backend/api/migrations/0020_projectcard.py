@@ -0,0 +1,41 @@
+# Generated by Django 4.2.7 on 2026-10-17 15:01
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0019_post_create_time_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectCard',
+            fields=[
+                ('post', models.OneToOneField(db_column='post_id', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='card', serialize=False, to='api.postentity', verbose_name='发布信息ID')),
+                ('post_type', models.SmallIntegerField(verbose_name='发布类型')),
+                ('create_time', models.DateTimeField(verbose_name='发布时间')),
+                ('visibility', models.SmallIntegerField(default=0, verbose_name='可见权限')),
+                ('recruit_status', models.SmallIntegerField(default=0, verbose_name='招募状态')),
+                ('like_num', models.IntegerField(default=0, verbose_name='点赞数')),
+                ('favorite_num', models.IntegerField(default=0, verbose_name='收藏数')),
+                ('comment_num', models.IntegerField(default=0, verbose_name='评论数')),
+                ('title', models.CharField(max_length=255, verbose_name='标题')),
+                ('publisher_name', models.CharField(max_length=255, verbose_name='发布人姓名')),
+                ('tech_stack', models.CharField(blank=True, default='', max_length=255, verbose_name='技术栈')),
+                ('majors', models.JSONField(default=list, verbose_name='专业方向列表')),
+                ('skills', models.JSONField(default=list, verbose_name='技能列表')),
+                ('attachments', models.JSONField(default=list, verbose_name='附件摘要')),
+                ('skill_score', models.FloatField(blank=True, help_text='仅个人技能', null=True, verbose_name='技能评分')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='更新时间')),
+            ],
+            options={
+                'verbose_name': '项目卡片',
+                'verbose_name_plural': '项目卡片',
+                'db_table': 'Project_card',
+                'indexes': [models.Index(fields=['visibility', 'create_time', 'post'], name='project_card_visibility_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,99 @@
+# Generated by Django 4.2.7 on 2026-10-17 15:02
+
+import json
+import os
+import re
+
+from django.db import migrations, models
+
+# 评分逻辑在此冻结一份，迁移不依赖视图代码的后续改动
+WORD_WEIGHT_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'word_weight.txt')
+PROFICIENCY_WEIGHT_MAP = {0: 2, 1: 1}  # 0=skillful -> 熟练(2); 1=known -> 了解(1)
+ALPHA_WEIGHT = 0.6  # 关键词得分占比
+BETA_WEIGHT = 0.4   # 技术熟练度占比
+BATCH_SIZE = 1000
+
+
+def load_word_weights():
+    """读取关键词权重配置，读取失败时返回空列表"""
+    try:
+        with open(WORD_WEIGHT_FILE, 'r', encoding='utf-8') as f:
+            content = f.read()
+        return json.loads(re.sub(r'/\*.*?\*/', '', content, flags=re.S))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+
+def calculate_keyword_score(project_experience, word_weights):
+    """根据项目经历文本匹配关键词得分（同一组命中一次即可）"""
+    if not project_experience:
+        return 0.0
+    text_lower = project_experience.lower()
+    score = 0.0
+    for item in word_weights:
+        keywords = [kw for kw in [item.get('name', '')] + (item.get('aliases') or []) if kw]
+        for keyword in keywords:
+            if keyword.lower() in text_lower:
+                score += float(item.get('base_weight', 0))
+                break
+    return score
+
+
+def backfill_skill_scores(apps, schema_editor):
+    """为已有个人技能发布计算评分，并同步到列表卡片（分批 bulk_update）"""
+    SkillInformation = apps.get_model('api', 'SkillInformation')
+    StudentSkill = apps.get_model('api', 'StudentSkill')
+    ProjectCard = apps.get_model('api', 'ProjectCard')
+
+    word_weights = load_word_weights()
+    proficiency_scores = {}
+    for post_id, proficiency in StudentSkill.objects.values_list('post_id', 'proficiency'):
+        proficiency_scores[post_id] = proficiency_scores.get(post_id, 0) + PROFICIENCY_WEIGHT_MAP.get(proficiency, 0)
+
+    def flush(skills):
+        SkillInformation.objects.bulk_update(skills, ['skill_score', 'keyword_score', 'proficiency_score'])
+        scores = {skill.post_id: skill.skill_score for skill in skills}
+        cards = list(ProjectCard.objects.filter(post_id__in=list(scores)).only('post_id', 'skill_score'))
+        for card in cards:
+            card.skill_score = scores[card.post_id]
+        ProjectCard.objects.bulk_update(cards, ['skill_score'])
+
+    batch = []
+    for skill in SkillInformation.objects.only('post_id', 'project_experience').order_by('post_id').iterator():
+        keyword_score = calculate_keyword_score(skill.project_experience, word_weights)
+        proficiency_score = proficiency_scores.get(skill.post_id, 0)
+        skill.keyword_score = round(keyword_score, 2)
+        skill.proficiency_score = round(proficiency_score, 2)
+        skill.skill_score = round(keyword_score * ALPHA_WEIGHT + proficiency_score * BETA_WEIGHT, 2)
+        batch.append(skill)
+        if len(batch) >= BATCH_SIZE:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0020_projectcard'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='skillinformation',
+            name='keyword_score',
+            field=models.FloatField(default=0, verbose_name='关键词得分'),
+        ),
+        migrations.AddField(
+            model_name='skillinformation',
+            name='proficiency_score',
+            field=models.FloatField(default=0, verbose_name='熟练度得分'),
+        ),
+        migrations.AddField(
+            model_name='skillinformation',
+            name='skill_score',
+            field=models.FloatField(db_index=True, default=0, verbose_name='技能评分'),
+        ),
+        migrations.RunPython(backfill_skill_scores, migrations.RunPython.noop),
+    ]
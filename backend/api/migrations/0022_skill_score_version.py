@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 15:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0021_skill_score'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='skillinformation',
+            name='score_version',
+            field=models.CharField(blank=True, default='', max_length=16, verbose_name='评分所用词表版本'),
+        ),
+    ]
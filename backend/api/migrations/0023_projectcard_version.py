@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 15:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0022_skill_score_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projectcard',
+            name='version',
+            field=models.PositiveIntegerField(default=1, help_text='卡片每次写入递增，用于片段缓存失效', verbose_name='版本号'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.7 on 2026-10-17 15:09
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+
+def backfill_post_author(apps, schema_editor):
+    """根据科研/竞赛/个人技能记录回填发布人"""
+    PostEntity = apps.get_model('api', 'PostEntity')
+    sources = [
+        (1, apps.get_model('api', 'ResearchProject'), 'teacher__user_id'),
+        (2, apps.get_model('api', 'CompetitionProject'), 'teacher__user_id'),
+        (3, apps.get_model('api', 'SkillInformation'), 'student__user_id'),
+    ]
+    for post_type, model, user_field in sources:
+        PostEntity.objects.filter(post_type=post_type, author__isnull=True).update(
+            author_id=Subquery(
+                model.objects.filter(post_id=OuterRef('post_id')).values(user_field)[:1]
+            )
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0023_projectcard_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='postentity',
+            name='author',
+            field=models.ForeignKey(blank=True, db_column='author_user_id', db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='authored_posts', to='api.user', verbose_name='发布人用户ID'),
+        ),
+        migrations.AddIndex(
+            model_name='postentity',
+            index=models.Index(fields=['author', 'create_time', 'post_id'], name='post_author_time_idx'),
+        ),
+        migrations.RunPython(backfill_post_author, migrations.RunPython.noop),
+    ]
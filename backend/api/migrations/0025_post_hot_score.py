@@ -0,0 +1,71 @@
+# Generated by Django 4.2.7 on 2026-10-17 15:14
+
+import math
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import migrations, models
+
+# 热度公式在此冻结一份，迁移不依赖 api.utils.hot_score 的后续改动
+HOT_SCORE_EPOCH = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+BATCH_SIZE = 1000
+
+
+def compute_hot_score(like_num, favorite_num, comment_num, create_time):
+    """hot = log10(max(1, 1*点赞 + 2*收藏 + 3*评论)) + (create_time - 纪元) / HOT_SCORE_DECAY_SECONDS"""
+    engagement = like_num + 2 * favorite_num + 3 * comment_num
+    decay_seconds = getattr(settings, 'HOT_SCORE_DECAY_SECONDS', 3 * 24 * 3600)
+    if create_time.tzinfo is None:
+        create_time = create_time.replace(tzinfo=dt_timezone.utc)
+    age_bonus = (create_time - HOT_SCORE_EPOCH).total_seconds() / decay_seconds
+    return round(math.log10(max(1, engagement)) + age_bonus, 6)
+
+
+def backfill_hot_score(apps, schema_editor):
+    """按当前互动数计算已有发布的热度分（分批 bulk_update）"""
+    PostEntity = apps.get_model('api', 'PostEntity')
+
+    def flush(posts):
+        PostEntity.objects.bulk_update(posts, ['hot_score', 'hot_dirty'])
+
+    batch = []
+    for post in PostEntity.objects.only(
+        'post_id', 'like_num', 'favorite_num', 'comment_num', 'create_time'
+    ).order_by('post_id').iterator():
+        post.hot_score = compute_hot_score(post.like_num, post.favorite_num, post.comment_num, post.create_time)
+        post.hot_dirty = False
+        batch.append(post)
+        if len(batch) >= BATCH_SIZE:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0024_post_author'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='postentity',
+            name='hot_dirty',
+            field=models.BooleanField(default=True, verbose_name='热度待重算'),
+        ),
+        migrations.AddField(
+            model_name='postentity',
+            name='hot_score',
+            field=models.FloatField(default=0, verbose_name='热度分'),
+        ),
+        migrations.AddIndex(
+            model_name='postentity',
+            index=models.Index(fields=['hot_score', 'post_id'], name='post_hot_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='postentity',
+            index=models.Index(fields=['hot_dirty', 'post_id'], name='post_hot_dirty_idx'),
+        ),
+        migrations.RunPython(backfill_hot_score, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-17 15:16
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0025_post_hot_score'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostTerm',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False, verbose_name='词项ID')),
+                ('term', models.CharField(help_text='t:技能/技术栈名称, d:方向ID, g:标签ID', max_length=255, verbose_name='词项')),
+                ('weight', models.FloatField(verbose_name='归一化权重')),
+                ('post', models.ForeignKey(db_column='post_id', on_delete=django.db.models.deletion.CASCADE, to='api.postentity', verbose_name='发布信息ID')),
+            ],
+            options={
+                'verbose_name': '发布词项',
+                'verbose_name_plural': '发布词项',
+                'db_table': 'Post_term',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['term', 'post'], name='post_term_idx')],
+                'unique_together': {('post', 'term')},
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-17 15:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0026_post_term'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='skillinformation',
+            name='hours_parsed',
+            field=models.BooleanField(blank=True, help_text='None-尚未解析（旧数据，执行 backfill_hours_per_week 回填）, True-解析成功, False-无法解析', null=True, verbose_name='可投入时间解析结果'),
+        ),
+        migrations.AddField(
+            model_name='skillinformation',
+            name='hours_per_week',
+            field=models.FloatField(blank=True, db_index=True, help_text='无法解析时为空', null=True, verbose_name='每周可投入小时数'),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 4.2.7 on 2026-10-17 15:20
+
+import math
+
+from django.db import migrations, models
+
+# 工时规则在此冻结一份，迁移不依赖视图代码的后续改动
+SHORT_PROJECT_HOURS = 10  # ≤4周
+MID_PROJECT_HOURS = 8     # 5-12周
+LONG_PROJECT_HOURS = 6    # >12周
+BATCH_SIZE = 1000
+
+
+def calc_project_hours_per_week(start_time, end_time):
+    """根据项目起止时间计算 (周期周数, 每周标准工时)，无法计算时返回 (None, None)"""
+    if not start_time or not end_time:
+        return None, None
+    duration_days = (end_time - start_time).days
+    if duration_days <= 0:
+        return None, None
+    duration_weeks = math.ceil(duration_days / 7)
+    if duration_weeks <= 4:
+        return duration_weeks, SHORT_PROJECT_HOURS
+    if duration_weeks <= 12:
+        return duration_weeks, MID_PROJECT_HOURS
+    return duration_weeks, LONG_PROJECT_HOURS
+
+
+def backfill_research_hours(apps, schema_editor):
+    """根据起止时间计算已有科研项目的周期和每周标准工时（分批 bulk_update）"""
+    ResearchProject = apps.get_model('api', 'ResearchProject')
+
+    def flush(projects):
+        ResearchProject.objects.bulk_update(projects, ['duration_weeks', 'hours_per_week'])
+
+    batch = []
+    for project in ResearchProject.objects.only('post_id', 'starttime', 'endtime').order_by('post_id').iterator():
+        project.duration_weeks, project.hours_per_week = calc_project_hours_per_week(project.starttime, project.endtime)
+        batch.append(project)
+        if len(batch) >= BATCH_SIZE:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0027_skill_hours_per_week'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='researchproject',
+            name='duration_weeks',
+            field=models.IntegerField(blank=True, null=True, verbose_name='项目周期（周）'),
+        ),
+        migrations.AddField(
+            model_name='researchproject',
+            name='hours_per_week',
+            field=models.IntegerField(blank=True, null=True, verbose_name='每周标准工时'),
+        ),
+        migrations.AddIndex(
+            model_name='competitionproject',
+            index=models.Index(fields=['deadline', 'post'], name='competition_deadline_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='researchproject',
+            index=models.Index(fields=['starttime', 'endtime', 'post'], name='research_window_idx'),
+        ),
+        migrations.RunPython(backfill_research_hours, migrations.RunPython.noop),
+    ]
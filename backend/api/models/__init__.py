@@ -3,20 +3,25 @@ Django 模型包
 使用模型包结构组织所有数据模型
 """
 from .user import User, StudentEntity, TeacherEntity
+from .session import UserSession
 from .post import PostEntity
 from .tag import Tag, PostTag
 from .project import ResearchProject, CompetitionProject, SkillInformation
 from .interaction import Like, Favorite, Comment
 from .message import Conversation, Message
-from .cooperation import TeacherStudentCooperation
+from .cooperation import TeacherStudentCooperation, TeacherCooperationStats
 from .skill import Skill, StudentSkill
 from .direction import TechStack, Direction, PostStack, PostDirection
 from .attachment import PostAttachment
+from .search import PostSearchTerm, SearchTermStat, SearchFieldStat
+from .card import ProjectCard
+from .recommend import PostTerm
 
 __all__ = [
     'User',
     'StudentEntity',
     'TeacherEntity',
+    'UserSession',
     'PostEntity',
     'Tag',
     'PostTag',
@@ -29,6 +34,7 @@ __all__ = [
     'Conversation',
     'Message',
     'TeacherStudentCooperation',
+    'TeacherCooperationStats',
     'Skill',
     'StudentSkill',
     'TechStack',
@@ -36,5 +42,10 @@ __all__ = [
     'PostStack',
     'PostDirection',
     'PostAttachment',
+    'PostSearchTerm',
+    'SearchTermStat',
+    'SearchFieldStat',
+    'ProjectCard',
+    'PostTerm',
 ]
 
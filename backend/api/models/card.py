@@ -0,0 +1,113 @@
+"""
+列表读模型
+包括：ProjectCard
+"""
+from django.db import models
+from .post import PostEntity
+
+
+class ProjectCard(models.Model):
+    """项目卡片表（/project/list 的反范式读模型）
+
+    保存列表接口返回的全部字段，由发布/更新、互动计数、附件上传等写路径维护，
+    列表页只需按 post 主键读取，不再逐表拼装
+    """
+    POST_TYPE_NAMES = {1: 'research', 2: 'competition', 3: 'personal'}
+
+    # 列表条目字段 -> 卡片列（用于 fields= 稀疏字段选择时只读取需要的列）
+    LIST_ITEM_COLUMNS = {
+        'post_id': (),
+        'post_type': ('post_type',),
+        'title': ('title',),
+        'teacher_name': ('publisher_name',),
+        'like_num': ('like_num',),
+        'favorite_num': ('favorite_num',),
+        'comment_num': ('comment_num',),
+        'create_time': ('create_time',),
+        'tech_stack': ('tech_stack',),
+        'major': ('majors',),
+        'skills': ('skills',),
+        'attachments': ('attachments',),
+        'recruit_status': ('recruit_status',),
+        'skill_score': ('skill_score',),
+    }
+
+    post = models.OneToOneField(
+        PostEntity,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        db_column='post_id',
+        related_name='card',
+        verbose_name='发布信息ID'
+    )
+    post_type = models.SmallIntegerField(verbose_name='发布类型')
+    create_time = models.DateTimeField(verbose_name='发布时间')
+    visibility = models.SmallIntegerField(default=0, verbose_name='可见权限')
+    recruit_status = models.SmallIntegerField(default=0, verbose_name='招募状态')
+    like_num = models.IntegerField(default=0, verbose_name='点赞数')
+    favorite_num = models.IntegerField(default=0, verbose_name='收藏数')
+    comment_num = models.IntegerField(default=0, verbose_name='评论数')
+    title = models.CharField(max_length=255, verbose_name='标题')
+    publisher_name = models.CharField(max_length=255, verbose_name='发布人姓名')
+    tech_stack = models.CharField(max_length=255, blank=True, default='', verbose_name='技术栈')
+    majors = models.JSONField(default=list, verbose_name='专业方向列表')
+    skills = models.JSONField(default=list, verbose_name='技能列表')
+    attachments = models.JSONField(default=list, verbose_name='附件摘要')
+    skill_score = models.FloatField(null=True, blank=True, verbose_name='技能评分', help_text='仅个人技能')
+    version = models.PositiveIntegerField(default=1, verbose_name='版本号', help_text='卡片每次写入递增，用于片段缓存失效')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='更新时间')
+
+    class Meta:
+        db_table = 'Project_card'
+        verbose_name = '项目卡片'
+        verbose_name_plural = '项目卡片'
+        indexes = [
+            models.Index(fields=['visibility', 'create_time', 'post'], name='project_card_visibility_idx'),
+        ]
+
+    def __str__(self):
+        return f'Card {self.post_id} ({self.title})'
+
+    @classmethod
+    def columns_for(cls, fields):
+        """条目字段集合对应需要读取的卡片列（始终包含主键、类型和版本号）"""
+        columns = {'post_id', 'post_type', 'version'}
+        for field in fields:
+            columns.update(cls.LIST_ITEM_COLUMNS.get(field, ()))
+        return sorted(columns)
+
+    def to_list_item(self, fields=None):
+        """转换为列表接口的条目格式（与原逐表拼装的结构一致）
+
+        Args:
+            fields: 需要返回的字段集合，None 表示全部
+        """
+        def wanted(name):
+            return fields is None or name in fields
+
+        item = {'post_id': self.post_id}
+        if wanted('post_type'):
+            item['post_type'] = self.POST_TYPE_NAMES.get(self.post_type)
+        if wanted('title'):
+            item['title'] = self.title
+        if wanted('teacher_name'):
+            item['teacher_name'] = self.publisher_name  # 对于个人项目，这里实际是学生姓名
+        for name in ('like_num', 'favorite_num', 'comment_num'):
+            if wanted(name):
+                item[name] = getattr(self, name)
+        if wanted('create_time'):
+            item['create_time'] = self.create_time.isoformat() if self.create_time else None
+        if self.post_type == 1 and wanted('tech_stack'):
+            item['tech_stack'] = self.tech_stack
+        elif self.post_type == 3:
+            if wanted('major'):
+                item['major'] = self.majors
+            if wanted('skills'):
+                item['skills'] = self.skills
+        if wanted('attachments'):
+            item['attachments'] = self.attachments
+        if wanted('recruit_status'):
+            item['recruit_status'] = self.recruit_status
+        if self.post_type == 3 and wanted('skill_score'):
+            item['skill_score'] = self.skill_score
+        return item
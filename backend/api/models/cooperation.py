@@ -1,8 +1,10 @@
 """
 合作关系模型
-包括：TeacherStudentCooperation
+包括：TeacherStudentCooperation, TeacherCooperationStats
 """
 from django.db import models
+from django.db.models import F
+from django.utils import timezone
 from .user import TeacherEntity, StudentEntity
 from .post import PostEntity
 
@@ -53,3 +55,66 @@ class TeacherStudentCooperation(models.Model):
     def __str__(self):
         return f'Cooperation {self.cooperation_id}: Teacher {self.teacher.teacher_id} - Student {self.student.student_id}'
 
+
+class TeacherCooperationStats(models.Model):
+    """教师合作统计表（按状态计数，随合作状态流转增量维护）"""
+    STATUS_FIELDS = {
+        2: 'pending',
+        3: 'confirmed',
+        4: 'rejected',
+        5: 'canceled',
+    }
+    
+    teacher = models.OneToOneField(
+        TeacherEntity,
+        on_delete=models.CASCADE,
+        db_column='teacher_id',
+        primary_key=True,
+        verbose_name='教师ID'
+    )
+    total = models.IntegerField(default=0, verbose_name='合作总数')
+    pending = models.IntegerField(default=0, verbose_name='待确认数')
+    confirmed = models.IntegerField(default=0, verbose_name='已确认数')
+    rejected = models.IntegerField(default=0, verbose_name='已拒绝数')
+    canceled = models.IntegerField(default=0, verbose_name='已取消数')
+    updated_at = models.DateTimeField(default=timezone.now, verbose_name='更新时间')
+    
+    class Meta:
+        db_table = 'Teacher_cooperation_stats'
+        verbose_name = '教师合作统计'
+        verbose_name_plural = '教师合作统计'
+        ordering = ['teacher']
+    
+    @property
+    def success_rate(self):
+        """组队成功率（百分比）：已确认占全部合作的比例"""
+        if self.total <= 0:
+            return 0.0
+        return round(self.confirmed / self.total * 100, 2)
+    
+    @classmethod
+    def apply_delta(cls, teacher_id, deltas):
+        """按字段增量更新计数（需在合作记录变更的同一事务中调用）"""
+        cls.objects.get_or_create(teacher_id=teacher_id)
+        cls.objects.filter(teacher_id=teacher_id).update(
+            updated_at=timezone.now(),
+            **{field: F(field) + delta for field, delta in deltas.items()}
+        )
+    
+    @classmethod
+    def record_created(cls, teacher_id, status):
+        """新建合作记录"""
+        cls.apply_delta(teacher_id, {'total': 1, cls.STATUS_FIELDS[status]: 1})
+    
+    @classmethod
+    def record_transition(cls, teacher_id, old_status, new_status):
+        """合作状态流转"""
+        if old_status == new_status:
+            return
+        cls.apply_delta(teacher_id, {
+            cls.STATUS_FIELDS[old_status]: -1,
+            cls.STATUS_FIELDS[new_status]: 1,
+        })
+    
+    def __str__(self):
+        return f'Teacher {self.teacher_id} 合作统计 (总数: {self.total})'
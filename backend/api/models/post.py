@@ -3,6 +3,7 @@
 包括：PostEntity
 """
 from django.db import models
+from .user import User
 
 
 class PostEntity(models.Model):
@@ -40,11 +41,36 @@ class PostEntity(models.Model):
         verbose_name='招募状态',
         help_text='招募状态: 0-正在招募, 1-招募截止'
     )
+    # 发布人（科研/竞赛为教师的 User，个人技能为学生的 User），冗余保存以便按作者筛选
+    author = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_column='author_user_id',
+        db_index=False,  # 由下方 (author, create_time, post_id) 联合索引覆盖
+        related_name='authored_posts',
+        verbose_name='发布人用户ID'
+    )
+    # 热度分（见 api/utils/hot_score.py），互动数变化时置 hot_dirty，由 refresh_hot_scores 命令增量重算
+    hot_score = models.FloatField(default=0, verbose_name='热度分')
+    hot_dirty = models.BooleanField(default=True, verbose_name='热度待重算')
+
     class Meta:
         db_table = 'Post_entity'
         verbose_name = '发布实体'
         verbose_name_plural = '发布实体'
         ordering = ['-create_time']
+        indexes = [
+            # 列表按 (create_time, post_id) 游标分页
+            models.Index(fields=['create_time', 'post_id'], name='post_create_time_idx'),
+            # 按作者筛选并按时间分页
+            models.Index(fields=['author', 'create_time', 'post_id'], name='post_author_time_idx'),
+            # sort=hot 按 (hot_score, post_id) 倒序范围扫描
+            models.Index(fields=['hot_score', 'post_id'], name='post_hot_score_idx'),
+            # 增量任务按主键顺序取待重算的发布
+            models.Index(fields=['hot_dirty', 'post_id'], name='post_hot_dirty_idx'),
+        ]
     
     def __str__(self):
         return f'Post {self.post_id} ({self.get_post_type_display()})'
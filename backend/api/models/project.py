@@ -28,12 +28,19 @@ class ResearchProject(models.Model):
     endtime = models.DateTimeField(verbose_name='结束时间')
     outcome = models.CharField(max_length=255, verbose_name='预期成果')
     contact = models.CharField(max_length=255, verbose_name='联系方式')
+    # 发布/更新时由起止时间计算（见 calc_project_hours_per_week），起止时间无效时为空
+    duration_weeks = models.IntegerField(null=True, blank=True, verbose_name='项目周期（周）')
+    hours_per_week = models.IntegerField(null=True, blank=True, verbose_name='每周标准工时')
     
     class Meta:
         db_table = 'Research_project'
         verbose_name = '科研项目'
         verbose_name_plural = '科研项目'
         ordering = ['-post__create_time']
+        indexes = [
+            # 列表按进行时间窗口 / 开始时间筛选
+            models.Index(fields=['starttime', 'endtime', 'post'], name='research_window_idx'),
+        ]
     
     def __str__(self):
         return self.research_name
@@ -83,6 +90,10 @@ class CompetitionProject(models.Model):
         verbose_name = '竞赛项目'
         verbose_name_plural = '竞赛项目'
         ordering = ['-post__create_time']
+        indexes = [
+            # 列表按报名截止时间筛选
+            models.Index(fields=['deadline', 'post'], name='competition_deadline_idx'),
+        ]
     
     def __str__(self):
         return self.competition_name
@@ -107,8 +118,21 @@ class SkillInformation(models.Model):
     experience_link = models.CharField(max_length=255, blank=True, null=True, verbose_name='经验链接')
     habit_tag = models.CharField(max_length=255, verbose_name='习惯标签')
     spend_time = models.CharField(max_length=255, verbose_name='可投入时间')
+    # 发布/更新时由 spend_time 解析，列表按区间筛选时走索引
+    hours_per_week = models.FloatField(null=True, blank=True, db_index=True, verbose_name='每周可投入小时数', help_text='无法解析时为空')
+    hours_parsed = models.BooleanField(
+        null=True,
+        blank=True,
+        verbose_name='可投入时间解析结果',
+        help_text='None-尚未解析（旧数据，执行 backfill_hours_per_week 回填）, True-解析成功, False-无法解析'
+    )
     expect_worktype = models.CharField(max_length=255, verbose_name='期望工作类型')
     filter = models.CharField(max_length=255, verbose_name='筛选条件')
+    # 技能评分在发布/更新时计算并保存，列表和详情直接读取
+    skill_score = models.FloatField(default=0, db_index=True, verbose_name='技能评分')
+    keyword_score = models.FloatField(default=0, verbose_name='关键词得分')
+    proficiency_score = models.FloatField(default=0, verbose_name='熟练度得分')
+    score_version = models.CharField(max_length=16, blank=True, default='', verbose_name='评分所用词表版本')
     class Meta:
         db_table = 'Skill_information'
         verbose_name = '学生技能发布'
@@ -0,0 +1,36 @@
+"""
+推荐模型
+包括：PostTerm
+"""
+from django.db import models
+from .post import PostEntity
+
+
+class PostTerm(models.Model):
+    """发布信息词项向量表（post × 词项的稀疏矩阵）
+
+    词项来自技能/技术栈（按名称归一，学生技能与项目技术栈可互相匹配）、方向和标签；
+    每个 post 的权重做 L2 归一化，两个 post 共有词项的权重乘积之和即余弦相似度
+    """
+    id = models.BigAutoField(primary_key=True, verbose_name='词项ID')
+    post = models.ForeignKey(
+        PostEntity,
+        on_delete=models.CASCADE,
+        db_column='post_id',
+        verbose_name='发布信息ID'
+    )
+    term = models.CharField(max_length=255, verbose_name='词项', help_text='t:技能/技术栈名称, d:方向ID, g:标签ID')
+    weight = models.FloatField(verbose_name='归一化权重')
+
+    class Meta:
+        db_table = 'Post_term'
+        verbose_name = '发布词项'
+        verbose_name_plural = '发布词项'
+        unique_together = [['post', 'term']]
+        indexes = [
+            models.Index(fields=['term', 'post'], name='post_term_idx'),
+        ]
+        ordering = ['id']
+
+    def __str__(self):
+        return f'Post {self.post_id} - {self.term} ({self.weight:.3f})'
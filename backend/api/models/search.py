@@ -0,0 +1,91 @@
+"""
+搜索索引模型
+包括：PostSearchTerm, SearchTermStat, SearchFieldStat
+"""
+from django.db import models
+from .post import PostEntity
+
+
+class PostSearchTerm(models.Model):
+    """发布信息倒排索引表（词项 -> post_id）
+
+    中文没有空格分词，统一按字符二元组（bigram）切分，
+    每个 post 的每个字段、每个词项一行，tf 为出现次数
+    """
+    FIELD_TITLE = 1      # research_name / competition_name
+    FIELD_DIRECTION = 2  # 方向
+    FIELD_STACK = 3      # 技术栈
+    FIELD_TAG = 4        # 标签
+    FIELD_TEXT = 5       # outcome / team_require / reward / project_experience
+    FIELD_CHOICES = [
+        (FIELD_TITLE, '标题'),
+        (FIELD_DIRECTION, '方向'),
+        (FIELD_STACK, '技术栈'),
+        (FIELD_TAG, '标签'),
+        (FIELD_TEXT, '正文'),
+    ]
+
+    id = models.BigAutoField(primary_key=True, verbose_name='索引ID')
+    term = models.CharField(max_length=8, verbose_name='词项')
+    post = models.ForeignKey(
+        PostEntity,
+        on_delete=models.CASCADE,
+        db_column='post_id',
+        verbose_name='发布信息ID'
+    )
+    field = models.SmallIntegerField(choices=FIELD_CHOICES, verbose_name='字段')
+    tf = models.IntegerField(default=1, verbose_name='词频')
+    field_len = models.IntegerField(default=0, verbose_name='字段长度', help_text='该 post 该字段的词项总数（BM25 文档长度）')
+
+    class Meta:
+        db_table = 'Post_search_term'
+        verbose_name = '搜索索引'
+        verbose_name_plural = '搜索索引'
+        unique_together = [['post', 'field', 'term']]
+        indexes = [
+            models.Index(fields=['term', 'post'], name='post_search_term_idx'),
+        ]
+        ordering = ['id']
+
+    def __str__(self):
+        return f'{self.term} -> Post {self.post_id} ({self.get_field_display()})'
+
+
+class SearchTermStat(models.Model):
+    """词项文档频率表（包含该词项的 post 数，随索引增量维护）"""
+    term = models.CharField(max_length=8, primary_key=True, verbose_name='词项')
+    df = models.IntegerField(default=0, verbose_name='文档频率')
+
+    class Meta:
+        db_table = 'Search_term_stat'
+        verbose_name = '词项统计'
+        verbose_name_plural = '词项统计'
+        ordering = ['term']
+
+    def __str__(self):
+        return f'{self.term} (df: {self.df})'
+
+
+class SearchFieldStat(models.Model):
+    """字段统计表（文档数与总长度，用于计算平均字段长度）
+
+    field=0 的行记录整个索引的文档数
+    """
+    FIELD_ALL = 0
+
+    field = models.SmallIntegerField(primary_key=True, verbose_name='字段')
+    doc_count = models.IntegerField(default=0, verbose_name='文档数')
+    total_length = models.BigIntegerField(default=0, verbose_name='总长度')
+
+    class Meta:
+        db_table = 'Search_field_stat'
+        verbose_name = '字段统计'
+        verbose_name_plural = '字段统计'
+        ordering = ['field']
+
+    @property
+    def avg_length(self):
+        return self.total_length / self.doc_count if self.doc_count > 0 else 0.0
+
+    def __str__(self):
+        return f'Field {self.field} (文档数: {self.doc_count})'
@@ -0,0 +1,43 @@
+"""
+登录会话模型
+包括：UserSession
+"""
+import hashlib
+
+from django.db import models
+from .user import User
+
+
+class UserSession(models.Model):
+    """用户登录会话表
+
+    每次登录（每个设备）一行，只保存 token 的 SHA-256 摘要，
+    通过唯一索引按摘要查找
+    """
+    id = models.BigAutoField(primary_key=True, verbose_name='会话ID')
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        db_column='user_id',
+        related_name='sessions',
+        verbose_name='用户ID'
+    )
+    token_hash = models.CharField(max_length=64, unique=True, verbose_name='令牌摘要')
+    device = models.CharField(max_length=255, blank=True, default='', verbose_name='设备信息')
+    created_at = models.DateTimeField(verbose_name='创建时间')
+    expires_at = models.DateTimeField(db_index=True, verbose_name='过期时间')
+    last_seen = models.DateTimeField(verbose_name='最近活跃时间')
+
+    class Meta:
+        db_table = 'User_session'
+        verbose_name = '登录会话'
+        verbose_name_plural = '登录会话'
+        ordering = ['-created_at']
+
+    @staticmethod
+    def hash_token(token):
+        """计算 token 摘要"""
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+    def __str__(self):
+        return f'Session {self.id} (User {self.user_id})'
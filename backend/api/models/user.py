@@ -3,8 +3,15 @@
 包括：User, StudentEntity, TeacherEntity
 """
 from django.db import models
+from django.db.models import F
+from django.conf import settings
 from django.contrib.auth.hashers import make_password, check_password
+from django.utils import timezone
 import secrets
+from datetime import timedelta
+
+from ..utils.token_cache import token_cache
+from ..utils.signed_token import signed_tokens_enabled, make_signed_token, set_token_version
 
 
 class User(models.Model):
@@ -24,7 +31,8 @@ class User(models.Model):
     password = models.CharField(max_length=128, verbose_name='密码')
     is_active = models.BooleanField(default=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
-    token = models.CharField(max_length=64, blank=True, null=True, verbose_name='认证令牌')
+    token = models.CharField(max_length=64, blank=True, null=True, db_index=True, verbose_name='认证令牌', help_text='旧版单会话令牌，新登录使用 UserSession')
+    token_version = models.PositiveIntegerField(default=0, verbose_name='令牌版本', help_text='递增后吊销已签发的签名令牌')
     auto_reply_enabled = models.BooleanField(default=False, verbose_name='自动回复已启用')
     auto_reply_message = models.TextField(blank=True, null=True, verbose_name='自动回复消息')
     
@@ -42,11 +50,64 @@ class User(models.Model):
         """验证密码"""
         return check_password(raw_password, self.password)
     
-    def generate_token(self):
-        """生成并保存 token"""
-        self.token = secrets.token_urlsafe(32)
-        self.save(update_fields=['token'])
-        return self.token
+    def save(self, *args, **kwargs):
+        """保存后使该用户的 token 缓存失效（token 轮换、停用等）"""
+        super().save(*args, **kwargs)
+        token_cache.invalidate_user(self.user_id)
+    
+    def delete(self, *args, **kwargs):
+        """删除后使该用户的 token 缓存失效"""
+        user_id = self.user_id
+        result = super().delete(*args, **kwargs)
+        token_cache.invalidate_user(user_id)
+        return result
+    
+    def deactivate(self):
+        """停用用户，清空 token、删除全部会话并吊销已签发的签名令牌"""
+        self.sessions.all().delete()
+        self.is_active = False
+        self.deleted_at = timezone.now()
+        self.token = None
+        self.save(update_fields=['is_active', 'deleted_at', 'token'])
+        self.revoke_tokens()
+    
+    def revoke_tokens(self):
+        """递增令牌版本，使该用户已签发的签名令牌全部失效"""
+        User.objects.filter(user_id=self.user_id).update(token_version=F('token_version') + 1)
+        self.token_version = User.objects.values_list('token_version', flat=True).get(user_id=self.user_id)
+        set_token_version(self.user_id, self.token_version)
+        token_cache.invalidate_user(self.user_id)
+    
+    def clear_legacy_token(self):
+        """清空旧版 User.token 列（已为空时不写库）"""
+        if User.objects.filter(user_id=self.user_id, token__isnull=False).update(token=None):
+            token_cache.invalidate_user(self.user_id)
+        self.token = None
+    
+    def generate_token(self, device=''):
+        """生成 token
+        
+        签名令牌模式（AUTH_SIGNED_TOKENS）下直接签发，不写库；
+        否则生成随机 token，并为本次登录新建一条 UserSession（只保存摘要），
+        同一用户多设备登录互不覆盖
+        
+        签发新 token 时清空旧版 User.token 列，迁移前签发的明文 token 随之作废
+        """
+        self.clear_legacy_token()
+        if signed_tokens_enabled():
+            return make_signed_token(self)
+        from .session import UserSession
+        token = secrets.token_urlsafe(32)
+        now = timezone.now()
+        UserSession.objects.create(
+            user=self,
+            token_hash=UserSession.hash_token(token),
+            device=(device or '')[:255],
+            created_at=now,
+            expires_at=now + timedelta(seconds=getattr(settings, 'SESSION_TOKEN_MAX_AGE', 7 * 24 * 3600)),
+            last_seen=now
+        )
+        return token
     
     def __str__(self):
         return f'User {self.user_id} (身份: {self.get_identity_display()})'
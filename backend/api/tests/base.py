@@ -0,0 +1,102 @@
+"""
+接口测试基类
+每个用例前清空缓存；请求内注册的 transaction.on_commit 回调（缓存失效等）在请求结束时执行
+"""
+from django.core.cache import cache
+from django.test import TestCase
+
+from ..utils.session_tracker import session_touch_buffer
+from ..utils.token_cache import token_cache
+
+RESEARCH_START_MS = 1735128927575  # 2024-12-25
+RESEARCH_END_MS = 1745128927575    # 2025-04-20
+
+
+class APITestCase(TestCase):
+    """带注册/登录/发布辅助方法的接口测试基类"""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        token_cache.clear()
+        session_touch_buffer.flush()
+
+    # ---------- 请求 ----------
+
+    def auth(self, token):
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def get(self, url, params=None, token=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.get(f'/api{url}', params or {}, **(self.auth(token) if token else {}))
+
+    def post(self, url, data=None, token=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                f'/api{url}', data or {}, content_type='application/json',
+                **(self.auth(token) if token else {})
+            )
+
+    # ---------- 账号 ----------
+
+    def register(self, identity, account, name=None, password='secret'):
+        extra = {'grade': 2} if identity == 0 else {'title': '教授'}
+        response = self.post('/auth/register', {
+            'identity': identity, 'account': str(account), 'name': name or f'用户{account}',
+            'password': password, 'extra': extra
+        })
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()['user_id']
+
+    def login(self, identity, account, password='secret'):
+        response = self.post('/auth/login', {'identity': identity, 'account': str(account), 'password': password})
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()['token']
+
+    def create_teacher(self, teacher_id=10001, name=None):
+        self.register(1, teacher_id, name)
+        return self.login(1, teacher_id)
+
+    def create_student(self, student_id=20001, name=None):
+        self.register(0, student_id, name)
+        return self.login(0, student_id)
+
+    # ---------- 发布 ----------
+
+    def publish(self, kind, token, payload):
+        response = self.post(f'/publish/{kind}', payload, token=token)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()['data']['post_id']
+
+    def publish_research(self, token, teacher_id=10001, **overrides):
+        payload = {
+            'teacher_id': teacher_id, 'research_name': '小型目标检测', 'research_direction': '人工智能',
+            'tech_stack': 'python', 'recruit_quantity': 3, 'starttime': RESEARCH_START_MS,
+            'endtime': RESEARCH_END_MS, 'outcome': '论文', 'contact': 'mail'
+        }
+        payload.update(overrides)
+        return self.publish('research', token, payload)
+
+    def publish_competition(self, token, teacher_id=10001, **overrides):
+        payload = {
+            'teacher_id': teacher_id, 'competition_name': '程序设计竞赛', 'competition_type': 'AC',
+            'deadline': RESEARCH_END_MS, 'team_require': '三人组队', 'guide_way': 'online',
+            'reward': '奖金', 'contact': 'mail'
+        }
+        payload.update(overrides)
+        return self.publish('competition', token, payload)
+
+    def publish_personal(self, token, student_id=20001, **overrides):
+        payload = {
+            'student_id': student_id, 'major': '网络工程',
+            'skills': [{'skill_name': 'Python', 'skill_degree': 'skillful'}],
+            'project_experience': '深度学习 机器学习 项目', 'spend_time': '每周10-12小时',
+            'expect_worktype': 'research', 'filter': 'all'
+        }
+        payload.update(overrides)
+        return self.publish('personal', token, payload)
+
+    def list_items(self, params=None, token=None):
+        response = self.get('/project/list', params, token=token)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()['data']
@@ -0,0 +1,81 @@
+import random
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from ..management.commands.bench_assignment import brute_force_total, make_instance
+from ..utils.assignment import assign_students
+from .base import APITestCase
+
+
+class AssignStudentsTests(SimpleTestCase):
+    def check(self, weights, capacities):
+        assignment, total = assign_students(weights, capacities)
+        for project, capacity in enumerate(capacities):
+            self.assertLessEqual(assignment.count(project), capacity)
+        for student, project in enumerate(assignment):
+            if project is not None:
+                self.assertIn(project, weights[student])
+        self.assertAlmostEqual(total, sum(weights[s][p] for s, p in enumerate(assignment) if p is not None))
+        self.assertAlmostEqual(total, brute_force_total(weights, capacities))
+        return assignment
+
+    def test_greedy_trap_needs_reassignment(self):
+        # 贪心会把学生 0 放进项目 0，导致学生 1 无处可去
+        self.assertEqual(self.check([{0: 10, 1: 9}, {0: 8}], [1, 1]), [1, 0])
+
+    def test_empty_and_zero_capacity(self):
+        self.assertEqual(assign_students([], [2]), ([], 0))
+        self.assertEqual(self.check([{0: 5}, {}], [0]), [None, None])
+
+    def test_matches_brute_force_on_random_instances(self):
+        rng = random.Random(7)
+        for _ in range(300):
+            weights, capacities = make_instance(rng.randint(1, 6), rng.randint(1, 3), rng.uniform(0.3, 1), rng, 3)
+            self.check(weights, capacities)
+
+
+class SuggestAssignmentTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.teacher = self.create_teacher()
+        self.project_a = self.publish_research(self.teacher, recruit_quantity=1)
+        self.project_b = self.publish_research(self.teacher, research_name='图像分割', recruit_quantity=1)
+        self.students = [self.create_student(20001 + i) for i in range(2)]
+        self.publish_personal(self.students[0], student_id=20001)
+        self.publish_personal(self.students[1], student_id=20002, skills=[
+            {'skill_name': 'Python', 'skill_degree': 'skillful'},
+            {'skill_name': 'PyTorch', 'skill_degree': 'skillful'},
+        ])
+        self.applications = {}
+        for index, post_id in [(0, self.project_a), (1, self.project_a), (1, self.project_b)]:
+            response = self.post('/cooperation/apply', {'post_id': post_id}, token=self.students[index])
+            self.assertEqual(response.status_code, 201, response.content)
+            self.applications[index, post_id] = response.json()['cooperation_id']
+
+    def suggest(self):
+        response = self.get('/project/assignment', token=self.teacher)
+        self.assertEqual(response.status_code, 200, response.content)
+        data = response.json()['data']
+        return {p['post_id']: ([s['student_id'] for s in p['students']], p['capacity']) for p in data['projects']}, data
+
+    def test_assigns_everyone_within_capacity(self):
+        projects, data = self.suggest()
+        self.assertEqual(projects, {self.project_a: ([20001], 1), self.project_b: ([20002], 1)})
+        self.assertEqual(data['unassigned'], [])
+
+    def test_confirmed_students_use_up_capacity(self):
+        self.post('/cooperation/approve', {'cooperation_id': self.applications[0, self.project_a]}, token=self.teacher)
+        projects, _ = self.suggest()
+        self.assertEqual(projects, {self.project_a: ([], 0), self.project_b: ([20002], 1)})
+
+    def test_students_and_oversized_requests_rejected(self):
+        self.assertEqual(self.get('/project/assignment', token=self.students[0]).status_code, 403)
+        with mock.patch('api.views.project.ASSIGNMENT_MAX_PAIRS', 2):
+            self.assertEqual(self.get('/project/assignment', token=self.teacher).status_code, 400)
+
+    def test_unexpected_errors_use_response_envelope(self):
+        with mock.patch('api.views.project.assign_students', side_effect=ValueError('boom')):
+            response = self.get('/project/assignment', token=self.teacher)
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json()['code'], 500)
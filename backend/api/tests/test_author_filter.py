@@ -0,0 +1,43 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ..models import PostEntity, User
+from .base import APITestCase
+
+
+class AuthorFilterTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.teacher = self.create_teacher(10001)
+        self.other_teacher = self.create_teacher(10002)
+        self.student = self.create_student(20001)
+        self.research = self.publish_research(self.teacher, teacher_id=10001)
+        self.competition = self.publish_competition(self.teacher, teacher_id=10001)
+        self.other = self.publish_research(self.other_teacher, teacher_id=10002)
+        self.personal = self.publish_personal(self.student)
+
+    def user_id(self, **lookup):
+        return User.objects.get(**lookup).user_id
+
+    def test_publish_records_author(self):
+        authors = dict(PostEntity.objects.values_list('post_id', 'author_id'))
+        teacher_user = self.user_id(teacherentity__teacher_id=10001)
+        self.assertEqual(authors[self.research], teacher_user)
+        self.assertEqual(authors[self.competition], teacher_user)
+        self.assertEqual(authors[self.personal], self.user_id(studententity__student_id=20001))
+
+    def test_filter_by_author_uses_single_column(self):
+        teacher_user = self.user_id(teacherentity__teacher_id=10001)
+        with CaptureQueriesContext(connection) as queries:
+            data = self.list_items({'user_id': teacher_user})
+        self.assertEqual([item['post_id'] for item in data['items']], [self.competition, self.research])
+        self.assertEqual(data['total'], 2)
+        sql = '\n'.join(query['sql'] for query in queries.captured_queries)
+        self.assertIn('author_user_id', sql)
+        self.assertNotIn('Research_project', sql)
+
+        student_user = self.user_id(studententity__student_id=20001)
+        self.assertEqual([item['post_id'] for item in self.list_items({'user_id': student_user})['items']], [self.personal])
+
+    def test_invalid_user_id_is_ignored(self):
+        self.assertEqual(self.list_items({'user_id': 'abc'})['total'], 4)
@@ -0,0 +1,47 @@
+import json
+
+from django.core.cache import cache
+
+from ..models import ProjectCard
+from ..utils.project_card import load_card_fragments
+from .base import APITestCase
+
+
+class CardFragmentTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.teacher = self.create_teacher()
+        self.post_ids = [self.publish_research(self.teacher, research_name=f'课题{i}') for i in range(3)]
+
+    def rows(self):
+        return list(ProjectCard.objects.filter(post_id__in=self.post_ids).values_list('post_id', 'version'))
+
+    def test_cached_fragments_skip_card_reads(self):
+        cache.clear()
+        rows = self.rows()
+        first = load_card_fragments(rows)
+        with self.assertNumQueries(0):
+            self.assertEqual(load_card_fragments(rows), first)
+        self.assertEqual(json.loads(first[self.post_ids[0]])['title'], '课题0')
+
+    def test_version_bump_replaces_only_changed_fragment(self):
+        before = load_card_fragments(self.rows())
+        self.publish_research(self.teacher, post_id=self.post_ids[0], research_name='新标题')
+
+        rows = self.rows()
+        with self.assertNumQueries(1):  # 只读取版本变化的一张卡片
+            after = load_card_fragments(rows)
+
+        self.assertEqual(json.loads(after[self.post_ids[0]])['title'], '新标题')
+        self.assertEqual(after[self.post_ids[1]], before[self.post_ids[1]])
+
+    def test_missing_card_is_rebuilt(self):
+        ProjectCard.objects.filter(post_id=self.post_ids[0]).delete()
+        fragments = load_card_fragments([(self.post_ids[0], None)])
+        self.assertEqual(json.loads(fragments[self.post_ids[0]])['title'], '课题0')
+        self.assertTrue(ProjectCard.objects.filter(post_id=self.post_ids[0]).exists())
+
+    def test_stitched_page_matches_fragments(self):
+        data = self.list_items()
+        fragments = load_card_fragments(self.rows())
+        self.assertEqual(data['items'], [json.loads(fragments[post_id]) for post_id in reversed(self.post_ids)])
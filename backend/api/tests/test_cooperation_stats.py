@@ -0,0 +1,51 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from ..models import TeacherCooperationStats
+from .base import APITestCase
+
+
+class TeacherCooperationStatsTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.teacher = self.create_teacher(10001)
+        self.post_id = self.publish_research(self.teacher)
+        self.students = [self.create_student(20001), self.create_student(20002)]
+
+    def apply(self, student):
+        response = self.post('/cooperation/apply', {'post_id': self.post_id}, token=student)
+        self.assertEqual(response.status_code, 201, response.content)
+        return response.json()['cooperation_id']
+
+    def counts(self):
+        stats = TeacherCooperationStats.objects.get(teacher_id=10001)
+        return {field: getattr(stats, field) for field in ('total', 'pending', 'confirmed', 'rejected', 'canceled')}
+
+    def test_transitions_update_counts_incrementally(self):
+        first = self.apply(self.students[0])
+        second = self.apply(self.students[1])
+        self.assertEqual(self.counts(), {'total': 2, 'pending': 2, 'confirmed': 0, 'rejected': 0, 'canceled': 0})
+
+        self.post('/cooperation/approve', {'cooperation_id': first}, token=self.teacher)
+        self.post('/cooperation/apply/reject', {'cooperation_id': second}, token=self.teacher)
+        self.assertEqual(self.counts(), {'total': 2, 'pending': 0, 'confirmed': 1, 'rejected': 1, 'canceled': 0})
+
+        profile = self.get('/auth/profile', token=self.teacher).json()['data']
+        self.assertEqual(profile['total_cooperations'], 2)
+        self.assertEqual(profile['approved_cooperations'], 1)
+        self.assertEqual(profile['success_rate'], 50.0)
+
+    def test_cancel_moves_pending_to_canceled(self):
+        cooperation_id = self.apply(self.students[0])
+        self.post('/cooperation/apply/cancel', {'cooperation_id': cooperation_id}, token=self.students[0])
+        self.assertEqual(self.counts(), {'total': 1, 'pending': 0, 'confirmed': 0, 'rejected': 0, 'canceled': 1})
+        # 重复操作不会重复计数
+        self.post('/cooperation/apply/cancel', {'cooperation_id': cooperation_id}, token=self.students[0])
+        self.assertEqual(self.counts()['canceled'], 1)
+
+    def test_rebuild_command_repairs_drift(self):
+        self.apply(self.students[0])
+        TeacherCooperationStats.objects.filter(teacher_id=10001).update(total=9, pending=0)
+        call_command('rebuild_teacher_cooperation_stats', stdout=StringIO())
+        self.assertEqual(self.counts(), {'total': 1, 'pending': 1, 'confirmed': 0, 'rejected': 0, 'canceled': 0})
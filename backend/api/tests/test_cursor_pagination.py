@@ -0,0 +1,36 @@
+from .base import APITestCase
+
+
+class CursorPaginationTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.teacher = self.create_teacher()
+        self.post_ids = [self.publish_research(self.teacher, research_name=f'课题{i}') for i in range(5)]
+
+    def page(self, cursor, **params):
+        return self.list_items({'cursor': cursor, 'page_size': 2, **params})
+
+    def test_walks_all_pages_in_order(self):
+        seen = []
+        cursor = ''
+        while cursor is not None:
+            data = self.page(cursor)
+            self.assertNotIn('total', data)
+            seen.extend(item['post_id'] for item in data['items'])
+            cursor = data['next_cursor']
+            self.assertEqual(data['has_more'], cursor is not None)
+        self.assertEqual(seen, list(reversed(self.post_ids)))
+
+    def test_stable_across_inserts(self):
+        first = self.page('')
+        # 翻页期间有新发布：新数据排在最前，不会造成后续页重复或遗漏
+        self.publish_research(self.teacher, research_name='新课题')
+        second = self.page(first['next_cursor'])
+        third = self.page(second['next_cursor'])
+        seen = [item['post_id'] for data in (first, second, third) for item in data['items']]
+        self.assertEqual(seen, list(reversed(self.post_ids)))
+        self.assertIsNone(third['next_cursor'])
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.get('/project/list', {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
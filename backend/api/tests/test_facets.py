@@ -0,0 +1,36 @@
+from .base import APITestCase
+
+
+class FacetTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.teacher = self.create_teacher()
+        self.first = self.publish_research(self.teacher, research_name='目标检测', tech_stack='python')
+        self.second = self.publish_research(self.teacher, research_name='目标跟踪', tech_stack='java')
+        self.publish_competition(self.teacher)
+
+    def facets(self, **params):
+        return self.list_items({'facets': 'post_type,stack,recruit_status,unknown', **params})['facets']
+
+    def as_dict(self, items):
+        return {item['value']: item['count'] for item in items}
+
+    def test_counts_for_all_facets(self):
+        facets = self.facets()
+        self.assertEqual(list(facets), ['post_type', 'stack', 'recruit_status'])
+        self.assertEqual(facets['post_type'], [{'value': 'research', 'count': 2}, {'value': 'competition', 'count': 1}])
+        self.assertEqual(self.as_dict(facets['stack']), {'python': 1, 'java': 1})
+        self.assertEqual(facets['recruit_status'], [{'value': 0, 'count': 3}])
+
+    def test_counts_follow_filters(self):
+        facets = self.facets(search='目标检测')
+        self.assertEqual(facets['post_type'], [{'value': 'research', 'count': 1}])
+        self.assertEqual(self.as_dict(facets['stack']), {'python': 1})
+
+    def test_counts_follow_recruit_status_change(self):
+        self.facets()
+        self.post(f'/project/update-recruit-status/{self.first}', {'recruit_status': 1}, token=self.teacher)
+        self.assertEqual(self.as_dict(self.facets()['recruit_status']), {0: 2, 1: 1})
+
+    def test_facets_absent_unless_requested(self):
+        self.assertNotIn('facets', self.list_items())
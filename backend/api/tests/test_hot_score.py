@@ -0,0 +1,73 @@
+from datetime import timedelta
+from importlib import import_module
+from io import StringIO
+from unittest import mock
+
+from django.apps import apps
+from django.core.management import call_command
+from django.test import override_settings
+
+from ..models import PostEntity
+from ..utils.hot_score import HOT_SCORE_EPOCH, compute_hot_score
+from .base import APITestCase
+
+
+class ComputeHotScoreTests(APITestCase):
+    @override_settings(HOT_SCORE_DECAY_SECONDS=3600)
+    def test_engagement_and_age(self):
+        self.assertEqual(compute_hot_score(0, 0, 0, HOT_SCORE_EPOCH), 0.0)
+        self.assertEqual(compute_hot_score(4, 0, 2, HOT_SCORE_EPOCH), 1.0)  # 4 + 3*2 = 10
+        # 晚发布一个衰减周期，等价于互动数多一个数量级
+        later = HOT_SCORE_EPOCH + timedelta(seconds=3600)
+        self.assertEqual(compute_hot_score(0, 0, 0, later), compute_hot_score(10, 0, 0, HOT_SCORE_EPOCH))
+
+
+class HotRankingTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.teacher = self.create_teacher()
+        self.student = self.create_student()
+        self.older = self.publish_research(self.teacher, research_name='较早的项目')
+        self.newer = self.publish_research(self.teacher, research_name='较新的项目')
+
+    def hot_order(self):
+        return [item['post_id'] for item in self.list_items({'sort': 'hot'})['items']]
+
+    def refresh(self, **options):
+        stdout = StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('refresh_hot_scores', stdout=stdout, **options)
+        return stdout.getvalue()
+
+    def test_interactions_mark_dirty_and_refresh_reorders(self):
+        self.assertEqual(self.hot_order(), [self.newer, self.older])
+        self.assertFalse(PostEntity.objects.filter(hot_dirty=True).exists())
+
+        for _ in range(3):
+            self.post('/post/comment', {'post_id': self.older, 'comment': '不错'}, token=self.student)
+        self.assertEqual(list(PostEntity.objects.filter(hot_dirty=True).values_list('post_id', flat=True)), [self.older])
+        # 分数由后台任务刷新，请求内不重算
+        self.assertEqual(self.hot_order(), [self.newer, self.older])
+
+        output = self.refresh()
+
+        self.assertIn('处理 1，分数变化 1', output)
+        self.assertFalse(PostEntity.objects.filter(hot_dirty=True).exists())
+        self.assertEqual(self.hot_order(), [self.older, self.newer])
+
+    def test_refresh_all_recomputes_after_weight_change(self):
+        PostEntity.objects.update(hot_score=0)
+        self.assertIn('分数变化 0', self.refresh())
+        self.assertIn('处理 2，分数变化 2', self.refresh(all=True))
+        self.assertEqual(self.hot_order(), [self.newer, self.older])
+
+    def test_migration_backfill_matches_refresh(self):
+        self.post('/post/like', {'post_id': self.older}, token=self.student)
+        self.refresh()
+        expected = dict(PostEntity.objects.values_list('post_id', 'hot_score'))
+        PostEntity.objects.update(hot_score=0, hot_dirty=True)
+        migration = import_module('api.migrations.0025_post_hot_score')
+        with mock.patch.object(migration, 'BATCH_SIZE', 1):
+            migration.backfill_hot_score(apps, None)
+        self.assertEqual(dict(PostEntity.objects.values_list('post_id', 'hot_score')), expected)
+        self.assertFalse(PostEntity.objects.filter(hot_dirty=True).exists())
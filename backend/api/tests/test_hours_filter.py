@@ -0,0 +1,53 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from ..models import SkillInformation
+from .base import APITestCase
+
+
+class HoursPerWeekTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.students = [self.create_student(20001 + i) for i in range(3)]
+        self.posts = [
+            self.publish_personal(token, student_id=20001 + i, spend_time=spend_time)
+            for i, (token, spend_time) in enumerate(zip(self.students, ['每周10-12小时', '每周4小时', '有空就来']))
+        ]
+
+    def stored(self, post_id):
+        return SkillInformation.objects.values_list('hours_per_week', 'hours_parsed').get(post_id=post_id)
+
+    def filtered(self, **params):
+        return [item['post_id'] for item in self.list_items(params)['items']]
+
+    def test_parsed_on_publish_and_update(self):
+        self.assertEqual(self.stored(self.posts[0]), (11.0, True))
+        self.assertEqual(self.stored(self.posts[2]), (None, False))
+        self.publish_personal(self.students[2], student_id=20003, post_id=self.posts[2], spend_time='8h/week')
+        self.assertEqual(self.stored(self.posts[2]), (8.0, True))
+
+    def test_hours_range_filter(self):
+        teacher = self.create_teacher()
+        self.publish_research(teacher)
+        self.assertEqual(self.filtered(min_hours='5'), [self.posts[0]])
+        self.assertEqual(self.filtered(max_hours='5'), [self.posts[1]])
+        self.assertEqual(sorted(self.filtered(min_hours='4', max_hours='11')), sorted(self.posts[:2]))
+        response = self.get('/project/list', {'min_hours': 'abc'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_backfill_command_fills_legacy_rows(self):
+        SkillInformation.objects.update(hours_per_week=None, hours_parsed=None)
+        stdout = StringIO()
+        call_command('backfill_hours_per_week', batch_size=2, stdout=stdout)
+        self.assertIn('处理 3，无法解析 1', stdout.getvalue())
+        self.assertEqual(self.stored(self.posts[0]), (11.0, True))
+        self.assertEqual(self.stored(self.posts[1]), (4.0, True))
+        self.assertEqual(self.stored(self.posts[2]), (None, False))
+
+        # 默认只处理尚未解析的记录
+        SkillInformation.objects.filter(post_id=self.posts[1]).update(hours_per_week=99)
+        call_command('backfill_hours_per_week', stdout=StringIO())
+        self.assertEqual(self.stored(self.posts[1]), (99.0, True))
+        call_command('backfill_hours_per_week', all=True, stdout=StringIO())
+        self.assertEqual(self.stored(self.posts[1]), (4.0, True))
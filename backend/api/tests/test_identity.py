@@ -0,0 +1,33 @@
+from django.test import RequestFactory
+
+from ..utils.auth import get_identity
+from .base import APITestCase
+
+
+class IdentityContextTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.factory = RequestFactory()
+
+    def request_for(self, token):
+        return self.factory.get('/api/auth/profile', **self.auth(token))
+
+    def test_student_identity_resolved_once_per_request(self):
+        request = self.request_for(self.create_student(20001, '张三'))
+        with self.assertNumQueries(2):  # 会话 + 学生实体
+            identity = get_identity(request)
+        with self.assertNumQueries(0):
+            self.assertIs(get_identity(request), identity)
+        self.assertEqual(identity.student_id, 20001)
+        self.assertIsNone(identity.teacher)
+        self.assertEqual(identity.name, '张三')
+
+    def test_teacher_identity(self):
+        identity = get_identity(self.request_for(self.create_teacher(10001, '李老师')))
+        self.assertEqual(identity.teacher_id, 10001)
+        self.assertIsNone(identity.student)
+        self.assertEqual(identity.name, '李老师')
+
+    def test_invalid_token_has_no_identity(self):
+        self.assertIsNone(get_identity(self.request_for('missing')))
+        self.assertEqual(self.get('/project/time-match', {'post_id': 1}, token='missing').status_code, 401)
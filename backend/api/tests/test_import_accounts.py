@@ -0,0 +1,57 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+
+from ..models import StudentEntity, TeacherEntity
+from .base import APITestCase
+
+
+class ImportAccountsTests(APITestCase):
+    def write_file(self, suffix, content):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def run_import(self, path, **options):
+        stdout, stderr = StringIO(), StringIO()
+        call_command('import_accounts', path, workers=1, stdout=stdout, stderr=stderr, **options)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_csv_import_skips_existing_and_reports_bad_rows(self):
+        self.register(0, 20001)
+        path = self.write_file('.csv', '\n'.join([
+            'identity,account,name,password,grade,title',
+            '0,20001,已存在,pw,1,',
+            '0,20002,张三,pw,2,',
+            '1,10001,李老师,pw,,教授',
+            '0,20002,重复,pw,2,',
+            '0,abc,格式错误,pw,2,',
+        ]))
+
+        stdout, stderr = self.run_import(path)
+
+        self.assertIn('新建 2，已存在跳过 1，错误 2', stdout)
+        self.assertIn('第 5 行', stderr)
+        self.assertIn('第 6 行', stderr)
+        self.assertEqual(StudentEntity.objects.get(student_id=20002).student_name, '张三')
+        self.assertEqual(TeacherEntity.objects.get(teacher_id=10001).title, '教授')
+        # 导入的账号可以直接登录
+        self.login(0, 20002, password='pw')
+        self.login(1, 10001, password='pw')
+
+    def test_jsonl_dry_run_writes_nothing(self):
+        path = self.write_file('.jsonl', '\n'.join([
+            json.dumps({'identity': 0, 'account': '20003', 'name': '王五', 'password': 'pw', 'extra': {'grade': 1}}),
+            'not json',
+        ]))
+
+        stdout, stderr = self.run_import(path, dry_run=True)
+
+        self.assertIn('新建 1', stdout)
+        self.assertIn('JSON 解析失败', stderr)
+        self.assertFalse(StudentEntity.objects.filter(student_id=20003).exists())
@@ -0,0 +1,45 @@
+import random
+
+from django.test import SimpleTestCase
+
+from ..utils.keyword_matcher import KeywordMatcher
+
+
+def naive_score(entries, text):
+    """逐组子串判断（编译匹配器之前的实现），作为对照"""
+    text = text.lower()
+    score = 0.0
+    for item in entries:
+        keywords = [kw for kw in [item.get('name', '')] + (item.get('aliases') or []) if kw]
+        if any(keyword.lower() in text for keyword in keywords):
+            score += float(item.get('base_weight', 0))
+    return score
+
+
+class KeywordMatcherTests(SimpleTestCase):
+    def test_overlapping_patterns_and_aliases(self):
+        entries = [
+            {'name': 'he', 'base_weight': 1},
+            {'name': 'she', 'base_weight': 2},
+            {'name': 'hers', 'aliases': ['HIS'], 'base_weight': 4},
+        ]
+        matcher = KeywordMatcher(entries)
+        self.assertEqual(matcher.match_groups('ushers'), {0, 1, 2})
+        self.assertEqual(matcher.match_groups('His'), {2})
+        self.assertEqual(matcher.score('she she he'), 3.0)
+        self.assertEqual(matcher.score(''), 0.0)
+
+    def test_matches_naive_substring_scoring(self):
+        rng = random.Random(7)
+        alphabet = 'abc深度学习'
+        for _ in range(200):
+            entries = [
+                {
+                    'name': ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 3))),
+                    'aliases': [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))],
+                    'base_weight': rng.randint(1, 5),
+                }
+                for _ in range(rng.randint(1, 6))
+            ]
+            text = ''.join(rng.choice(alphabet + 'ABC ') for _ in range(rng.randint(0, 20)))
+            self.assertEqual(KeywordMatcher(entries).score(text), naive_score(entries, text), (entries, text))
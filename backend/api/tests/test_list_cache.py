@@ -0,0 +1,60 @@
+from ..models import User
+from .base import APITestCase
+
+
+class ListCacheTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.teacher = self.create_teacher()
+        self.student = self.create_student()
+        self.public_post = self.publish_research(self.teacher, research_name='公开项目')
+
+    def fetch(self, params=None, token=None):
+        response = self.get('/project/list', params, token=token)
+        self.assertEqual(response.status_code, 200)
+        return response['X-List-Cache'], [item['post_id'] for item in response.json()['data']['items']]
+
+    def test_repeat_and_equivalent_params_hit(self):
+        self.assertEqual(self.fetch()[0], 'MISS')
+        self.assertEqual(self.fetch({'page': '1', 'page_size': '20', 'search': ' '})[0], 'HIT')
+        self.assertEqual(self.fetch(token=self.student)[0], 'MISS')
+        self.assertEqual(self.fetch(token=self.student)[0], 'HIT')
+
+    def test_publish_invalidates_every_group(self):
+        self.fetch()
+        self.fetch(token=self.teacher)
+        # 更新可能改变可见权限，发布/更新使所有分组失效
+        teacher_only = self.publish_research(self.teacher, research_name='仅教师可见', visibility=1)
+        self.assertEqual(self.fetch(), ('MISS', [self.public_post]))
+        self.assertEqual(self.fetch(token=self.teacher), ('MISS', [teacher_only, self.public_post]))
+
+    def test_interaction_invalidates_only_groups_that_can_see_the_post(self):
+        teacher_only = self.publish_research(self.teacher, research_name='仅教师可见', visibility=1)
+        self.fetch()
+        self.fetch(token=self.student)
+        self.fetch(token=self.teacher)
+
+        self.post('/post/like', {'post_id': teacher_only}, token=self.teacher)
+
+        self.assertEqual(self.fetch(), ('HIT', [self.public_post]))
+        self.assertEqual(self.fetch(token=self.student), ('HIT', [self.public_post]))
+        self.assertEqual(self.fetch(token=self.teacher), ('MISS', [teacher_only, self.public_post]))
+
+    def test_interactions_invalidate(self):
+        self.fetch()
+        self.post('/post/like', {'post_id': self.public_post}, token=self.student)
+        response = self.get('/project/list')
+        self.assertEqual(response['X-List-Cache'], 'MISS')
+        self.assertEqual(response.json()['data']['items'][0]['like_num'], 1)
+
+    def test_admin_page_is_not_served_to_anonymous_callers(self):
+        teacher_only = self.publish_research(self.teacher, research_name='仅教师可见', visibility=1)
+        student_only = self.publish_personal(self.student, visibility=2)
+        user = User.objects.get(teacherentity__teacher_id=10001)
+        user.identity = 2
+        user.save(update_fields=['identity'])
+        admin = self.teacher
+
+        self.assertEqual(self.fetch(token=admin), ('MISS', [student_only, teacher_only, self.public_post]))
+        self.assertEqual(self.fetch(), ('MISS', [self.public_post]))
+        self.assertEqual(self.fetch(token=admin)[0], 'HIT')
@@ -0,0 +1,59 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ..models import ProjectCard
+from .base import APITestCase
+
+
+class ProjectCardTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.teacher = self.create_teacher(10001, '王' * 120)
+        self.student = self.create_student()
+
+    def test_card_built_on_publish_and_synced_on_update(self):
+        post_id = self.publish_research(self.teacher, research_name='小型目标检测', tech_stack='python')
+        card = ProjectCard.objects.get(post_id=post_id)
+        self.assertEqual((card.title, card.tech_stack, card.post_type), ('小型目标检测', 'python', 1))
+        self.assertEqual(card.publisher_name, '王' * 120)
+
+        self.publish_research(self.teacher, post_id=post_id, research_name='语义分割')
+        self.post(f'/project/update-recruit-status/{post_id}', {'recruit_status': 1}, token=self.teacher)
+        self.post('/post/like', {'post_id': post_id}, token=self.student)
+
+        card.refresh_from_db()
+        self.assertEqual((card.title, card.recruit_status, card.like_num), ('语义分割', 1, 1))
+        item = self.list_items()['items'][0]
+        self.assertEqual((item['title'], item['recruit_status'], item['like_num']), ('语义分割', 1, 1))
+
+    def test_personal_card_fields(self):
+        post_id = self.publish_personal(self.student)
+        item = self.list_items({'post_type': 'personal'})['items'][0]
+        self.assertEqual(item['post_id'], post_id)
+        self.assertEqual(item['teacher_name'], '用户20001')
+        self.assertEqual([skill['skill_name'] for skill in item['skills']], ['Python'])
+        self.assertNotIn('tech_stack', item)
+
+    def test_list_query_count_does_not_grow_with_page_size(self):
+        self.publish_research(self.teacher)
+
+        def count_queries():
+            cache.clear()  # 绕过列表响应缓存
+            with CaptureQueriesContext(connection) as queries:
+                self.list_items({'page_size': 50})
+            return len(queries.captured_queries)
+
+        one = count_queries()
+        for i in range(5):
+            self.publish_research(self.teacher, research_name=f'课题{i}')
+        self.assertEqual(count_queries(), one)
+
+    def test_rebuild_command_restores_cards(self):
+        post_id = self.publish_research(self.teacher)
+        ProjectCard.objects.all().delete()
+        call_command('rebuild_project_cards', stdout=StringIO())
+        self.assertEqual(ProjectCard.objects.get(post_id=post_id).title, '小型目标检测')
@@ -0,0 +1,48 @@
+from .base import APITestCase
+
+
+class RecommendTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.teacher = self.create_teacher()
+        self.student = self.create_student()
+        self.skill_post = self.publish_personal(
+            self.student, skills=[{'skill_name': 'Python', 'skill_degree': 'skillful'}]
+        )
+        self.python_project = self.publish_research(self.teacher, research_name='数据分析', tech_stack='python')
+        self.java_project = self.publish_research(self.teacher, research_name='后端开发', tech_stack='java')
+
+    def recommend(self, post_id, token=None):
+        response = self.get(f'/project/recommend/{post_id}', token=token)
+        self.assertEqual(response.status_code, 200, response.content)
+        return [(item['post_id'], item['match_score']) for item in response.json()['data']['items']]
+
+    def test_projects_for_student_and_students_for_project(self):
+        matches = self.recommend(self.skill_post, token=self.student)
+        self.assertEqual([post_id for post_id, score in matches], [self.python_project])
+        self.assertGreater(matches[0][1], 0)
+
+        self.assertEqual([post_id for post_id, score in self.recommend(self.python_project, token=self.teacher)], [self.skill_post])
+        self.assertEqual(self.recommend(self.java_project, token=self.teacher), [])
+
+    def test_closed_projects_drop_out_and_return(self):
+        self.assertEqual(len(self.recommend(self.skill_post, token=self.student)), 1)
+        url = f'/project/update-recruit-status/{self.python_project}'
+        self.post(url, {'recruit_status': 1}, token=self.teacher)
+        self.assertEqual(self.recommend(self.skill_post, token=self.student), [])
+        self.post(url, {'recruit_status': 0}, token=self.teacher)
+        self.assertEqual(len(self.recommend(self.skill_post, token=self.student)), 1)
+
+    def test_edit_refreshes_cached_recommendations(self):
+        self.assertEqual(len(self.recommend(self.skill_post, token=self.student)), 1)
+        self.publish_research(self.teacher, post_id=self.java_project, research_name='后端开发', tech_stack='python')
+        self.assertEqual(
+            {post_id for post_id, score in self.recommend(self.skill_post, token=self.student)},
+            {self.python_project, self.java_project}
+        )
+
+    def test_visibility_limits_candidates_and_source(self):
+        teacher_only = self.publish_research(self.teacher, research_name='内部项目', tech_stack='python', visibility=1)
+        self.assertNotIn(teacher_only, [post_id for post_id, score in self.recommend(self.skill_post, token=self.student)])
+        self.assertEqual(self.get(f'/project/recommend/{teacher_only}', token=self.student).status_code, 404)
+        self.assertEqual(self.get(f'/project/recommend/{teacher_only}', token=self.teacher).status_code, 200)
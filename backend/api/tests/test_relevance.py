@@ -0,0 +1,60 @@
+from importlib import import_module
+
+from django.apps import apps
+
+from ..models import PostSearchTerm, SearchFieldStat, SearchTermStat
+from ..utils.search_index import score_posts
+from .base import APITestCase
+
+
+class RelevanceRankingTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.teacher = self.create_teacher()
+
+    def ranked(self, keyword):
+        data = self.list_items({'search': keyword, 'sort': 'relevance'})
+        return [(item['post_id'], item['relevance_score']) for item in data['items']]
+
+    def test_title_match_outranks_body_match(self):
+        title_hit = self.publish_research(self.teacher, research_name='图像分割', outcome='论文')
+        body_hit = self.publish_research(self.teacher, research_name='其他课题', outcome='图像分割论文')
+
+        ranked = self.ranked('图像分割')
+
+        self.assertEqual([post_id for post_id, score in ranked], [title_hit, body_hit])
+        self.assertGreater(ranked[0][1], ranked[1][1])
+        # 默认排序仍按发布时间倒序
+        self.assertEqual([item['post_id'] for item in self.list_items({'search': '图像分割'})['items']], [body_hit, title_hit])
+
+    def test_rare_terms_weigh_more(self):
+        common = [self.publish_research(self.teacher, research_name=f'深度学习课题{i}') for i in range(3)]
+        rare = self.publish_research(self.teacher, research_name='量子计算')
+        scores = score_posts('深度学习 量子计算', common + [rare])
+        self.assertGreater(scores[rare], max(scores[post_id] for post_id in common))
+
+    def test_scores_follow_edits(self):
+        post_id = self.publish_research(self.teacher, research_name='图像分割')
+        self.publish_research(self.teacher, research_name='图像分类')
+        before = dict(self.ranked('图像分割'))[post_id]
+        self.publish_research(self.teacher, post_id=post_id, research_name='其他', outcome='图像分割')
+        after = dict(self.ranked('图像分割'))[post_id]
+        self.assertLess(after, before)
+
+    def test_migration_backfill_matches_incremental_stats(self):
+        self.publish_research(self.teacher, research_name='小型目标检测', outcome='目标检测论文')
+        self.publish_competition(self.teacher, competition_name='目标检测挑战赛')
+
+        def snapshot():
+            return (
+                sorted(PostSearchTerm.objects.values_list('post_id', 'field', 'term', 'field_len')),
+                sorted(SearchTermStat.objects.values_list('term', 'df')),
+                sorted(SearchFieldStat.objects.values_list('field', 'doc_count', 'total_length')),
+            )
+
+        published = snapshot()
+        PostSearchTerm.objects.update(field_len=0)
+        SearchTermStat.objects.all().delete()
+        SearchFieldStat.objects.all().delete()
+        import_module('api.migrations.0018_search_stats').backfill_search_stats(apps, None)
+        self.assertEqual(snapshot(), published)
@@ -0,0 +1,62 @@
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+
+from ..models import ProjectCard, SkillInformation
+from .base import APITestCase
+
+
+class RescoreSkillPostsTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.post_ids = [
+            self.publish_personal(self.create_student(student_id), student_id=student_id)
+            for student_id in (20001, 20002, 20003)
+        ]
+        self.expected = dict(SkillInformation.objects.values_list('post_id', 'skill_score'))
+        SkillInformation.objects.update(skill_score=0, keyword_score=0)
+
+    def rescore(self, **options):
+        stdout = StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('rescore_skill_posts', workers=1, chunk_size=2, stdout=stdout, **options)
+        return stdout.getvalue()
+
+    def test_rescore_restores_scores_and_invalidates_list(self):
+        card_versions = dict(ProjectCard.objects.values_list('post_id', 'version'))
+        self.assertEqual(self.list_items({'post_type': 'personal'})['items'][0]['skill_score'], self.expected[self.post_ids[-1]])
+        ProjectCard.objects.update(skill_score=0)
+
+        output = self.rescore()
+
+        self.assertIn('分数变化 3', output)
+        self.assertEqual(dict(SkillInformation.objects.values_list('post_id', 'skill_score')), self.expected)
+        self.assertEqual(dict(ProjectCard.objects.values_list('post_id', 'skill_score')), self.expected)
+        for post_id, version in ProjectCard.objects.values_list('post_id', 'version'):
+            self.assertGreater(version, card_versions[post_id])
+        # 列表缓存已失效，返回重算后的分数
+        response = self.get('/project/list', {'post_type': 'personal'})
+        self.assertEqual(response['X-List-Cache'], 'MISS')
+        self.assertEqual(response.json()['data']['items'][0]['skill_score'], self.expected[self.post_ids[-1]])
+
+    def test_dry_run_writes_nothing(self):
+        output = self.rescore(dry_run=True)
+        self.assertIn('分数变化 3', output)
+        self.assertEqual(set(SkillInformation.objects.values_list('skill_score', flat=True)), {0})
+
+    def test_checkpoint_resumes_after_last_post(self):
+        fd, path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        os.remove(path)
+        self.addCleanup(lambda: os.path.exists(path) and os.remove(path))
+        self.rescore(checkpoint=path)
+        SkillInformation.objects.update(skill_score=0)
+
+        output = self.rescore(checkpoint=path)
+
+        self.assertIn('从断点继续', output)
+        self.assertEqual(set(SkillInformation.objects.values_list('skill_score', flat=True)), {0})
+        self.rescore(checkpoint=path, restart=True)
+        self.assertEqual(dict(SkillInformation.objects.values_list('post_id', 'skill_score')), self.expected)
@@ -0,0 +1,93 @@
+from importlib import import_module
+from io import StringIO
+
+from django.apps import apps
+from django.core.management import call_command
+
+from ..models import PostSearchTerm, SearchFieldStat, SearchTermStat
+from ..utils.search_index import search_post_ids, tokenize
+from .base import APITestCase
+
+
+class TokenizeTests(APITestCase):
+    def test_bigrams_per_run(self):
+        self.assertEqual(tokenize('目标检测, AI'), ['目标', '标检', '检测', 'ai'])
+        self.assertEqual(tokenize('a 语'), [])
+
+    def test_terms_are_normalized(self):
+        # utf8mb4_unicode_ci 下相等的字符串必须归一化为同一词项
+        self.assertEqual(tokenize('２０'), tokenize('20'))
+        self.assertEqual(tokenize('Café'), tokenize('cafe'))
+        self.assertEqual(tokenize('STRASSE'), tokenize('straße'))
+
+
+class SearchIndexTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.teacher = self.create_teacher()
+
+    def search(self, keyword):
+        return [item['post_id'] for item in self.list_items({'search': keyword})['items']]
+
+    def df(self, term):
+        return SearchTermStat.objects.filter(term=term).values_list('df', flat=True).first()
+
+    def index_rows(self):
+        return sorted(PostSearchTerm.objects.values_list('post_id', 'field', 'term', 'tf'))
+
+    def test_publish_indexes_and_search_intersects_terms(self):
+        first = self.publish_research(self.teacher, research_name='小型目标检测')
+        second = self.publish_research(self.teacher, research_name='目标跟踪', outcome='专利')
+        self.assertEqual(self.search('目标'), [second, first])
+        self.assertEqual(self.search('目标检测'), [first])
+        self.assertEqual(self.search('不存在的词'), [])
+        self.assertEqual(self.df('目标'), 2)
+
+    def test_update_reindexes_and_adjusts_stats(self):
+        post_id = self.publish_research(self.teacher, research_name='小型目标检测')
+        self.assertEqual(self.df('检测'), 1)
+
+        self.publish_research(self.teacher, post_id=post_id, research_name='语义分割')
+
+        self.assertIsNone(self.df('检测'))
+        self.assertEqual(self.df('分割'), 1)
+        self.assertEqual(self.search('目标检测'), [])
+        self.assertEqual(self.search('语义'), [post_id])
+
+    def test_equivalent_terms_in_one_post_do_not_collide(self):
+        post_id = self.publish_research(self.teacher, research_name='２０20 Café cafe', outcome='CAFE')
+        terms = list(PostSearchTerm.objects.filter(post_id=post_id, field=PostSearchTerm.FIELD_TITLE).values_list('term', 'tf'))
+        self.assertIn(('ca', 2), terms)
+        self.assertEqual(len(terms), len({term for term, tf in terms}))
+        self.assertEqual(self.search('café'), [post_id])
+
+    def test_single_character_runs_fall_back_to_substring_match(self):
+        post_id = self.publish_research(self.teacher, research_name='C语言编译器')
+        self.publish_research(self.teacher, research_name='语言模型')
+        self.assertIsNone(search_post_ids('c 语言'))
+        self.assertIsNone(search_post_ids('标'))
+        self.assertEqual(self.search('C语言'), [post_id])
+        self.assertEqual(len(self.search('语言')), 2)
+
+    def test_rebuild_matches_incremental_stats(self):
+        self.publish_research(self.teacher, research_name='小型目标检测')
+        self.publish_competition(self.teacher, competition_name='目标检测挑战赛')
+        snapshot = (
+            sorted(SearchTermStat.objects.values_list('term', 'df')),
+            sorted(SearchFieldStat.objects.values_list('field', 'doc_count', 'total_length')),
+        )
+        call_command('rebuild_search_index', stdout=StringIO())
+        self.assertEqual(snapshot, (
+            sorted(SearchTermStat.objects.values_list('term', 'df')),
+            sorted(SearchFieldStat.objects.values_list('field', 'doc_count', 'total_length')),
+        ))
+
+    def test_migration_backfill_matches_publish(self):
+        first = self.publish_research(self.teacher, research_name='小型目标检测')
+        self.publish_personal(self.create_student(), project_experience='Café 推荐系统')
+        snapshot = self.index_rows()
+        PostSearchTerm.objects.all().delete()
+        migration = import_module('api.migrations.0017_postsearchterm')
+        migration.backfill_search_terms(apps, None)
+        self.assertEqual(self.index_rows(), snapshot)
+        self.assertEqual(self.search('目标检测'), [first])
@@ -0,0 +1,56 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from ..models import User, UserSession
+from ..utils.token_cache import token_cache
+from .base import APITestCase
+
+
+class UserSessionTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.register(0, 20001)
+        self.user = User.objects.get(studententity__student_id=20001)
+
+    def test_each_login_gets_its_own_hashed_session(self):
+        first = self.login(0, 20001)
+        second = self.login(0, 20001)
+        self.assertNotEqual(first, second)
+        hashes = set(UserSession.objects.filter(user=self.user).values_list('token_hash', flat=True))
+        self.assertEqual(hashes, {UserSession.hash_token(first), UserSession.hash_token(second)})
+        self.assertFalse(UserSession.objects.filter(token_hash__in=[first, second]).exists())
+        # 多设备登录互不覆盖
+        self.assertEqual(self.get('/auth/profile', token=first).status_code, 200)
+        self.assertEqual(self.get('/auth/profile', token=second).status_code, 200)
+
+    def test_expired_session_is_rejected(self):
+        token = self.login(0, 20001)
+        UserSession.objects.filter(user=self.user).update(expires_at=timezone.now() - timedelta(seconds=1))
+        token_cache.clear()
+        self.assertEqual(self.get('/auth/profile', token=token).status_code, 401)
+
+    def test_purge_expired_sessions(self):
+        live = self.login(0, 20001)
+        self.login(0, 20001)
+        self.login(0, 20001)
+        UserSession.objects.exclude(token_hash=UserSession.hash_token(live)).update(
+            expires_at=timezone.now() - timedelta(days=1)
+        )
+        call_command('purge_expired_sessions', batch_size=1, stdout=StringIO())
+        self.assertEqual(
+            list(UserSession.objects.values_list('token_hash', flat=True)),
+            [UserSession.hash_token(live)]
+        )
+
+    def test_legacy_token_is_cleared_on_login(self):
+        User.objects.filter(pk=self.user.pk).update(token='legacy-token')
+        self.assertEqual(self.get('/auth/profile', token='legacy-token').status_code, 200)
+
+        token = self.login(0, 20001)
+
+        self.assertIsNone(User.objects.get(pk=self.user.pk).token)
+        self.assertEqual(self.get('/auth/profile', token='legacy-token').status_code, 401)
+        self.assertEqual(self.get('/auth/profile', token=token).status_code, 200)
@@ -0,0 +1,41 @@
+from django.core import signing
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from ..models import User
+from ..utils.signed_token import SIGNED_TOKEN_SALT, verify_signed_token
+from .base import APITestCase
+
+
+@override_settings(AUTH_SIGNED_TOKENS=True)
+class SignedTokenTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.token = self.create_student()
+        self.user = User.objects.get(studententity__student_id=20001)
+
+    def test_login_issues_signed_token_verified_without_db(self):
+        self.assertIn(':', self.token)
+        self.assertEqual(verify_signed_token(self.token), (self.user.user_id, 0))
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(verify_signed_token(self.token), (self.user.user_id, 0))
+        self.assertEqual(len(queries.captured_queries), 0)
+        self.assertEqual(self.get('/auth/profile', token=self.token).status_code, 200)
+
+    def test_tampered_token_is_rejected(self):
+        payload = signing.loads(self.token, salt=SIGNED_TOKEN_SALT)
+        payload['idt'] = 1
+        forged = signing.dumps(payload, salt='other-salt', compress=True)
+        self.assertIsNone(verify_signed_token(forged))
+        self.assertIsNone(verify_signed_token(self.token[:-2] + 'xx'))
+
+    def test_expired_token_is_rejected(self):
+        with override_settings(SIGNED_TOKEN_MAX_AGE=-1):
+            self.assertIsNone(verify_signed_token(self.token))
+
+    def test_revoke_tokens_invalidates_issued_tokens(self):
+        self.user.revoke_tokens()
+        self.assertIsNone(verify_signed_token(self.token))
+        self.assertEqual(self.get('/auth/profile', token=self.token).status_code, 401)
+        self.assertEqual(self.get('/auth/profile', token=self.login(0, 20001)).status_code, 200)
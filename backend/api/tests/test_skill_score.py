@@ -0,0 +1,53 @@
+import importlib
+
+from django.apps import apps
+
+from ..models import ProjectCard, SkillInformation
+from ..views.project import calculate_skill_score
+from .base import APITestCase
+
+
+class SkillScoreTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.teacher = self.create_teacher()
+        self.students = [self.create_student(20001), self.create_student(20002)]
+
+    def test_score_persisted_at_publish_and_recomputed_on_update(self):
+        post_id = self.publish_personal(self.students[0], project_experience='深度学习 项目')
+        expected = calculate_skill_score('深度学习 项目', [{'skill_degree': 'skillful'}])
+        skill = SkillInformation.objects.get(post_id=post_id)
+        self.assertEqual(
+            (skill.skill_score, skill.keyword_score, skill.proficiency_score),
+            (expected['total_score'], expected['keyword_score'], expected['proficiency_score'])
+        )
+
+        self.publish_personal(
+            self.students[0], post_id=post_id, project_experience='无',
+            skills=[{'skill_name': 'Python', 'skill_degree': 'known'}]
+        )
+        skill.refresh_from_db()
+        self.assertEqual(skill.skill_score, calculate_skill_score('无', [{'skill_degree': 'known'}])['total_score'])
+        self.assertEqual(self.list_items({'post_type': 'personal'})['items'][0]['skill_score'], skill.skill_score)
+
+    def test_sort_by_skill_score(self):
+        research = self.publish_research(self.teacher)
+        low = self.publish_personal(self.students[0], student_id=20001, project_experience='无',
+                                    skills=[{'skill_name': 'Python', 'skill_degree': 'known'}])
+        high = self.publish_personal(self.students[1], student_id=20002, project_experience='深度学习 机器学习 项目')
+
+        items = self.list_items({'sort': 'skill_score'})['items']
+
+        self.assertEqual([item['post_id'] for item in items], [high, low, research])
+
+    def test_migration_backfill_matches_publish_scoring(self):
+        post_id = self.publish_personal(self.students[0])
+        published = SkillInformation.objects.get(post_id=post_id).skill_score
+        SkillInformation.objects.update(skill_score=0, keyword_score=0, proficiency_score=0)
+        ProjectCard.objects.update(skill_score=None)
+
+        migration = importlib.import_module('api.migrations.0021_skill_score')
+        migration.backfill_skill_scores(apps, None)
+
+        self.assertEqual(SkillInformation.objects.get(post_id=post_id).skill_score, published)
+        self.assertEqual(ProjectCard.objects.get(post_id=post_id).skill_score, published)
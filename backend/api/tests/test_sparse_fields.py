@@ -0,0 +1,36 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from .base import APITestCase
+
+
+class SparseFieldsTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.teacher = self.create_teacher()
+        self.post_id = self.publish_research(self.teacher, research_name='目标检测')
+
+    def test_only_requested_fields_are_returned_and_read(self):
+        with CaptureQueriesContext(connection) as queries:
+            items = self.list_items({'fields': 'title, like_num,bogus'})['items']
+        self.assertEqual(items, [{'post_id': self.post_id, 'title': '目标检测', 'like_num': 0}])
+        card_sql = [query['sql'] for query in queries.captured_queries if 'FROM "Project_card"' in query['sql']]
+        self.assertTrue(card_sql)
+        self.assertNotIn('"attachments"', card_sql[-1])
+
+    def test_unknown_fields_fall_back_to_full_items(self):
+        full = self.list_items()['items']
+        self.assertEqual(self.list_items({'fields': 'bogus'})['items'], full)
+        self.assertIn('attachments', full[0])
+
+    def test_field_selection_is_part_of_cache_key_and_follows_updates(self):
+        self.assertEqual(self.list_items({'fields': 'title'})['items'][0], {'post_id': self.post_id, 'title': '目标检测'})
+        self.assertNotIn('title', self.list_items({'fields': 'like_num'})['items'][0])
+
+        self.publish_research(self.teacher, post_id=self.post_id, research_name='语义分割')
+
+        self.assertEqual(self.list_items({'fields': 'title'})['items'][0]['title'], '语义分割')
+
+    def test_relevance_score_can_be_selected(self):
+        items = self.list_items({'search': '目标检测', 'sort': 'relevance', 'fields': 'relevance_score'})['items']
+        self.assertEqual(set(items[0]), {'post_id', 'relevance_score'})
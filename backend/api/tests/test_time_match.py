@@ -0,0 +1,61 @@
+import time
+from unittest import mock
+
+from .base import APITestCase
+
+
+class TimeMatchBatchTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.teacher = self.create_teacher()
+        self.research = self.publish_research(self.teacher)  # 约 17 周 → 每周 6 小时
+        self.students = [self.create_student(20001 + i) for i in range(3)]
+        self.skill_posts = [
+            self.publish_personal(token, student_id=20001 + i, spend_time=spend_time)
+            for i, (token, spend_time) in enumerate(zip(self.students, ['每周12小时', '每周3小时', '看情况']))
+        ]
+
+    def batch(self, params, token=None):
+        response = self.get('/project/time-match', params, token=token or self.teacher)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()['data']
+
+    def test_matrix_sorted_by_ratio_with_unknown_last(self):
+        data = self.batch({'post_ids': ','.join(map(str, self.skill_posts))})
+        self.assertEqual(len(data['students']), 3)
+        self.assertEqual(
+            [(m['student_post_id'], m['match_ratio']) for m in data['matches']],
+            [(self.skill_posts[0], 2.0), (self.skill_posts[1], 0.5), (self.skill_posts[2], None)]
+        )
+        self.assertFalse(data['students'][2]['parsed'])
+
+    def test_ratio_filters_drop_unknown(self):
+        post_ids = ','.join(map(str, self.skill_posts))
+        data = self.batch({'post_ids': post_ids, 'min_ratio': '1'})
+        self.assertEqual([m['student_post_id'] for m in data['matches']], [self.skill_posts[0]])
+        data = self.batch({'post_ids': post_ids, 'max_ratio': '1'})
+        self.assertEqual([m['student_post_id'] for m in data['matches']], [self.skill_posts[1]])
+        response = self.get('/project/time-match', {'post_ids': post_ids, 'min_ratio': 'x'}, token=self.teacher)
+        self.assertEqual(response.status_code, 400)
+
+    def test_competition_hours_follow_deadline(self):
+        deadline = int(time.time() * 1000) + 20 * 24 * 3600 * 1000  # 3 周内截止 → 每周 10 小时
+        competition = self.publish_competition(self.teacher, deadline=deadline)
+        data = self.batch({'post_ids': str(self.skill_posts[0])})
+        hours = {p['post_id']: p['project_hours_per_week'] for p in data['projects']}
+        self.assertEqual(hours, {self.research: 6, competition: 10})
+
+    def test_applicants_mode_uses_pending_applications(self):
+        response = self.post('/cooperation/apply', {'post_id': self.research}, token=self.students[1])
+        self.assertEqual(response.status_code, 201, response.content)
+        data = self.batch({'applicants': '1'})
+        self.assertEqual([s['post_id'] for s in data['students']], [self.skill_posts[1]])
+
+    def test_students_and_oversized_batches_rejected(self):
+        response = self.get('/project/time-match', {'post_ids': str(self.skill_posts[0])}, token=self.students[0])
+        self.assertEqual(response.status_code, 403)
+        with mock.patch('api.views.project.TIME_MATCH_BATCH_LIMIT', 2):
+            response = self.get(
+                '/project/time-match', {'post_ids': ','.join(map(str, self.skill_posts))}, token=self.teacher
+            )
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,58 @@
+from importlib import import_module
+from unittest import mock
+
+from django.apps import apps
+
+from ..models import ResearchProject
+from .base import RESEARCH_END_MS, RESEARCH_START_MS, APITestCase
+
+DAY_MS = 24 * 3600 * 1000
+
+
+class TimeWindowTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.teacher = self.create_teacher()
+        self.long_research = self.publish_research(self.teacher)  # 17 周
+        self.short_research = self.publish_research(
+            self.teacher, research_name='短期项目',
+            starttime=RESEARCH_END_MS + 10 * DAY_MS, endtime=RESEARCH_END_MS + 24 * DAY_MS
+        )  # 2 周
+        self.competition = self.publish_competition(self.teacher, deadline=RESEARCH_END_MS)
+
+    def stored(self, post_id):
+        return ResearchProject.objects.values_list('duration_weeks', 'hours_per_week').get(post_id=post_id)
+
+    def filtered(self, **params):
+        return [item['post_id'] for item in self.list_items(params)['items']]
+
+    def test_duration_and_hours_stored_on_publish_and_update(self):
+        self.assertEqual(self.stored(self.long_research), (17, 6))
+        self.assertEqual(self.stored(self.short_research), (2, 10))
+        self.publish_research(
+            self.teacher, post_id=self.long_research,
+            starttime=RESEARCH_START_MS, endtime=RESEARCH_START_MS + 60 * DAY_MS
+        )
+        self.assertEqual(self.stored(self.long_research), (9, 8))
+
+    def test_window_filters(self):
+        self.assertEqual(self.filtered(active_from=RESEARCH_END_MS + 5 * DAY_MS), [self.short_research])
+        self.assertEqual(self.filtered(active_to=RESEARCH_END_MS), [self.long_research])
+        self.assertEqual(
+            self.filtered(active_from=RESEARCH_START_MS, active_to=RESEARCH_END_MS + 30 * DAY_MS),
+            [self.short_research, self.long_research]
+        )
+        self.assertEqual(self.filtered(start_after=RESEARCH_START_MS + DAY_MS), [self.short_research])
+        self.assertEqual(self.filtered(deadline_before=RESEARCH_END_MS), [self.competition])
+        self.assertEqual(self.filtered(deadline_before=RESEARCH_START_MS), [])
+        # 科研与竞赛条件同时传入时结果为空
+        self.assertEqual(self.filtered(start_after=RESEARCH_START_MS, deadline_before=RESEARCH_END_MS), [])
+        self.assertEqual(self.get('/project/list', {'active_from': 'soon'}).status_code, 400)
+
+    def test_migration_backfill_matches_publish(self):
+        published = {post_id: self.stored(post_id) for post_id in (self.long_research, self.short_research)}
+        ResearchProject.objects.update(duration_weeks=None, hours_per_week=None)
+        migration = import_module('api.migrations.0028_project_time_window')
+        with mock.patch.object(migration, 'BATCH_SIZE', 1):
+            migration.backfill_research_hours(apps, None)
+        self.assertEqual({post_id: self.stored(post_id) for post_id in published}, published)
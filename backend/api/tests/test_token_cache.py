@@ -0,0 +1,101 @@
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from ..models import User
+from ..utils.token_cache import TokenCache, token_cache
+from .base import APITestCase
+
+
+class TokenCacheTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = User(user_id=42, identity=0)
+
+    def shared_cache(self):
+        """文件缓存模拟跨进程共享的缓存后端（如 Redis）"""
+        location = tempfile.mkdtemp()
+        return override_settings(CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location
+        }})
+
+    def test_lru_eviction(self):
+        tokens = TokenCache(max_size=2, ttl=60)
+        tokens.set('a', self.user)
+        tokens.set('b', self.user)
+        tokens.get('a')
+        tokens.set('c', self.user)
+        self.assertIsNotNone(tokens.get('a'))
+        self.assertIsNone(tokens.get('b'))
+        self.assertEqual(tokens.stats()['evictions'], 1)
+
+    def test_entry_expires_after_ttl(self):
+        tokens = TokenCache(max_size=10, ttl=60)
+        with mock.patch('api.utils.token_cache.time.monotonic', return_value=1000.0):
+            tokens.set('a', self.user)
+        with mock.patch('api.utils.token_cache.time.monotonic', return_value=1059.0):
+            self.assertIsNotNone(tokens.get('a'))
+        with mock.patch('api.utils.token_cache.time.monotonic', return_value=1061.0):
+            self.assertIsNone(tokens.get('a'))
+
+    def test_set_ttl_shortens_entry_lifetime(self):
+        tokens = TokenCache(max_size=10, ttl=60)
+        with mock.patch('api.utils.token_cache.time.monotonic', return_value=1000.0):
+            tokens.set('a', self.user, ttl=5)
+        with mock.patch('api.utils.token_cache.time.monotonic', return_value=1004.0):
+            self.assertIsNotNone(tokens.get('a'))
+        with mock.patch('api.utils.token_cache.time.monotonic', return_value=1006.0):
+            self.assertIsNone(tokens.get('a'))
+
+    def test_invalidate_user_reaches_other_workers(self):
+        # 两个实例模拟两个 worker，共享同一个 Django 缓存
+        with self.shared_cache():
+            worker_a = TokenCache()
+            worker_b = TokenCache()
+            worker_a.set('token', self.user)
+            worker_b.set('token', self.user)
+
+            worker_a.invalidate_user(self.user.user_id)
+
+            self.assertIsNone(worker_a.get('token'))
+            self.assertIsNone(worker_b.get('token'))
+            worker_b.set('token', self.user)
+            self.assertIsNotNone(worker_b.get('token'))
+
+    def test_evicted_revocation_marker_is_a_miss(self):
+        with self.shared_cache():
+            tokens = TokenCache()
+            tokens.set('token', self.user)
+            cache.clear()
+            self.assertIsNone(tokens.get('token'))
+
+    def test_local_memory_cache_skips_revocation_marker(self):
+        tokens = TokenCache()
+        with mock.patch('api.utils.token_cache.cache') as shared:
+            tokens.set('token', self.user)
+            self.assertIsNotNone(tokens.get('token'))
+            tokens.invalidate_user(self.user.user_id)
+        self.assertEqual(shared.method_calls, [])
+        self.assertIsNone(tokens.get('token'))
+
+
+class TokenCacheAuthTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.token = self.create_student()
+
+    def test_repeated_requests_skip_session_lookup(self):
+        self.assertEqual(self.get('/auth/profile', token=self.token).status_code, 200)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.get('/auth/profile', token=self.token).status_code, 200)
+        self.assertFalse(any('User_session' in query['sql'] for query in queries.captured_queries))
+        self.assertGreaterEqual(token_cache.stats()['hits'], 1)
+
+    def test_deactivated_user_is_rejected_despite_cache(self):
+        self.assertEqual(self.get('/auth/profile', token=self.token).status_code, 200)
+        User.objects.get(studententity__student_id=20001).deactivate()
+        self.assertEqual(self.get('/auth/profile', token=self.token).status_code, 401)
@@ -0,0 +1,55 @@
+import json
+import os
+import tempfile
+
+from django.test import SimpleTestCase
+
+from ..utils.word_weights import WordWeightError, WordWeightStore, parse_word_weights
+
+
+class WordWeightStoreTests(SimpleTestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.txt')
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+    def write(self, content):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(content if isinstance(content, str) else json.dumps(content, ensure_ascii=False))
+
+    def test_reloads_on_change_and_keeps_last_good_version(self):
+        self.write('/* 注释 */ [{"name": "python", "base_weight": 2}]')
+        store = WordWeightStore(self.path, check_interval=0)
+        first = store.current()
+        self.assertEqual(first.matcher.score('Python'), 2.0)
+
+        self.write([{'name': 'python', 'base_weight': 5}])
+        second = store.current()
+        self.assertNotEqual(second.version, first.version)
+        self.assertEqual(second.matcher.score('python'), 5.0)
+        self.assertEqual(store.reloads, 2)
+
+        self.write('[{"name": "python", "base_weight": "高"}]')
+        with self.assertLogs('api.utils.word_weights', 'ERROR'):
+            self.assertIs(store.current(), second)
+        self.assertIn('base_weight', store.status()['last_error'])
+
+        # 改回有效内容后恢复，版本号只由内容决定
+        self.write([{'name': 'python', 'base_weight': 5}])
+        store.check(force=True)
+        self.assertEqual(store.current().version, second.version)
+        self.assertIsNone(store.last_error)
+
+    def test_missing_file_keeps_empty_snapshot(self):
+        store = WordWeightStore(self.path + '.missing', check_interval=60)
+        with self.assertLogs('api.utils.word_weights', 'ERROR'):
+            self.assertIsNone(store.current().version)
+        self.assertEqual(store.current().matcher.score('python'), 0.0)
+        self.assertIn('无法读取', store.last_error)
+
+    def test_parse_validation(self):
+        with self.assertRaises(WordWeightError):
+            parse_word_weights('{"name": "x"}')
+        with self.assertRaises(WordWeightError):
+            parse_word_weights('[{"name": "x", "aliases": "y"}]')
+        self.assertEqual(len(parse_word_weights('[{"name": "x", "aliases": ["y"], "base_weight": 1.5}]')), 1)
@@ -4,7 +4,7 @@ from .views import (
     create_conversation, list_conversations, close_conversation,
     send_message, list_messages, auto_reply_settings,
     tags,
-    list_projects, get_project_detail, update_recruit_status, time_match_overview, time_match_overview,
+    list_projects, get_project_detail, update_recruit_status, time_match_overview, time_match_overview, recommend_projects, suggest_assignment,
     publish_research, publish_competition, publish_personal,
     upload_attachment, download_attachment
 )
@@ -59,6 +59,8 @@ urlpatterns = [
     path('project/detail/<int:post_id>', get_project_detail, name='get_project_detail'),    # 项目详情
     path('project/update-recruit-status/<int:post_id>', update_recruit_status, name='update_recruit_status'),  # 更新招募状态
     path('project/time-match', time_match_overview, name='time_match_overview'),    # 可投入时间匹配度
+    path('project/recommend/<int:post_id>', recommend_projects, name='recommend_projects'),  # 为你推荐
+    path('project/assignment', suggest_assignment, name='suggest_assignment'),  # 招募分配建议
     
     # 项目发布接口
     path('publish/research', publish_research, name='publish_research'),   # 科研项目发布
@@ -0,0 +1,137 @@
+"""
+招募分配优化
+学生 → 项目的带容量最大权匹配（运输问题），用最小费用流的逐次最短路求解：
+项目数远少于学生数，增广路只在项目节点上找（学生在项目间的调剂作为项目之间的边），
+每对项目之间的最优调剂学生用惰性堆维护，边权取堆顶并缓存，每次增广只刷新路径上项目的行；
+最短路用带势能的 Dijkstra（约化费用非负），到达汇点即停止，单次增广 O(P^2 + 路径长度 * P log S)
+"""
+import heapq
+
+INF = float('inf')
+EPS = 1e-12
+
+
+def assign_students(weights, capacities):
+    """求总匹配度最大的分配
+
+    Args:
+        weights: 每个学生可分配项目的匹配度，[{项目下标: 匹配度}, ...]（稀疏，缺省表示不可分配）
+        capacities: 每个项目可招人数
+    返回:
+        (assignment, total)：assignment[i] 为学生 i 分到的项目下标（未分配为 None），total 为总匹配度
+    """
+    project_count = len(capacities)
+    sink = project_count  # 汇点：有剩余名额的项目连向汇点，费用 0
+    remaining = list(capacities)
+    assignment = [None] * len(weights)
+
+    # 费用取收益的相反数。未分配学生进入项目 p：每个项目一个小顶堆 (-匹配度, 学生)
+    entry_heaps = [[] for _ in range(project_count)]
+    for student, edges in enumerate(weights):
+        for project, weight in edges.items():
+            entry_heaps[project].append((-weight, student))
+    for heap in entry_heaps:
+        heapq.heapify(heap)
+
+    # 已在项目 a 的学生调剂到项目 b：费用 w[a] - w[b]，每对 (a, b) 一个小顶堆
+    move_heaps = [[[] for _ in range(project_count)] for _ in range(project_count)]
+
+    def entry_top(project):
+        heap = entry_heaps[project]
+        while heap and assignment[heap[0][1]] is not None:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def move_top(source, target):
+        # 惰性删除：堆顶学生已不在 source 时弹出；学生回到 source 时会重新入堆
+        heap = move_heaps[source][target]
+        while heap and assignment[heap[0][1]] != source:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def refresh_row(project):
+        move_tops[project] = [
+            move_top(project, target) if target != project else None
+            for target in range(project_count)
+        ]
+
+    entry_tops = [entry_top(project) for project in range(project_count)]
+    move_tops = [[None] * project_count for _ in range(project_count)]
+
+    # 势能：未分配学生（源点）恒为 0；初始只有进入边，取各项目最小进入费用即可使约化费用非负
+    potential = [top[0] if top else 0.0 for top in entry_tops] + [0.0]
+    potential[sink] = min(potential[:sink], default=0.0)
+
+    while True:
+        # Dijkstra（约化费用），parent 为前驱项目，None 表示直接从未分配学生进入
+        dist = [INF] * (project_count + 1)
+        parent = [None] * (project_count + 1)
+        done = [False] * (project_count + 1)
+        queue = []
+        for project, top in enumerate(entry_tops):
+            if top is not None:
+                dist[project] = top[0] - potential[project]
+                queue.append((dist[project], project))
+        heapq.heapify(queue)
+        while queue:
+            d, node = heapq.heappop(queue)
+            if done[node]:
+                continue
+            done[node] = True
+            if node == sink:
+                break
+            base = d + potential[node]
+            if remaining[node] > 0:
+                nd = base - potential[sink]
+                if nd < dist[sink]:
+                    dist[sink] = nd
+                    parent[sink] = node
+                    heapq.heappush(queue, (nd, sink))
+            for target, top in enumerate(move_tops[node]):
+                if top is None or done[target]:
+                    continue
+                nd = base + top[0] - potential[target]
+                if nd < dist[target] - EPS:
+                    dist[target] = nd
+                    parent[target] = node
+                    heapq.heappush(queue, (nd, target))
+
+        # 实际费用 = 约化距离 + 汇点势能；费用非负表示再分配一人不会增加总匹配度
+        if not done[sink] or dist[sink] + potential[sink] >= -EPS:
+            break
+        bound = dist[sink]
+        for node in range(project_count + 1):
+            potential[node] += min(dist[node], bound)
+
+        # 沿增广路回溯：先确定每一步移动的学生，再统一修改
+        end = parent[sink]
+        steps = []
+        project = end
+        while project is not None:
+            previous = parent[project]
+            top = entry_tops[project] if previous is None else move_tops[previous][project]
+            steps.append((top[1], project))
+            project = previous
+        touched = set()
+        for student, project in steps:
+            if assignment[student] is not None:
+                touched.add(assignment[student])
+            assignment[student] = project
+            touched.add(project)
+            edges = weights[student]
+            base = edges[project]
+            for target, weight in edges.items():
+                if target != project:
+                    heapq.heappush(move_heaps[project][target], (base - weight, student))
+        remaining[end] -= 1
+
+        # 只有路径上项目的成员变化：刷新这些行的缓存堆顶，以及堆顶学生已被分配的进入边
+        for project in touched:
+            refresh_row(project)
+        entered = steps[-1][0]
+        for project, top in enumerate(entry_tops):
+            if top is not None and top[1] == entered:
+                entry_tops[project] = entry_top(project)
+
+    total = sum(weights[student][project] for student, project in enumerate(assignment) if project is not None)
+    return assignment, total
@@ -4,7 +4,12 @@
 from functools import wraps
 from rest_framework.response import Response
 from rest_framework import status
-from ..models.user import User
+from django.utils import timezone
+from ..models.user import User, StudentEntity, TeacherEntity
+from ..models.session import UserSession
+from .token_cache import token_cache
+from .session_tracker import session_touch_buffer
+from .signed_token import signed_tokens_enabled, looks_like_signed_token, verify_signed_token
 
 
 def get_user_from_token(request):
@@ -15,9 +20,15 @@ def get_user_from_token(request):
     或
     Authorization: <token>
     
+    同一请求内的重复调用直接复用首次结果；跨请求通过 token_cache 避免重复查库
+    
     返回:
         User对象 或 None
     """
+    request_user = getattr(request, '_token_user', None)
+    if request_user is not None:
+        return request_user
+    
     auth_header = request.headers.get('Authorization', '')
     
     if not auth_header:
@@ -29,11 +40,65 @@ def get_user_from_token(request):
     if not token:
         return None
     
-    try:
-        user = User.objects.get(token=token)
+    if signed_tokens_enabled() and looks_like_signed_token(token):
+        user = get_user_from_signed_token(token)
+        if user is not None:
+            request._token_user = user
         return user
-    except User.DoesNotExist:
+    
+    user = token_cache.get(token)
+    if user is None:
+        user, ttl = get_user_from_session(token)
+        if user is None:
+            return None
+        token_cache.set(token, user, ttl=ttl)
+    
+    # last_seen 批量写回，不在每个请求上单独 UPDATE
+    session_id = getattr(user, '_session_id', None)
+    if session_id:
+        session_touch_buffer.touch(session_id)
+    
+    request._token_user = user
+    return user
+
+
+def get_user_from_session(token):
+    """按 token 摘要查找未过期的会话（唯一索引）
+    
+    找不到时回退到旧版 User.token 列，兼容迁移前签发且该用户此后未再登录的 token
+    （每次登录签发新 token 时都会清空该列）
+    
+    返回:
+        (User对象, 剩余有效秒数) 或 (None, None)
+    """
+    now = timezone.now()
+    session = UserSession.objects.select_related('user').filter(
+        token_hash=UserSession.hash_token(token),
+        expires_at__gt=now
+    ).first()
+    if session:
+        user = session.user
+        user._session_id = session.id
+        return user, (session.expires_at - now).total_seconds()
+    
+    user = User.objects.filter(token=token).first()
+    return user, None
+
+
+def get_user_from_signed_token(token):
+    """校验签名令牌并构造 User 对象（不查库）
+    
+    仅 user_id 和 identity 来自令牌，其余字段为延迟加载：
+    视图访问其他字段时才会查库，save() 也只会写回已加载的字段
+    
+    返回:
+        User对象 或 None
+    """
+    claims = verify_signed_token(token)
+    if claims is None:
         return None
+    user_id, identity = claims
+    return User.from_db('default', ['user_id', 'identity'], [user_id, identity])
 
 
 def login_required(view_func):
@@ -62,6 +127,98 @@ def login_required(view_func):
     return wrapper
 
 
+class IdentityContext:
+    """请求级身份上下文
+    
+    保存当前用户及其对应的学生/教师实体，每个请求只解析一次
+    """
+    
+    def __init__(self, user, student=None, teacher=None):
+        self.user = user
+        self.student = student
+        self.teacher = teacher
+    
+    @property
+    def student_id(self):
+        return self.student.student_id if self.student else None
+    
+    @property
+    def teacher_id(self):
+        return self.teacher.teacher_id if self.teacher else None
+    
+    @property
+    def name(self):
+        if self.student:
+            return self.student.student_name
+        if self.teacher:
+            return self.teacher.teacher_name
+        return None
+
+
+def get_identity(request):
+    """获取当前请求的身份上下文（User + 学生/教师实体）
+    
+    用户来自 get_user_from_token（命中缓存时不查库），
+    实体按身份只查一次对应的表，结果缓存在 request 上
+    
+    返回:
+        IdentityContext对象 或 None（未登录）
+    """
+    identity = getattr(request, '_identity', None)
+    if identity is not None:
+        return identity
+    
+    user = get_user_from_token(request)
+    if not user:
+        return None
+    
+    student = None
+    teacher = None
+    if user.identity == 0:  # 学生
+        student = StudentEntity.objects.filter(user_id=user.user_id).first()
+        if student:
+            student.user = user
+    elif user.identity == 1:  # 教师
+        teacher = TeacherEntity.objects.filter(user_id=user.user_id).first()
+        if teacher:
+            teacher.user = user
+    
+    identity = IdentityContext(user, student=student, teacher=teacher)
+    request._identity = identity
+    return identity
+
+
+def identity_required(view_func):
+    """身份上下文装饰器
+    
+    解析当前用户的学生/教师实体并附加到 request.identity 上
+    需要先通过 @login_required
+    
+    使用方式:
+    @api_view(['POST'])
+    @login_required
+    @identity_required
+    def my_view(request):
+        student = request.identity.student  # 学生实体（非学生为None）
+        teacher = request.identity.teacher  # 教师实体（非教师为None）
+        ...
+    """
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        identity = get_identity(request)
+        
+        if not identity:
+            return Response(
+                {'code': 401, 'msg': '未登录或token无效'},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+        
+        request.identity = identity
+        return view_func(request, *args, **kwargs)
+    
+    return wrapper
+
+
 def check_conversation_permission(user, conversation):
     """检查用户是否有权限访问该会话
     
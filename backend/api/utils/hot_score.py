@@ -0,0 +1,54 @@
+"""
+热度分
+按互动数加权取对数，再加上发布时间相对固定纪元的偏移：越新的发布基础分越高，
+相当于旧发布随时间衰减；分数只在互动数变化时才需要重算，可以落库并建索引
+
+    hot = log10(max(1, 1*点赞 + 2*收藏 + 3*评论)) + (create_time - 纪元) / HOT_SCORE_DECAY_SECONDS
+
+即每晚发布 HOT_SCORE_DECAY_SECONDS 秒，等价于互动数多一个数量级
+"""
+import math
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import transaction
+
+from ..models import PostEntity
+
+HOT_SCORE_EPOCH = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+HOT_WEIGHTS = {'like_num': 1, 'favorite_num': 2, 'comment_num': 3}
+
+
+def compute_hot_score(like_num, favorite_num, comment_num, create_time):
+    """计算单条发布的热度分"""
+    engagement = (
+        HOT_WEIGHTS['like_num'] * like_num +
+        HOT_WEIGHTS['favorite_num'] * favorite_num +
+        HOT_WEIGHTS['comment_num'] * comment_num
+    )
+    decay_seconds = getattr(settings, 'HOT_SCORE_DECAY_SECONDS', 3 * 24 * 3600)
+    if create_time.tzinfo is None:
+        create_time = create_time.replace(tzinfo=dt_timezone.utc)
+    age_bonus = (create_time - HOT_SCORE_EPOCH).total_seconds() / decay_seconds
+    return round(math.log10(max(1, engagement)) + age_bonus, 6)
+
+
+def refresh_hot_scores(post_ids):
+    """重算一批发布的热度分并清除待重算标记，返回分数有变化的条数
+
+    先清标记再读计数（同一事务内）：期间有新的点赞/收藏/评论会重新置位标记，下次任务再算
+    """
+    with transaction.atomic():
+        PostEntity.objects.filter(post_id__in=post_ids).update(hot_dirty=False)
+        changed = []
+        for post_id, like_num, favorite_num, comment_num, create_time, old_score in (
+            PostEntity.objects.filter(post_id__in=post_ids).values_list(
+                'post_id', 'like_num', 'favorite_num', 'comment_num', 'create_time', 'hot_score'
+            )
+        ):
+            score = compute_hot_score(like_num, favorite_num, comment_num, create_time)
+            if score != old_score:
+                changed.append(PostEntity(post_id=post_id, hot_score=score))
+        if changed:
+            PostEntity.objects.bulk_update(changed, ['hot_score'], batch_size=500)
+    return len(changed)
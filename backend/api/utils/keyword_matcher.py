@@ -0,0 +1,85 @@
+"""
+关键词多模式匹配
+把词权重表（name + aliases）编译为 Aho–Corasick 自动机，一次扫描文本即可得到命中的词组
+"""
+from collections import deque
+
+
+class KeywordMatcher:
+    """词权重表编译后的多模式匹配器
+
+    - 每个词组（name 及其 aliases）对应一个组号，命中任一模式即视为该组命中
+    - 同一组命中多次只计一次分（与逐词 `in` 判断后 break 的语义一致）
+    - 匹配不区分大小写：模式和文本都先 lower()
+    """
+
+    def __init__(self, entries):
+        self.weights = []
+        self._goto = [{}]     # state -> {char: next_state}
+        self._fail = [0]
+        self._output = [()]   # state -> 在此结束的组号（含 fail 链上的输出）
+        for group, item in enumerate(entries):
+            self.weights.append(float(item.get('base_weight', 0)))
+            keywords = [item.get('name', '')] + list(item.get('aliases') or [])
+            for keyword in keywords:
+                if keyword:
+                    self._add(keyword.lower(), group)
+        self._build()
+
+    @property
+    def group_count(self):
+        return len(self.weights)
+
+    def _add(self, pattern, group):
+        state = 0
+        for ch in pattern:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        if group not in self._output[state]:
+            self._output[state] = self._output[state] + (group,)
+
+    def _build(self):
+        """按 BFS 计算 fail 指针，并把 fail 链上的输出合并到当前状态"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                inherited = self._output[self._fail[next_state]]
+                if inherited:
+                    merged = self._output[next_state] + tuple(
+                        group for group in inherited if group not in self._output[next_state]
+                    )
+                    self._output[next_state] = merged
+
+    def match_groups(self, text):
+        """返回文本命中的组号集合"""
+        hits = set()
+        if not text:
+            return hits
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for ch in text.lower():
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                hits.update(output[state])
+        return hits
+
+    def score(self, text):
+        """命中词组的权重之和（按组号顺序累加，与逐组遍历的结果一致）"""
+        return sum((self.weights[group] for group in sorted(self.match_groups(text))), 0.0)
@@ -0,0 +1,159 @@
+"""
+项目列表响应缓存
+列表结果只取决于查询参数和调用方的可见性分组（匿名/学生/教师/管理员），与具体用户无关；
+按 (分组, 规范化参数) 缓存，写操作通过递增分组的代数（generation）整体失效
+"""
+import hashlib
+import json
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from rest_framework.response import Response
+
+from .auth import get_user_from_token
+
+LIST_CACHE_KEY = 'project_list:{group}:{generation}:{digest}'
+LIST_GENERATION_KEY = 'project_list:gen:{group}'
+
+# 调用方分组 -> 能看到的 visibility 取值（None 表示不限）
+# visibility: 0=公开（所有人可见）, 1=仅教师可见, 2=仅学生可见
+VISIBILITY_BY_GROUP = {
+    'anonymous': (0,),
+    'student': (0, 2),
+    'teacher': (0, 1),
+    'admin': None,
+}
+VISIBILITY_GROUPS = tuple(VISIBILITY_BY_GROUP)
+
+# post 的 visibility -> 能看到它的分组
+GROUPS_BY_VISIBILITY = {
+    visibility: tuple(
+        group for group, visible in VISIBILITY_BY_GROUP.items()
+        if visible is None or visibility in visible
+    )
+    for visibility in (0, 1, 2)
+}
+
+
+# 参与缓存键的查询参数及默认值（None 表示无默认值，未传时不计入）
+LIST_PARAMS = {
+    'post_type': None,
+    'user_id': None,
+    'search': None,
+    'sort': None,
+    'cursor': None,
+    'facets': None,
+    'fields': None,
+    'min_hours': None,
+    'max_hours': None,
+    'active_from': None,
+    'active_to': None,
+    'start_after': None,
+    'deadline_before': None,
+    'page': '1',
+    'page_size': '20',
+}
+
+
+def visibility_group(user):
+    """调用方的可见性分组（列表缓存键和查询的可见权限过滤都由它决定）"""
+    if user is None:
+        return 'anonymous'
+    return {0: 'student', 1: 'teacher', 2: 'admin'}.get(user.identity, 'anonymous')
+
+
+def filter_visible(queryset, group, field='visibility'):
+    """按调用方分组过滤 post 的可见权限"""
+    visible = VISIBILITY_BY_GROUP[group]
+    if visible is None:
+        return queryset
+    return queryset.filter(**{f'{field}__in': visible})
+
+
+def normalize_list_params(query_params):
+    """规范化查询参数：只保留影响结果的参数，去掉首尾空白，补齐默认值"""
+    params = {}
+    for name, default in LIST_PARAMS.items():
+        value = query_params.get(name)
+        if value is None:
+            value = default
+        else:
+            value = value.strip()
+            # 空搜索词等价于不搜索；cursor 为空字符串表示游标模式首页，需要保留
+            if value == '' and name != 'cursor':
+                value = default
+            elif name in ('facets', 'fields'):
+                value = ','.join(sorted({part.strip() for part in value.split(',') if part.strip()}))
+        if value is not None:
+            params[name] = value
+    return params
+
+
+def _generation(group):
+    return cache.get(LIST_GENERATION_KEY.format(group=group), 0)
+
+
+def _bump_generations(groups):
+    for group in groups:
+        key = LIST_GENERATION_KEY.format(group=group)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # 代数不存在（首次或被驱逐），从 1 开始即可与旧键区分
+            cache.set(key, _generation(group) + 1, None)
+
+
+def invalidate_project_list(visibility=None):
+    """使能看到该可见性的分组的列表缓存失效；visibility 为 None 时全部失效
+
+    在事务提交后执行，避免提交前有请求把旧数据重新写入缓存
+    """
+    groups = GROUPS_BY_VISIBILITY.get(visibility, VISIBILITY_GROUPS)
+    transaction.on_commit(lambda: _bump_generations(groups))
+
+
+def cache_project_list(view_func):
+    """列表接口响应缓存装饰器（放在 @api_view 之下）
+
+    只缓存成功响应（DRF Response 缓存 data，预先拼接的 HttpResponse 缓存正文）；
+    响应头 X-List-Cache 标记 HIT/MISS
+    """
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        ttl = getattr(settings, 'PROJECT_LIST_CACHE_TTL', 30)
+        if ttl <= 0:
+            return view_func(request, *args, **kwargs)
+
+        group = visibility_group(get_user_from_token(request))
+        params = normalize_list_params(request.GET)
+        digest = hashlib.sha1(
+            json.dumps(params, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        ).hexdigest()
+        key = LIST_CACHE_KEY.format(group=group, generation=_generation(group), digest=digest)
+
+        cached = cache.get(key)
+        if cached is not None:
+            kind, payload = cached
+            if kind == 'raw':
+                response = HttpResponse(payload, content_type='application/json')
+            else:
+                response = Response(payload)
+            response['X-List-Cache'] = 'HIT'
+            return response
+
+        response = view_func(request, *args, **kwargs)
+        if response.status_code == 200:
+            if isinstance(response, Response):
+                # 未渲染的 DRF 响应缓存 data，且只缓存业务成功的结果
+                if isinstance(response.data, dict) and response.data.get('code') == 200:
+                    cache.set(key, ('data', response.data), ttl)
+            else:
+                # 已拼接好的 JSON 正文直接缓存字节
+                cache.set(key, ('raw', response.content), ttl)
+        response['X-List-Cache'] = 'MISS'
+        return response
+
+    return wrapper
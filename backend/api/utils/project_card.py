@@ -0,0 +1,219 @@
+"""
+项目卡片读模型维护
+批量拼装 Project_card 行、按 post 刷新、同步互动计数，以及按 (post_id, version) 缓存的 JSON 片段
+"""
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from ..models import (
+    PostEntity, ResearchProject, CompetitionProject, SkillInformation,
+    PostDirection, PostStack, StudentSkill, PostAttachment, ProjectCard
+)
+
+
+def build_project_cards(post_ids):
+    """为一批 post 拼装卡片（不写库）
+
+    缺少详情记录（或标题/发布人为空）的 post 不生成卡片，列表中同样不展示
+
+    返回:
+        {post_id: ProjectCard}
+    """
+    posts = list(PostEntity.objects.filter(post_id__in=post_ids))
+    if not posts:
+        return {}
+    post_ids = [post.post_id for post in posts]
+
+    # 按类型分组，批量查询各类项目
+    post_ids_by_type = {1: [], 2: [], 3: []}
+    for post in posts:
+        post_ids_by_type.setdefault(post.post_type, []).append(post.post_id)
+
+    research_dict = {
+        r.post_id: r for r in ResearchProject.objects.filter(
+            post_id__in=post_ids_by_type[1]
+        ).select_related('teacher')
+    } if post_ids_by_type[1] else {}
+    competition_dict = {
+        c.post_id: c for c in CompetitionProject.objects.filter(
+            post_id__in=post_ids_by_type[2]
+        ).select_related('teacher')
+    } if post_ids_by_type[2] else {}
+    skill_dict = {
+        s.post_id: s for s in SkillInformation.objects.filter(
+            post_id__in=post_ids_by_type[3]
+        ).select_related('student')
+    } if post_ids_by_type[3] else {}
+
+    # 方向（个人技能）
+    directions_dict = {}
+    for post_id, name in PostDirection.objects.filter(
+        post_id__in=post_ids
+    ).values_list('post_id', 'direction__direction_name'):
+        directions_dict.setdefault(post_id, []).append(name)
+
+    # 技术栈（科研项目，每个 post 只保存一个技术栈字符串）
+    stacks_dict = dict(
+        PostStack.objects.filter(post_id__in=post_ids).values_list('post_id', 'stack__tech_stack')
+    )
+
+    # 技能（个人技能）
+    skills_dict = {}
+    for post_id, skill_name, proficiency in StudentSkill.objects.filter(
+        post_id__in=post_ids
+    ).values_list('post_id', 'skill__skill_name', 'proficiency'):
+        skills_dict.setdefault(post_id, []).append({
+            'skill_name': skill_name,
+            'proficiency': proficiency,  # 0=skillful, 1=known
+            'skill_degree': 'skillful' if proficiency == 0 else 'known'
+        })
+
+    # 附件摘要
+    attachments_dict = {}
+    for att in PostAttachment.objects.filter(
+        post_id__in=post_ids,
+        is_active=True
+    ).order_by('-created_at'):
+        attachments_dict.setdefault(att.post_id, []).append({
+            'attachment_id': str(att.id),
+            'original_filename': att.original_filename,
+            'file_size': att.file_size,
+            'formatted_size': att.formatted_size,
+            'mime_type': att.mime_type,
+            'file_type': att.file_type,
+            'download_url': att.download_url,
+            'created_at': att.created_at.isoformat() if att.created_at else None
+        })
+
+    cards = {}
+    for post in posts:
+        card = ProjectCard(
+            post_id=post.post_id,
+            post_type=post.post_type,
+            create_time=post.create_time,
+            visibility=post.visibility,
+            recruit_status=post.recruit_status,
+            like_num=post.like_num,
+            favorite_num=post.favorite_num,
+            comment_num=post.comment_num,
+            attachments=attachments_dict.get(post.post_id, []),
+        )
+        if post.post_type == 1:  # 科研项目
+            research = research_dict.get(post.post_id)
+            if not research:
+                continue
+            card.title = research.research_name
+            card.publisher_name = research.teacher.teacher_name
+            card.tech_stack = stacks_dict.get(post.post_id, '')
+        elif post.post_type == 2:  # 竞赛项目
+            competition = competition_dict.get(post.post_id)
+            if not competition:
+                continue
+            card.title = competition.competition_name
+            card.publisher_name = competition.teacher.teacher_name
+        elif post.post_type == 3:  # 个人技能
+            skill = skill_dict.get(post.post_id)
+            if not skill:
+                continue
+            # 个人技能使用专业方向作为标题，如果有方向则使用第一个，否则使用学生姓名
+            directions = directions_dict.get(post.post_id, [])
+            card.title = directions[0] if directions else skill.student.student_name
+            card.publisher_name = skill.student.student_name
+            card.majors = directions
+            card.skills = skills_dict.get(post.post_id, [])
+            card.skill_score = skill.skill_score
+        else:
+            continue
+
+        # 如果无法获取项目信息，不生成卡片
+        if not card.title or not card.publisher_name:
+            continue
+        cards[post.post_id] = card
+    return cards
+
+
+def refresh_project_cards(post_ids):
+    """重建一批 post 的卡片（先删后插，同一事务）
+
+    返回:
+        {post_id: ProjectCard}
+    """
+    post_ids = list(post_ids)
+    if not post_ids:
+        return {}
+    cards = build_project_cards(post_ids)
+    with transaction.atomic():
+        # 版本号在旧卡片基础上递增，旧片段缓存随之失效
+        old_versions = dict(
+            ProjectCard.objects.filter(post_id__in=post_ids).values_list('post_id', 'version')
+        )
+        for post_id, card in cards.items():
+            card.version = old_versions.get(post_id, 0) + 1
+        ProjectCard.objects.filter(post_id__in=post_ids).delete()
+        ProjectCard.objects.bulk_create(cards.values(), batch_size=500)
+    return cards
+
+
+def update_cards(post_ids, **values):
+    """直接更新卡片字段并递增版本号"""
+    return ProjectCard.objects.filter(post_id__in=post_ids).update(version=F('version') + 1, **values)
+
+
+def bump_card_counters(post_id, **deltas):
+    """与 PostEntity 的计数同步增减卡片计数，如 bump_card_counters(1, like_num=1)"""
+    update_cards([post_id], **{field: F(field) + delta for field, delta in deltas.items()})
+
+
+FRAGMENT_CACHE_KEY = 'project_card_fragment:{post_id}:{version}:{fields}'
+
+
+def serialize_card(card, fields=None):
+    """卡片序列化为列表条目的 JSON 片段（格式与 DRF JSONRenderer 输出一致）"""
+    return json.dumps(card.to_list_item(fields), ensure_ascii=False, separators=(',', ':'))
+
+
+def load_card_fragments(rows, fields=None):
+    """批量获取列表条目的 JSON 片段
+
+    先按 (post_id, version, 字段集) 批量读缓存，只有未命中的卡片才查库序列化，
+    且只读取所选字段需要的列；version 为 None 表示卡片缺失，当场补建
+
+    Args:
+        rows: [(post_id, version), ...]
+        fields: 需要返回的字段集合，None 表示全部
+    返回:
+        {post_id: fragment}，无法生成卡片的 post 不在结果中
+    """
+    field_set = 'all' if fields is None else ','.join(sorted(fields))
+    keys = {
+        post_id: FRAGMENT_CACHE_KEY.format(post_id=post_id, version=version, fields=field_set)
+        for post_id, version in rows if version is not None
+    }
+    cached = cache.get_many(keys.values()) if keys else {}
+    fragments = {
+        post_id: cached[key] for post_id, key in keys.items() if key in cached
+    }
+
+    missing_ids = [post_id for post_id, version in rows if post_id not in fragments]
+    if not missing_ids:
+        return fragments
+
+    cards_query = ProjectCard.objects.filter(post_id__in=missing_ids)
+    if fields is not None:
+        cards_query = cards_query.only(*ProjectCard.columns_for(fields))
+    cards = {card.post_id: card for card in cards_query}
+    absent_ids = [post_id for post_id in missing_ids if post_id not in cards]
+    if absent_ids:
+        cards.update(refresh_project_cards(absent_ids))
+
+    to_cache = {}
+    for post_id, card in cards.items():
+        fragment = serialize_card(card, fields)
+        fragments[post_id] = fragment
+        to_cache[FRAGMENT_CACHE_KEY.format(post_id=post_id, version=card.version, fields=field_set)] = fragment
+    cache.set_many(to_cache, getattr(settings, 'PROJECT_CARD_FRAGMENT_TTL', 3600))
+    return fragments
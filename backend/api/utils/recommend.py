@@ -0,0 +1,145 @@
+"""
+学生 ↔ 项目双向推荐
+post × 词项稀疏矩阵保存在 Post_term（行已 L2 归一化）；推荐时只取与源 post 有共同词项的行，
+按词项累加权重乘积（稀疏向量点积）得到余弦相似度，取 top-k 并按 post 缓存
+"""
+import heapq
+import math
+import re
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db import transaction
+
+from ..models import PostDirection, PostStack, PostTag, StudentSkill, PostTerm
+from .list_cache import filter_visible
+
+RECOMMEND_CACHE_KEY = 'post_recommend:{generation}:{post_id}:{group}'
+RECOMMEND_GENERATION_KEY = 'post_recommend:gen'
+RECOMMEND_TOP_K = 50  # 缓存的候选条数，请求的 k 不超过该值
+RECOMMEND_CACHE_TTL = 600
+
+# 词项权重：熟练技能 > 了解技能；技术栈、方向与熟练技能同权，标签作为弱信号
+SKILL_TERM_WEIGHTS = {0: 2.0, 1: 1.0}  # 0=skillful, 1=known
+STACK_TERM_WEIGHT = 2.0
+DIRECTION_TERM_WEIGHT = 2.0
+TAG_TERM_WEIGHT = 1.0
+
+# 推荐方向：个人技能 -> 科研/竞赛项目；科研/竞赛项目 -> 个人技能
+RECOMMEND_TARGET_TYPES = {1: (3,), 2: (3,), 3: (1, 2)}
+
+# 技术栈按常见分隔符拆成单个技术，与学生技能名称对齐
+_TECH_SPLIT_RE = re.compile(r'[,，、/;；|+\s]+')
+
+
+def tech_terms(text):
+    """技能/技术栈名称归一化为词项（小写，技术栈按分隔符拆分）"""
+    return [f't:{name.lower()}'[:255] for name in _TECH_SPLIT_RE.split(text or '') if name]
+
+
+def build_post_vectors(post_ids):
+    """为一批 post 生成归一化词项向量
+
+    返回:
+        {post_id: {term: weight}}，没有任何词项的 post 不在结果中
+    """
+    raw = defaultdict(lambda: defaultdict(float))
+    for post_id, skill_name, proficiency in StudentSkill.objects.filter(
+        post_id__in=post_ids
+    ).values_list('post_id', 'skill__skill_name', 'proficiency'):
+        for term in tech_terms(skill_name):
+            raw[post_id][term] = max(raw[post_id][term], SKILL_TERM_WEIGHTS.get(proficiency, 1.0))
+    for post_id, stack_name in PostStack.objects.filter(
+        post_id__in=post_ids
+    ).values_list('post_id', 'stack__tech_stack'):
+        for term in tech_terms(stack_name):
+            raw[post_id][term] = max(raw[post_id][term], STACK_TERM_WEIGHT)
+    for post_id, direction_id in PostDirection.objects.filter(
+        post_id__in=post_ids
+    ).values_list('post_id', 'direction_id'):
+        raw[post_id][f'd:{direction_id}'] = DIRECTION_TERM_WEIGHT
+    for post_id, tag_id in PostTag.objects.filter(
+        post_id__in=post_ids
+    ).values_list('post_id', 'tag_id'):
+        raw[post_id][f'g:{tag_id}'] = TAG_TERM_WEIGHT
+
+    vectors = {}
+    for post_id, weights in raw.items():
+        norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+        if norm:
+            vectors[post_id] = {term: weight / norm for term, weight in weights.items()}
+    return vectors
+
+
+def _bump_generation():
+    try:
+        cache.incr(RECOMMEND_GENERATION_KEY)
+    except ValueError:
+        cache.set(RECOMMEND_GENERATION_KEY, cache.get(RECOMMEND_GENERATION_KEY, 0) + 1, None)
+
+
+def refresh_post_terms(post_ids):
+    """重建一批 post 的词项向量（先删后插，同一事务），提交后使推荐缓存失效"""
+    post_ids = list(post_ids)
+    if not post_ids:
+        return 0
+    vectors = build_post_vectors(post_ids)
+    rows = [
+        PostTerm(post_id=post_id, term=term, weight=weight)
+        for post_id, weights in vectors.items()
+        for term, weight in weights.items()
+    ]
+    with transaction.atomic():
+        PostTerm.objects.filter(post_id__in=post_ids).delete()
+        PostTerm.objects.bulk_create(rows, batch_size=1000)
+        # 任一 post 向量变化都可能改变其他 post 的 top-k
+        invalidate_recommendations()
+    return len(rows)
+
+
+def invalidate_recommendations():
+    """使全部推荐缓存失效（在事务提交后执行），用于词项以外影响候选范围的变更，如招募状态"""
+    transaction.on_commit(_bump_generation)
+
+
+def _top_matches(post, group):
+    """计算 post 的前 RECOMMEND_TOP_K 个匹配：[(post_id, score), ...]，按分数倒序"""
+    target_types = RECOMMEND_TARGET_TYPES.get(post.post_type)
+    if not target_types:
+        return []
+    source = dict(PostTerm.objects.filter(post=post).values_list('term', 'weight'))
+    if not source:
+        return []
+
+    candidates = filter_visible(
+        PostTerm.objects.filter(term__in=list(source), post__post_type__in=target_types),
+        group,
+        field='post__visibility'
+    ).exclude(post=post)
+    if 3 not in target_types:
+        # 只向学生推荐仍在招募的项目
+        candidates = candidates.filter(post__recruit_status=0)
+
+    scores = defaultdict(float)
+    for post_id, term, weight in candidates.values_list('post_id', 'term', 'weight').iterator():
+        scores[post_id] += source[term] * weight
+    # 同分时新发布的 post_id 更大，排在前面
+    return heapq.nlargest(RECOMMEND_TOP_K, ((round(score, 6), post_id) for post_id, score in scores.items()))
+
+
+def recommend_posts(post, group, k=10):
+    """返回与 post 最匹配的 k 个 post：[(post_id, score), ...]
+
+    Args:
+        post: 源 PostEntity
+        group: 调用方可见性分组（决定候选范围，也是缓存键的一部分）
+        k: 返回条数，不超过 RECOMMEND_TOP_K
+    """
+    key = RECOMMEND_CACHE_KEY.format(
+        generation=cache.get(RECOMMEND_GENERATION_KEY, 0), post_id=post.post_id, group=group
+    )
+    matches = cache.get(key)
+    if matches is None:
+        matches = [(post_id, score) for score, post_id in _top_matches(post, group)]
+        cache.set(key, matches, RECOMMEND_CACHE_TTL)
+    return matches[:k]
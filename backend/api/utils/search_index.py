@@ -0,0 +1,294 @@
+"""
+发布信息搜索索引
+字符二元组切分、按 post 重建倒排索引、按词项求交集、BM25 相关度打分
+"""
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F
+
+from ..models import (
+    ResearchProject, CompetitionProject, SkillInformation,
+    PostDirection, PostStack, PostTag, PostSearchTerm,
+    SearchTermStat, SearchFieldStat
+)
+
+# BM25 参数
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 字段权重：标题 > 方向/技术栈 > 标签 > 正文
+FIELD_BOOSTS = {
+    PostSearchTerm.FIELD_TITLE: 3.0,
+    PostSearchTerm.FIELD_DIRECTION: 2.0,
+    PostSearchTerm.FIELD_STACK: 2.0,
+    PostSearchTerm.FIELD_TAG: 1.5,
+    PostSearchTerm.FIELD_TEXT: 1.0,
+}
+
+# 连续的字母/数字/汉字视为一段，标点和空白作为分隔
+_RUN_RE = re.compile(r'[^\W_]+')
+
+
+def normalize_text(text):
+    """词项归一化：NFKC（全角转半角等）+ 大小写折叠 + 去掉重音符号
+
+    索引表的 term 列使用 utf8mb4_unicode_ci 排序规则，'２０'/'20'、'fé'/'fe' 这类字符串比较相等，
+    不归一化会让同一 post 生成两个"相等"的词项，触发唯一约束冲突
+    """
+    text = unicodedata.normalize('NFKC', text).casefold()
+    decomposed = unicodedata.normalize('NFKD', text)
+    # 去掉组合字符后重新组合（保证韩文等音节还原）
+    return unicodedata.normalize(
+        'NFC', ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    )
+
+
+def _runs(text):
+    """归一化后按标点和空白切成连续片段"""
+    if not text:
+        return []
+    return _RUN_RE.findall(normalize_text(text))
+
+
+def tokenize(text):
+    """把文本切分为字符二元组列表（保留重复，用于统计词频）
+
+    单个字符的片段不产生词项，查询时由调用方回退到模糊匹配
+    """
+    terms = []
+    for run in _runs(text):
+        terms.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return terms
+
+
+def collect_post_fields(post_ids):
+    """批量读取 post 的可搜索文本
+
+    返回:
+        {post_id: {field: [text, ...]}}
+    """
+    fields = defaultdict(lambda: defaultdict(list))
+
+    for post_id, name, outcome in ResearchProject.objects.filter(
+        post_id__in=post_ids
+    ).values_list('post_id', 'research_name', 'outcome'):
+        fields[post_id][PostSearchTerm.FIELD_TITLE].append(name)
+        fields[post_id][PostSearchTerm.FIELD_TEXT].append(outcome)
+
+    for post_id, name, team_require, reward in CompetitionProject.objects.filter(
+        post_id__in=post_ids
+    ).values_list('post_id', 'competition_name', 'team_require', 'reward'):
+        fields[post_id][PostSearchTerm.FIELD_TITLE].append(name)
+        fields[post_id][PostSearchTerm.FIELD_TEXT].extend([team_require, reward])
+
+    for post_id, project_experience in SkillInformation.objects.filter(
+        post_id__in=post_ids
+    ).values_list('post_id', 'project_experience'):
+        fields[post_id][PostSearchTerm.FIELD_TEXT].append(project_experience)
+
+    for post_id, name in PostDirection.objects.filter(
+        post_id__in=post_ids
+    ).values_list('post_id', 'direction__direction_name'):
+        fields[post_id][PostSearchTerm.FIELD_DIRECTION].append(name)
+
+    for post_id, name in PostStack.objects.filter(
+        post_id__in=post_ids
+    ).values_list('post_id', 'stack__tech_stack'):
+        fields[post_id][PostSearchTerm.FIELD_STACK].append(name)
+
+    for post_id, name in PostTag.objects.filter(
+        post_id__in=post_ids
+    ).values_list('post_id', 'tag__name'):
+        fields[post_id][PostSearchTerm.FIELD_TAG].append(name)
+
+    return fields
+
+
+def build_index_rows(post_ids):
+    """为一批 post 生成倒排索引行"""
+    rows = []
+    for post_id, field_texts in collect_post_fields(post_ids).items():
+        for field, texts in field_texts.items():
+            counts = Counter()
+            for text in texts:
+                counts.update(tokenize(text))
+            field_len = sum(counts.values())
+            rows.extend(
+                PostSearchTerm(post_id=post_id, field=field, term=term, tf=tf, field_len=field_len)
+                for term, tf in counts.items()
+            )
+    return rows
+
+
+def _summarize_rows(rows):
+    """把索引行汇总为 ({post_id: 词项集合}, {(post_id, field): 字段长度})"""
+    post_terms = defaultdict(set)
+    field_lengths = {}
+    for post_id, field, term, field_len in rows:
+        post_terms[post_id].add(term)
+        field_lengths[(post_id, field)] = field_len
+    return post_terms, field_lengths
+
+
+def _apply_stats_delta(old_rows, new_rows):
+    """根据一批 post 索引的新旧差异，增量更新文档频率和字段统计"""
+    old_terms, old_lengths = _summarize_rows(old_rows)
+    new_terms, new_lengths = _summarize_rows(new_rows)
+
+    df_delta = Counter()
+    for post_id in set(old_terms) | set(new_terms):
+        before = old_terms.get(post_id, set())
+        after = new_terms.get(post_id, set())
+        for term in after - before:
+            df_delta[term] += 1
+        for term in before - after:
+            df_delta[term] -= 1
+
+    field_delta = defaultdict(lambda: [0, 0])  # field -> [doc_count, total_length]
+    for (post_id, field), length in old_lengths.items():
+        field_delta[field][0] -= 1
+        field_delta[field][1] -= length
+    for (post_id, field), length in new_lengths.items():
+        field_delta[field][0] += 1
+        field_delta[field][1] += length
+    field_delta[SearchFieldStat.FIELD_ALL][0] += len(new_terms) - len(old_terms)
+
+    new_stat_terms = [term for term, delta in df_delta.items() if delta > 0]
+    SearchTermStat.objects.bulk_create(
+        [SearchTermStat(term=term, df=0) for term in new_stat_terms],
+        ignore_conflicts=True,
+        batch_size=1000
+    )
+    terms_by_delta = defaultdict(list)
+    for term, delta in df_delta.items():
+        if delta:
+            terms_by_delta[delta].append(term)
+    for delta, terms in terms_by_delta.items():
+        SearchTermStat.objects.filter(term__in=terms).update(df=F('df') + delta)
+    dropped_terms = [term for term, delta in df_delta.items() if delta < 0]
+    if dropped_terms:
+        SearchTermStat.objects.filter(term__in=dropped_terms, df__lte=0).delete()
+
+    for field, (doc_delta, length_delta) in field_delta.items():
+        if not doc_delta and not length_delta:
+            continue
+        SearchFieldStat.objects.get_or_create(field=field)
+        SearchFieldStat.objects.filter(field=field).update(
+            doc_count=F('doc_count') + doc_delta,
+            total_length=F('total_length') + length_delta
+        )
+
+
+def index_posts(post_ids):
+    """重建一批 post 的索引（先删后插，同一事务），并增量维护 BM25 统计"""
+    post_ids = list(post_ids)
+    if not post_ids:
+        return 0
+    rows = build_index_rows(post_ids)
+    with transaction.atomic():
+        old_rows = list(
+            PostSearchTerm.objects.filter(post_id__in=post_ids)
+            .values_list('post_id', 'field', 'term', 'field_len')
+        )
+        PostSearchTerm.objects.filter(post_id__in=post_ids).delete()
+        PostSearchTerm.objects.bulk_create(rows, batch_size=1000)
+        _apply_stats_delta(
+            old_rows,
+            [(row.post_id, row.field, row.term, row.field_len) for row in rows]
+        )
+    return len(rows)
+
+
+def rebuild_search_stats():
+    """根据现有索引全量重算文档频率和字段统计"""
+    term_rows = (
+        PostSearchTerm.objects.values('term')
+        .annotate(df=Count('post_id', distinct=True))
+        .order_by()
+    )
+    field_totals = defaultdict(lambda: [0, 0])
+    for _, field, field_len in (
+        PostSearchTerm.objects.values_list('post_id', 'field', 'field_len').distinct().order_by()
+    ):
+        field_totals[field][0] += 1
+        field_totals[field][1] += field_len
+    doc_count = PostSearchTerm.objects.values('post_id').distinct().count()
+
+    with transaction.atomic():
+        SearchTermStat.objects.all().delete()
+        SearchTermStat.objects.bulk_create(
+            [SearchTermStat(term=row['term'], df=row['df']) for row in term_rows],
+            batch_size=1000
+        )
+        SearchFieldStat.objects.all().delete()
+        SearchFieldStat.objects.bulk_create(
+            [SearchFieldStat(field=SearchFieldStat.FIELD_ALL, doc_count=doc_count)] +
+            [
+                SearchFieldStat(field=field, doc_count=count, total_length=length)
+                for field, (count, length) in field_totals.items()
+            ]
+        )
+
+
+def search_terms(keyword):
+    """关键词切分后的去重词项"""
+    return set(tokenize(keyword))
+
+
+def score_posts(keyword, post_ids):
+    """BM25 相关度打分（按字段加权求和）
+
+    文档频率和平均字段长度读取预先维护的统计表，不在查询时聚合
+
+    返回:
+        {post_id: score}
+    """
+    terms = search_terms(keyword)
+    post_ids = list(post_ids)
+    if not terms or not post_ids:
+        return {}
+
+    field_stats = {stat.field: stat for stat in SearchFieldStat.objects.all()}
+    all_stat = field_stats.get(SearchFieldStat.FIELD_ALL)
+    total_docs = all_stat.doc_count if all_stat else 0
+    idf = {
+        term: math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+        for term, df in SearchTermStat.objects.filter(term__in=terms).values_list('term', 'df')
+    }
+
+    scores = defaultdict(float)
+    for post_id, field, term, tf, field_len in PostSearchTerm.objects.filter(
+        term__in=terms, post_id__in=post_ids
+    ).values_list('post_id', 'field', 'term', 'tf', 'field_len'):
+        stat = field_stats.get(field)
+        avg_len = stat.avg_length if stat and stat.avg_length > 0 else max(field_len, 1)
+        norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * field_len / avg_len)
+        scores[post_id] += FIELD_BOOSTS.get(field, 1.0) * idf.get(term, 0.0) * tf * (BM25_K1 + 1) / norm
+    return scores
+
+
+def search_post_ids(keyword):
+    """按关键词求各词项的交集
+
+    只要求二元组都出现在同一 post 中，不校验它们在原文中是否相邻，
+    因此结果是模糊匹配的超集（如搜 '目标检测' 也会命中同时含 '目标'、'标检'、'检测' 但不连续的文本）
+
+    返回:
+        post_id 子查询；关键词中含单个字符的片段（如 'c 语言' 中的 'c'）或切不出二元组时返回 None，
+        由调用方回退到模糊匹配，避免单字被静默丢弃
+    """
+    runs = _runs(keyword)
+    if not runs or any(len(run) < 2 for run in runs):
+        return None
+    terms = search_terms(keyword)
+    return (
+        PostSearchTerm.objects.filter(term__in=terms)
+        .values('post_id')
+        .annotate(matched=Count('term', distinct=True))
+        .filter(matched=len(terms))
+        .values('post_id')
+    )
@@ -0,0 +1,43 @@
+"""
+会话活跃时间批量写回
+鉴权时只在内存中记录被使用的会话，按固定间隔用一条 UPDATE 刷新 last_seen
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.utils import timezone
+
+
+class SessionTouchBuffer:
+    """last_seen 写缓冲"""
+
+    def __init__(self, flush_interval=60):
+        self.flush_interval = flush_interval
+        self._pending = set()
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def touch(self, session_id):
+        """记录一次会话使用，到达刷新间隔时批量写库"""
+        with self._lock:
+            self._pending.add(session_id)
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+        if due:
+            self.flush()
+
+    def flush(self):
+        """把缓冲中的会话 last_seen 更新为当前时间"""
+        with self._lock:
+            session_ids = self._pending
+            self._pending = set()
+            self._last_flush = time.monotonic()
+        if not session_ids:
+            return 0
+        from ..models.session import UserSession
+        return UserSession.objects.filter(id__in=session_ids).update(last_seen=timezone.now())
+
+
+session_touch_buffer = SessionTouchBuffer(
+    flush_interval=getattr(settings, 'SESSION_LAST_SEEN_FLUSH_INTERVAL', 60)
+)
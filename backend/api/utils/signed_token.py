@@ -0,0 +1,80 @@
+"""
+签名访问令牌
+user_id、identity、token_version 使用 SECRET_KEY 做 HMAC 签名并带过期时间，
+校验时无需查库；吊销通过递增 User.token_version 实现，版本号走缓存
+"""
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+
+SIGNED_TOKEN_SALT = 'api.auth.signed-token'
+TOKEN_VERSION_CACHE_KEY = 'auth:token_version:{user_id}'
+
+
+def signed_tokens_enabled():
+    """是否启用签名令牌模式"""
+    return getattr(settings, 'AUTH_SIGNED_TOKENS', False)
+
+
+def make_signed_token(user):
+    """为用户签发签名令牌"""
+    payload = {
+        'uid': user.user_id,
+        'idt': user.identity,
+        'ver': user.token_version,
+    }
+    return signing.dumps(payload, salt=SIGNED_TOKEN_SALT, compress=True)
+
+
+def looks_like_signed_token(token):
+    """签名令牌包含 ':' 分隔符，旧的随机令牌（token_urlsafe）不会包含"""
+    return ':' in token
+
+
+def get_token_version(user_id):
+    """获取用户当前令牌版本（优先读缓存），用户不存在返回 None"""
+    key = TOKEN_VERSION_CACHE_KEY.format(user_id=user_id)
+    version = cache.get(key)
+    if version is None:
+        from ..models.user import User
+        version = User.objects.filter(user_id=user_id).values_list('token_version', flat=True).first()
+        if version is None:
+            return None
+        cache.set(key, version, getattr(settings, 'TOKEN_VERSION_CACHE_TTL', 60))
+    return version
+
+
+def set_token_version(user_id, version):
+    """令牌版本变更后刷新缓存"""
+    cache.set(
+        TOKEN_VERSION_CACHE_KEY.format(user_id=user_id),
+        version,
+        getattr(settings, 'TOKEN_VERSION_CACHE_TTL', 60)
+    )
+
+
+def verify_signed_token(token):
+    """校验签名令牌
+
+    返回:
+        (user_id, identity) 或 None（签名无效、已过期或已吊销）
+    """
+    try:
+        payload = signing.loads(
+            token,
+            salt=SIGNED_TOKEN_SALT,
+            max_age=getattr(settings, 'SIGNED_TOKEN_MAX_AGE', 7 * 24 * 3600)
+        )
+    except signing.BadSignature:  # SignatureExpired 是 BadSignature 的子类
+        return None
+
+    try:
+        user_id = int(payload['uid'])
+        identity = int(payload['idt'])
+        version = int(payload['ver'])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    if get_token_version(user_id) != version:
+        return None
+    return user_id, identity
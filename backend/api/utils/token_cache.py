@@ -0,0 +1,160 @@
+"""
+token -> User 进程内缓存
+LRU + TTL，支持按 token / 用户失效，并记录命中统计
+"""
+import copy
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+
+# 共享缓存中的用户吊销标记：每个 worker 命中本地条目时比对，用户失效时重新生成
+TOKEN_CACHE_VERSION_KEY = 'auth:token_cache_version:{user_id}'
+
+
+class TokenCache:
+    """有界的 LRU + TTL 缓存
+
+    - key 为 token，value 为 User 对象
+    - 超过 max_size 时淘汰最久未使用的条目
+    - 条目存活超过 ttl 秒后视为失效
+    - 维护 user_id -> tokens 反向索引，便于用户维度失效
+    - 条目记录写入时的用户吊销标记（共享缓存），命中时标记已变化则视为失效，
+      使其他 worker 上的 invalidate_user 也能生效；标记被驱逐同样视为失效。
+      默认缓存为 LocMemCache 时标记无法跨进程，不做比对，其他 worker 最多在 ttl 后才失效
+    """
+
+    def __init__(self, max_size=1024, ttl=300):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()  # token -> (expires_at, user, version)
+        self._user_tokens = {}         # user_id -> set(token)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, token):
+        """命中时返回 User 副本，未命中/过期/已被吊销返回 None"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is not None and entry[0] <= now:
+                self._remove(token)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+        expires_at, user, version = entry
+        if self._shared_cache() and cache.get(self._version_key(user.user_id)) != version:
+            with self._lock:
+                if self._entries.get(token) is entry:
+                    self._remove(token)
+                self.misses += 1
+            return None
+        with self._lock:
+            if token in self._entries:
+                self._entries.move_to_end(token)
+            self.hits += 1
+        # 返回副本，避免并发请求共享同一个可变模型实例
+        return copy.copy(user)
+
+    def set(self, token, user, ttl=None):
+        """写入缓存，ttl 可进一步缩短条目存活时间（如会话即将过期）"""
+        if not token or user is None or self.max_size <= 0:
+            return
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        version = self._current_version(user.user_id) if self._shared_cache() else None
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            if token in self._entries:
+                self._remove(token)
+            self._entries[token] = (expires_at, copy.copy(user), version)
+            self._user_tokens.setdefault(user.user_id, set()).add(token)
+            while len(self._entries) > self.max_size:
+                oldest_token = next(iter(self._entries))
+                self._remove(oldest_token)
+                self.evictions += 1
+
+    def invalidate_token(self, token):
+        """使单个 token 失效"""
+        with self._lock:
+            if token in self._entries:
+                self._remove(token)
+                self.invalidations += 1
+
+    def invalidate_user(self, user_id):
+        """使某个用户的全部缓存 token 失效（token 轮换、停用、删除时调用）
+
+        本进程直接删除条目，其他 worker 通过共享缓存中的吊销标记在下次命中时发现
+        """
+        if self._shared_cache():
+            cache.set(self._version_key(user_id), uuid.uuid4().hex, self.ttl)
+        with self._lock:
+            for token in list(self._user_tokens.get(user_id, ())):
+                self._remove(token)
+                self.invalidations += 1
+
+    def clear(self):
+        """清空缓存（不重置统计）"""
+        with self._lock:
+            self._entries.clear()
+            self._user_tokens.clear()
+
+    def stats(self):
+        """返回命中统计"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
+
+    @staticmethod
+    def _shared_cache():
+        """默认缓存是否跨进程共享；进程内 LocMemCache 无法把吊销标记传给其他 worker，跳过标记读写"""
+        return not isinstance(caches['default'], LocMemCache)
+
+    @staticmethod
+    def _version_key(user_id):
+        return TOKEN_CACHE_VERSION_KEY.format(user_id=user_id)
+
+    def _current_version(self, user_id):
+        """读取用户的吊销标记，不存在时初始化
+
+        标记的存活时间与条目 ttl 相同：标记过期或被驱逐时，已有条目比对失败，只会多一次查库
+        """
+        key = self._version_key(user_id)
+        cache.add(key, uuid.uuid4().hex, self.ttl)
+        return cache.get(key)
+
+    def _remove(self, token):
+        """删除条目并维护反向索引（调用方需持有锁）"""
+        entry = self._entries.pop(token, None)
+        if entry is None:
+            return
+        user_id = entry[1].user_id
+        tokens = self._user_tokens.get(user_id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._user_tokens[user_id]
+
+
+token_cache = TokenCache(
+    max_size=getattr(settings, 'TOKEN_CACHE_MAX_SIZE', 1024),
+    ttl=getattr(settings, 'TOKEN_CACHE_TTL', 300),
+)
@@ -0,0 +1,143 @@
+"""
+关键词权重表（热加载）
+按 mtime/size 周期检查 word_weight.txt，内容哈希作为版本号；
+新内容校验并编译成功后整体替换，失败时继续使用上一个可用版本
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import namedtuple
+
+from django.conf import settings
+
+from .keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORD_WEIGHT_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), 'data', 'word_weight.txt'
+)
+
+# 一个已编译的词表版本；整体替换以保证读者看到的 entries/matcher 属于同一版本
+WordWeightSnapshot = namedtuple('WordWeightSnapshot', ['version', 'entries', 'matcher', 'loaded_at'])
+
+
+class WordWeightError(ValueError):
+    """词表解析或校验失败"""
+
+
+def _strip_json_comments(content):
+    """移除简单的 /* ... */ 注释，便于解析为 JSON"""
+    return re.sub(r'/\*.*?\*/', '', content, flags=re.S)
+
+
+def parse_word_weights(content):
+    """解析并校验词表内容，返回词组列表；格式错误时抛出 WordWeightError"""
+    try:
+        entries = json.loads(_strip_json_comments(content))
+    except json.JSONDecodeError as e:
+        raise WordWeightError(f'JSON 解析失败: {e}') from e
+    if not isinstance(entries, list):
+        raise WordWeightError('词表必须是数组')
+    for index, item in enumerate(entries):
+        if not isinstance(item, dict):
+            raise WordWeightError(f'第 {index + 1} 项不是对象')
+        if not isinstance(item.get('name'), str) or not item['name'].strip():
+            raise WordWeightError(f'第 {index + 1} 项缺少 name')
+        aliases = item.get('aliases') or []
+        if not isinstance(aliases, list) or not all(isinstance(alias, str) for alias in aliases):
+            raise WordWeightError(f'第 {index + 1} 项 aliases 必须是字符串数组')
+        weight = item.get('base_weight', 0)
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)):
+            raise WordWeightError(f'第 {index + 1} 项 base_weight 必须是数字')
+    return entries
+
+
+class WordWeightStore:
+    """进程内的词表版本管理
+
+    - current() 最多每 check_interval 秒 stat 一次文件，文件变化时重新加载
+    - 版本号为文件内容 sha256 的前 12 位，各 worker 读同一文件即得到同一版本
+    - 加载失败记录 last_error 并保留旧版本，不会把所有评分清零
+    """
+
+    def __init__(self, path, check_interval=5):
+        self.path = path
+        self.check_interval = check_interval
+        self._snapshot = WordWeightSnapshot(None, [], KeywordMatcher([]), None)
+        self._file_stamp = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+        self.last_error = None
+        self.reloads = 0
+
+    def current(self):
+        """返回当前可用的词表版本"""
+        if time.monotonic() >= self._next_check:
+            self.check()
+        return self._snapshot
+
+    def check(self, force=False):
+        """检查文件是否变化，变化时重新加载；返回是否切换了版本"""
+        # 其他线程正在检查时直接使用旧版本
+        if not self._lock.acquire(blocking=force or self._snapshot.version is None):
+            return False
+        try:
+            self._next_check = time.monotonic() + self.check_interval
+            try:
+                stat = os.stat(self.path)
+            except OSError as e:
+                self._record_error(f'无法读取词表文件: {e}')
+                return False
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if stamp == self._file_stamp and not force:
+                return False
+            try:
+                with open(self.path, 'rb') as f:
+                    raw = f.read()
+                version = hashlib.sha256(raw).hexdigest()[:12]
+                if version == self._snapshot.version:
+                    # 内容未变（如只是 touch，或改坏后又改回）
+                    self._file_stamp = stamp
+                    self.last_error = None
+                    return False
+                entries = parse_word_weights(raw.decode('utf-8'))
+                matcher = KeywordMatcher(entries)
+            except (OSError, UnicodeDecodeError, WordWeightError) as e:
+                # 记下失败的文件状态，文件再次变化前不重复解析
+                self._file_stamp = stamp
+                self._record_error(str(e))
+                return False
+            self._snapshot = WordWeightSnapshot(version, entries, matcher, time.time())
+            self._file_stamp = stamp
+            self.last_error = None
+            self.reloads += 1
+            logger.info('词表已加载，版本 %s，共 %d 组', version, len(entries))
+            return True
+        finally:
+            self._lock.release()
+
+    def _record_error(self, message):
+        self.last_error = message
+        logger.error('词表加载失败，继续使用版本 %s: %s', self._snapshot.version, message)
+
+    def status(self):
+        """返回当前版本信息（用于健康检查）"""
+        snapshot = self.current()
+        return {
+            'version': snapshot.version,
+            'groups': len(snapshot.entries),
+            'loaded_at': snapshot.loaded_at,
+            'reloads': self.reloads,
+            'last_error': self.last_error,
+        }
+
+
+word_weight_store = WordWeightStore(
+    getattr(settings, 'WORD_WEIGHT_FILE', DEFAULT_WORD_WEIGHT_FILE),
+    check_interval=getattr(settings, 'WORD_WEIGHT_CHECK_INTERVAL', 5),
+)
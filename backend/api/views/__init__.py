@@ -13,7 +13,7 @@ from .conversation import (
     auto_reply_settings
 )
 from .tag import tags
-from .project import list_projects, get_project_detail, update_recruit_status, publish_research, publish_competition, publish_personal, time_match_overview
+from .project import list_projects, get_project_detail, update_recruit_status, publish_research, publish_competition, publish_personal, time_match_overview, recommend_projects, suggest_assignment
 from .attachment import upload_attachment, download_attachment
 
 __all__ = [
@@ -42,5 +42,7 @@ __all__ = [
     'upload_attachment',
     'download_attachment',
     'time_match_overview',
+    'recommend_projects',
+    'suggest_assignment',
     'user_profile',
 ]
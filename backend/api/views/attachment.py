@@ -14,6 +14,8 @@ from rest_framework import status
 from rest_framework.parsers import MultiPartParser, FormParser
 from ..models import PostAttachment, PostEntity
 from ..utils.auth import login_required, get_user_from_token
+from ..utils.project_card import refresh_project_cards
+from ..utils.list_cache import invalidate_project_list
 
 
 def format_file_size(size_bytes):
@@ -216,6 +218,11 @@ def upload_attachment(request):
         attachment.download_url = download_url
         attachment.save(update_fields=['download_url'])
         
+        # 附件摘要在列表卡片中展示，需要同步
+        if post:
+            refresh_project_cards([post.post_id])
+            invalidate_project_list(post.visibility)
+        
         return Response(
             {
                 'code': 200,
@@ -7,9 +7,8 @@ from ..serializers import (
     RegisterResponseSerializer,
     LoginResponseSerializer
 )
-from ..models import StudentEntity, TeacherEntity, User, TeacherStudentCooperation
-from ..utils.auth import login_required, get_user_from_token
-from django.db.models import Q, Count
+from ..models import StudentEntity, TeacherEntity, User, TeacherCooperationStats
+from ..utils.auth import login_required, identity_required
 
 @api_view(['POST'])
 def register(request):
@@ -70,7 +69,7 @@ def login(request):
     if serializer.is_valid():
         user = serializer.validated_data['user']
         # 生成新的 token
-        token = user.generate_token()
+        token = user.generate_token(device=request.headers.get('User-Agent', ''))
         
         response_serializer = LoginResponseSerializer({
             'user_id': user.user_id,
@@ -83,8 +82,17 @@ def login(request):
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+def get_teacher_cooperation_summary(teacher):
+    """读取教师合作统计（按主键取一行），返回 (总数, 已确认数, 成功率)"""
+    stats = TeacherCooperationStats.objects.filter(teacher_id=teacher.teacher_id).first()
+    if not stats:
+        return 0, 0, 0.0
+    return stats.total, stats.confirmed, stats.success_rate
+
+
 @api_view(['GET', 'PUT'])
 @login_required
+@identity_required
 def user_profile(request):
     """获取/更新用户资料接口
     
@@ -97,13 +105,14 @@ def user_profile(request):
         "past_achievements": "xxx"  # 仅教师可编辑
     }
     """
-    user = get_user_from_token(request)
+    user = request.user
+    identity = request.identity
     
     if request.method == 'GET':
         # 获取用户资料
         if user.identity == 0:  # 学生
-            try:
-                student = StudentEntity.objects.get(user_id=user.user_id)
+            student = identity.student
+            if student:
                 return Response({
                     'code': 200,
                     'data': {
@@ -115,49 +124,36 @@ def user_profile(request):
                         'extra': {'grade': student.grade}
                     }
                 }, status=status.HTTP_200_OK)
-            except StudentEntity.DoesNotExist:
-                return Response(
-                    {'code': 404, 'msg': '学生实体不存在'},
-                    status=status.HTTP_404_NOT_FOUND
-                )
+            return Response(
+                {'code': 404, 'msg': '学生实体不存在'},
+                status=status.HTTP_404_NOT_FOUND
+            )
         else:  # 教师
-            try:
-                teacher = TeacherEntity.objects.get(user_id=user.user_id)
-                # 计算组队成功率：该教师参与的所有协作中，已确认(status=3)的占比
-                total_cooperations = TeacherStudentCooperation.objects.filter(
-                    teacher_id=teacher.teacher_id
-                ).count()
-                
-                # 同意的合作（status=3）
-                approved_cooperations = TeacherStudentCooperation.objects.filter(
-                    teacher_id=teacher.teacher_id,
-                    status=3
-                ).count()
-                
-                success_rate = 0.0
-                if total_cooperations > 0:
-                    success_rate = round(approved_cooperations / total_cooperations * 100, 2)
-                
-                return Response({
-                    'code': 200,
-                    'data': {
-                        'user_id': user.user_id,
-                        'identity': user.identity,
-                        'name': teacher.teacher_name,
-                        'account': teacher.teacher_id,
-                        'title': teacher.title,
-                        'past_achievements': teacher.past_achievements or '',
-                        'success_rate': success_rate,
-                        'total_cooperations': total_cooperations,
-                        'approved_cooperations': approved_cooperations,
-                        'extra': {'title': teacher.title}
-                    }
-                }, status=status.HTTP_200_OK)
-            except TeacherEntity.DoesNotExist:
+            teacher = identity.teacher
+            if not teacher:
                 return Response(
                     {'code': 404, 'msg': '教师实体不存在'},
                     status=status.HTTP_404_NOT_FOUND
                 )
+
+            # 组队成功率：该教师参与的所有协作中，已确认(status=3)的占比
+            total_cooperations, approved_cooperations, success_rate = get_teacher_cooperation_summary(teacher)
+            
+            return Response({
+                'code': 200,
+                'data': {
+                    'user_id': user.user_id,
+                    'identity': user.identity,
+                    'name': teacher.teacher_name,
+                    'account': teacher.teacher_id,
+                    'title': teacher.title,
+                    'past_achievements': teacher.past_achievements or '',
+                    'success_rate': success_rate,
+                    'total_cooperations': total_cooperations,
+                    'approved_cooperations': approved_cooperations,
+                    'extra': {'title': teacher.title}
+                }
+            }, status=status.HTTP_200_OK)
     
     elif request.method == 'PUT':
         # 更新用户资料
@@ -167,44 +163,34 @@ def user_profile(request):
                 status=status.HTTP_403_FORBIDDEN
             )
         else:  # 教师
-            try:
-                teacher = TeacherEntity.objects.get(user_id=user.user_id)
-                # 只能更新past_achievements字段
-                if 'past_achievements' in request.data:
-                    teacher.past_achievements = request.data.get('past_achievements', '')
-                    teacher.save()
-                
-                # 计算组队成功率
-                total_cooperations = TeacherStudentCooperation.objects.filter(
-                    teacher_id=teacher.teacher_id
-                ).count()
-                approved_cooperations = TeacherStudentCooperation.objects.filter(
-                    teacher_id=teacher.teacher_id,
-                    status=3
-                ).count()
-                
-                success_rate = 0.0
-                if total_cooperations > 0:
-                    success_rate = round(approved_cooperations / total_cooperations * 100, 2)
-                
-                return Response({
-                    'code': 200,
-                    'msg': '更新成功',
-                    'data': {
-                        'user_id': user.user_id,
-                        'identity': user.identity,
-                        'name': teacher.teacher_name,
-                        'account': teacher.teacher_id,
-                        'title': teacher.title,
-                        'past_achievements': teacher.past_achievements or '',
-                        'success_rate': success_rate,
-                        'total_cooperations': total_cooperations,
-                        'approved_cooperations': approved_cooperations
-                    }
-                }, status=status.HTTP_200_OK)
-            except TeacherEntity.DoesNotExist:
+            teacher = identity.teacher
+            if not teacher:
                 return Response(
                     {'code': 404, 'msg': '教师实体不存在'},
                     status=status.HTTP_404_NOT_FOUND
                 )
 
+            # 只能更新past_achievements字段
+            if 'past_achievements' in request.data:
+                teacher.past_achievements = request.data.get('past_achievements', '')
+                teacher.save()
+            
+            # 组队成功率：该教师参与的所有协作中，已确认(status=3)的占比
+            total_cooperations, approved_cooperations, success_rate = get_teacher_cooperation_summary(teacher)
+            
+            return Response({
+                'code': 200,
+                'msg': '更新成功',
+                'data': {
+                    'user_id': user.user_id,
+                    'identity': user.identity,
+                    'name': teacher.teacher_name,
+                    'account': teacher.teacher_id,
+                    'title': teacher.title,
+                    'past_achievements': teacher.past_achievements or '',
+                    'success_rate': success_rate,
+                    'total_cooperations': total_cooperations,
+                    'approved_cooperations': approved_cooperations
+                }
+            }, status=status.HTTP_200_OK)
+
@@ -2,11 +2,11 @@ from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
 from django.utils import timezone
-from django.db import models
-from api.models import TeacherStudentCooperation as Cooperation, User, PostEntity
+from django.db import models, transaction
+from api.models import TeacherStudentCooperation as Cooperation, TeacherCooperationStats, User, PostEntity
 from api.models.project import ResearchProject, CompetitionProject, SkillInformation
 from api.models.user import TeacherEntity, StudentEntity
-from api.utils.auth import login_required, teacher_required, student_required,get_user_from_token
+from api.utils.auth import login_required, teacher_required, student_required, identity_required
 
 def get_post_author_id(post):
     """获取post的作者ID
@@ -39,6 +39,43 @@ def get_post_author_id(post):
             return None
     
     return None
+
+
+def transition_cooperation(cooperation, new_status):
+    """更新合作状态，并在同一事务中维护教师合作统计
+    
+    仅当数据库中的状态仍为 cooperation.status 时才更新（防止并发重复计数）
+    
+    Returns:
+        bool: 更新成功返回True，状态已被其他请求修改返回False
+    """
+    now = timezone.now()
+    fields = {'status': new_status, 'updated_at': now}
+    if new_status == 3:
+        fields['confirmed_at'] = now
+    
+    with transaction.atomic():
+        updated = Cooperation.objects.filter(
+            cooperation_id=cooperation.cooperation_id,
+            status=cooperation.status
+        ).update(**fields)
+        if not updated:
+            return False
+        TeacherCooperationStats.record_transition(cooperation.teacher_id, cooperation.status, new_status)
+    
+    for field, value in fields.items():
+        setattr(cooperation, field, value)
+    return True
+
+
+def create_cooperation(**kwargs):
+    """创建合作记录，并在同一事务中维护教师合作统计"""
+    with transaction.atomic():
+        cooperation = Cooperation.objects.create(**kwargs)
+        TeacherCooperationStats.record_created(cooperation.teacher_id, cooperation.status)
+    return cooperation
+
+
 def cancel_cooperation(request):
     try:
         cooperation_id = request.data.get('cooperation_id')
@@ -59,7 +96,7 @@ def cancel_cooperation(request):
             )
         if cooperation.role==1:  # 申请
         # 检查权限（必须是记录的学生）
-            if cooperation.student_id != StudentEntity.objects.get(user_id=get_user_from_token(request)).student_id:
+            if cooperation.student_id != request.identity.student_id:
                 return Response(
                     {"error": "您没有权限取消此申请"},
                     status=status.HTTP_403_FORBIDDEN
@@ -70,7 +107,7 @@ def cancel_cooperation(request):
                     status=status.HTTP_400_BAD_REQUEST
                 )
         elif cooperation.role==0:  # 邀请
-            if cooperation.teacher_id != TeacherEntity.objects.get(user_id=get_user_from_token(request)).teacher_id:
+            if cooperation.teacher_id != request.identity.teacher_id:
                 return Response(
                     {"error": "您没有权限取消此邀请"},
                     status=status.HTTP_403_FORBIDDEN
@@ -81,9 +118,11 @@ def cancel_cooperation(request):
                     status=status.HTTP_400_BAD_REQUEST
                 )      
         # 更新状态
-        cooperation.status = 5
-        cooperation.updated_at = timezone.now()
-        cooperation.save()
+        if not transition_cooperation(cooperation, 5):
+            return Response(
+                {"error": "合作状态已变更，请刷新后重试"},
+                status=status.HTTP_409_CONFLICT
+            )
         return Response(
             {
                 "message": "取消成功",
@@ -118,7 +157,7 @@ def reject_cooperation(request):
             )
         if cooperation.role==1:  # 申请
             # 检查权限（必须是记录的教师）
-            if cooperation.teacher_id != TeacherEntity.objects.get(user_id=get_user_from_token(request)).teacher_id:
+            if cooperation.teacher_id != request.identity.teacher_id:
                 return Response(
                     {"error": "您没有权限拒绝此申请"},
                     status=status.HTTP_403_FORBIDDEN
@@ -132,7 +171,7 @@ def reject_cooperation(request):
                 )
         elif cooperation.role==0:  # 邀请
             # 检查权限（必须是被邀请者）
-            if cooperation.student_id != StudentEntity.objects.get(user_id=get_user_from_token(request)).student_id:
+            if cooperation.student_id != request.identity.student_id:
                 return Response(
                     {"error": "您没有权限拒绝此邀请"},
                     status=status.HTTP_403_FORBIDDEN
@@ -146,9 +185,11 @@ def reject_cooperation(request):
                 )
         
         # 更新状态
-        cooperation.status = 4
-        cooperation.updated_at = timezone.now()
-        cooperation.save()
+        if not transition_cooperation(cooperation, 4):
+            return Response(
+                {"error": "合作状态已变更，请刷新后重试"},
+                status=status.HTTP_409_CONFLICT
+            )
         
         return Response(
             {
@@ -167,6 +208,7 @@ def reject_cooperation(request):
 @api_view(['POST'])
 @login_required
 @student_required
+@identity_required
 def apply_cooperation(request):
     """
     学生申请加入项目
@@ -209,9 +251,16 @@ def apply_cooperation(request):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
         
+        student_id = request.identity.student_id
+        if not student_id:
+            return Response(
+                {"error": "学生信息不存在"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
         # 检查是否已经申请过
         existing = Cooperation.objects.filter(
-            student_id=StudentEntity.objects.get(user_id=request.user.user_id).student_id,
+            student_id=student_id,
             post_id=post_id,
             role=1,
             status=2
@@ -224,9 +273,9 @@ def apply_cooperation(request):
             )
         
         # 创建合作记录
-        cooperation = Cooperation.objects.create(
+        cooperation = create_cooperation(
             teacher_id=author_id,
-            student_id=StudentEntity.objects.get(user_id=request.user.user_id).student_id,
+            student_id=student_id,
             post_id=post_id,
             role=1,
             status=2,
@@ -253,6 +302,7 @@ def apply_cooperation(request):
 @api_view(['POST'])
 @login_required
 @teacher_required
+@identity_required
 def approve_application(request):
     """
     教师批准学生申请
@@ -288,7 +338,7 @@ def approve_application(request):
             )
         
         # 检查权限（必须是记录的教师）
-        if cooperation.teacher_id != TeacherEntity.objects.get(user_id=request.user.user_id).teacher_id:
+        if cooperation.teacher_id != request.identity.teacher_id:
             return Response(
                 {"error": "您没有权限批准此申请"},
                 status=status.HTTP_403_FORBIDDEN
@@ -302,10 +352,11 @@ def approve_application(request):
             )
         
         # 更新状态
-        cooperation.status = 3
-        cooperation.updated_at = timezone.now()
-        cooperation.confirmed_at = timezone.now()
-        cooperation.save()
+        if not transition_cooperation(cooperation, 3):
+            return Response(
+                {"error": "合作状态已变更，请刷新后重试"},
+                status=status.HTTP_409_CONFLICT
+            )
         
         return Response(
             {
@@ -326,6 +377,7 @@ def approve_application(request):
 @api_view(['POST'])
 @login_required
 @teacher_required
+@identity_required
 def reject_application(request):
     """
     教师拒绝学生申请
@@ -348,6 +400,7 @@ def reject_application(request):
 @api_view(['POST'])
 @login_required
 @student_required
+@identity_required
 def reject_invitation(request):
     """
     学生拒绝教师邀请
@@ -369,6 +422,7 @@ def reject_invitation(request):
 @api_view(['POST'])
 @login_required
 @student_required
+@identity_required
 def cancel_apply(request):
     """
     学生取消申请或邀请接受前的操作
@@ -391,6 +445,7 @@ def cancel_apply(request):
 @api_view(['POST'])
 @login_required
 @teacher_required
+@identity_required
 def invite_student(request):
     """
     教师邀请学生加入项目
@@ -410,7 +465,7 @@ def invite_student(request):
     try:
         post_id = request.data.get('post_id')
         student_id = SkillInformation.objects.get(post_id=post_id).student_id
-        teacher_id=TeacherEntity.objects.get(user_id=get_user_from_token(request)).teacher_id
+        teacher_id=request.identity.teacher_id
         if not post_id:
             return Response(
                 {"error": "缺少 post_id 参数"},
@@ -459,7 +514,7 @@ def invite_student(request):
             )
         
         # 创建邀请记录
-        cooperation = Cooperation.objects.create(
+        cooperation = create_cooperation(
             teacher_id=teacher_id,
             student_id=student_id,
             post_id=post_id,
@@ -488,6 +543,7 @@ def invite_student(request):
 @api_view(['POST'])
 @login_required
 @teacher_required
+@identity_required
 def cancel_invite(request):
     """
     教师取消邀请
@@ -510,6 +566,7 @@ def cancel_invite(request):
 @api_view(['POST'])
 @login_required
 @student_required
+@identity_required
 def agree_invite(request):
     """
     学生同意邀请
@@ -544,7 +601,7 @@ def agree_invite(request):
             )
         
         # 检查权限（必须是被邀请者）
-        if cooperation.student_id != StudentEntity.objects.get(user_id=get_user_from_token(request)).student_id:
+        if cooperation.student_id != request.identity.student_id:
             return Response(
                 {"error": "您没有权限同意此邀请"},
                 status=status.HTTP_403_FORBIDDEN
@@ -565,10 +622,11 @@ def agree_invite(request):
             )
         
         # 更新状态
-        cooperation.status = 3
-        cooperation.updated_at = timezone.now()
-        cooperation.confirmed_at = timezone.now()
-        cooperation.save()
+        if not transition_cooperation(cooperation, 3):
+            return Response(
+                {"error": "合作状态已变更，请刷新后重试"},
+                status=status.HTTP_409_CONFLICT
+            )
         
         return Response(
             {
@@ -588,6 +646,7 @@ def agree_invite(request):
 
 @api_view(['GET'])
 @login_required
+@identity_required
 def list_cooperations(request):
     """
     分页获取当前用户的所有合作记录
@@ -618,8 +677,6 @@ def list_cooperations(request):
         }
     """
     try:
-        user_id = get_user_from_token(request)
-        
         # 获取分页参数
         page = int(request.query_params.get('page', 1))
         page_size = int(request.query_params.get('page_size', 10))
@@ -630,8 +687,8 @@ def list_cooperations(request):
         if page_size < 1 or page_size > 100:
             page_size = 10
         
-        teacher = TeacherEntity.objects.filter(user_id=user_id).first()
-        student = StudentEntity.objects.filter(user_id=user_id).first()
+        teacher = request.identity.teacher
+        student = request.identity.student
 
         # 构建查询条件,只能获取和自己相关的合作记录
         q_objects = models.Q()
@@ -697,6 +754,7 @@ def list_cooperations(request):
 
 @api_view(['GET'])
 @login_required
+@identity_required
 def check_unfinished(request):
     """
     检查用户是否有未完成的合作（待处理状态）
@@ -708,11 +766,8 @@ def check_unfinished(request):
     """
     try:
         # 查询当前用户是否有待处理的合作(0=邀请, 1=申请, 2=待确认)
-
-        user_id = get_user_from_token(request)
-        
-        teacher = TeacherEntity.objects.filter(user_id=user_id).first()
-        student = StudentEntity.objects.filter(user_id=user_id).first()
+        teacher = request.identity.teacher
+        student = request.identity.student
 
         # 构建动态查询条件
         q_objects = models.Q()
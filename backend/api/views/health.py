@@ -2,11 +2,16 @@ from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
 
+from ..utils.token_cache import token_cache
+from ..utils.word_weights import word_weight_store
+
 
 @api_view(['GET'])
 def health_check(request):
     """健康检查接口"""
     return Response({
         'status': 'success',
-        'message': 'Django后端服务运行正常'
+        'message': 'Django后端服务运行正常',
+        'token_cache': token_cache.stats(),
+        'word_weights': word_weight_store.status()
     }, status=status.HTTP_200_OK)
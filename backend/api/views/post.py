@@ -8,6 +8,8 @@ from ..models.post import PostEntity
 from ..models.user import User, StudentEntity, TeacherEntity
 from ..models.interaction import Like, Favorite, Comment
 from ..utils.auth import login_required, teacher_required, student_required
+from ..utils.project_card import bump_card_counters
+from ..utils.list_cache import invalidate_project_list
 
 def ok():
     return Response({"code": 200}, status=status.HTTP_200_OK)
@@ -35,7 +37,9 @@ def like(request):
         )
         if created:
             # 仅首次点赞时累计
-            PostEntity.objects.filter(post_id=post.post_id).update(like_num=models.F("like_num") + 1)
+            PostEntity.objects.filter(post_id=post.post_id).update(like_num=models.F("like_num") + 1, hot_dirty=True)
+            bump_card_counters(post.post_id, like_num=1)
+            invalidate_project_list(post.visibility)
 
     return Response({"code": 200, "msg": "点赞成功", "data": {"is_liked": True}}, status=status.HTTP_200_OK)
 
@@ -59,7 +63,9 @@ def unlike(request):
         deleted = Like.objects.filter(post=post, user=user).delete()[0]
         if deleted > 0:
             # 减少点赞数
-            PostEntity.objects.filter(post_id=post.post_id).update(like_num=models.F("like_num") - 1)
+            PostEntity.objects.filter(post_id=post.post_id).update(like_num=models.F("like_num") - 1, hot_dirty=True)
+            bump_card_counters(post.post_id, like_num=-1)
+            invalidate_project_list(post.visibility)
 
     return Response({"code": 200, "msg": "取消点赞成功", "data": {"is_liked": False}}, status=status.HTTP_200_OK)
 
@@ -85,7 +91,9 @@ def favorite(request):
             defaults={'created_at': timezone.now()}
         )
         if created:
-            PostEntity.objects.filter(post_id=post.post_id).update(favorite_num=models.F("favorite_num") + 1)
+            PostEntity.objects.filter(post_id=post.post_id).update(favorite_num=models.F("favorite_num") + 1, hot_dirty=True)
+            bump_card_counters(post.post_id, favorite_num=1)
+            invalidate_project_list(post.visibility)
 
     return Response({"code": 200, "msg": "收藏成功", "data": {"is_favorited": True}}, status=status.HTTP_200_OK)
 
@@ -109,7 +117,9 @@ def unfavorite(request):
         deleted = Favorite.objects.filter(post=post, user=user).delete()[0]
         if deleted > 0:
             # 减少收藏数
-            PostEntity.objects.filter(post_id=post.post_id).update(favorite_num=models.F("favorite_num") - 1)
+            PostEntity.objects.filter(post_id=post.post_id).update(favorite_num=models.F("favorite_num") - 1, hot_dirty=True)
+            bump_card_counters(post.post_id, favorite_num=-1)
+            invalidate_project_list(post.visibility)
 
     return Response({"code": 200, "msg": "取消收藏成功", "data": {"is_favorited": False}}, status=status.HTTP_200_OK)
 
@@ -139,7 +149,9 @@ def comment(request):
             created_at=now
         )
         # 更新评论数
-        PostEntity.objects.filter(post_id=post.post_id).update(comment_num=models.F("comment_num") + 1)
+        PostEntity.objects.filter(post_id=post.post_id).update(comment_num=models.F("comment_num") + 1, hot_dirty=True)
+        bump_card_counters(post.post_id, comment_num=1)
+        invalidate_project_list(post.visibility)
 
     return Response({"code": 200, "msg": "评论成功"}, status=status.HTTP_200_OK)
 
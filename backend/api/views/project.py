@@ -1,15 +1,17 @@
 """
 项目相关视图
 """
+import base64
+import binascii
 import json
-import os
 import re
 import math
 from datetime import datetime
-from functools import lru_cache
 
 from django.db import transaction, models
-from django.db.models import Q
+from django.db.models import Q, Count, Value
+from django.db.models.functions import Cast
+from django.http import HttpResponse
 from django.utils import timezone
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
@@ -19,53 +21,34 @@ from ..models import PostEntity, ResearchProject, CompetitionProject, SkillInfor
 from ..models import TeacherEntity, StudentEntity, Tag, PostTag,User
 from ..models import Skill, StudentSkill
 from ..models import TeacherStudentCooperation
+from ..models import ProjectCard
 from ..models.attachment import PostAttachment
 from ..models.direction import PostDirection, PostStack, TechStack, Direction
 from ..models.direction import Direction, PostDirection
 from ..models.interaction import Like, Favorite, Comment
 from ..serializers import ResearchPublishSerializer, CompetitionPublishSerializer, PersonalPublishSerializer
-from ..utils.auth import login_required, get_user_from_token
+from ..utils.auth import login_required, identity_required, get_user_from_token
+from ..utils.search_index import index_posts, search_post_ids, score_posts
+from ..utils.project_card import refresh_project_cards, update_cards, load_card_fragments
+from ..utils.list_cache import cache_project_list, invalidate_project_list, visibility_group, filter_visible
+from ..utils.hot_score import refresh_hot_scores
+from ..utils.recommend import refresh_post_terms, recommend_posts, invalidate_recommendations, RECOMMEND_TOP_K
+from ..utils.assignment import assign_students
+from ..utils.word_weights import word_weight_store
 
 
-# 技能评分权重配置
-WORD_WEIGHT_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'word_weight.txt')
+# 技能评分权重配置（关键词权重表见 api/data/word_weight.txt，由 word_weight_store 热加载）
 PROFICIENCY_WEIGHT_MAP = {0: 2, 1: 1}  # 0=skillful -> 熟练(2); 1=known -> 了解(1)
 ALPHA_WEIGHT = 0.6  # 关键词得分占比
 BETA_WEIGHT = 0.4   # 技术熟练度占比
 
 
-def _strip_json_comments(content: str) -> str:
-    """移除简单的 /* ... */ 注释，便于解析为 JSON。"""
-    return re.sub(r'/\*.*?\*/', '', content, flags=re.S)
-
-
-@lru_cache(maxsize=1)
-def load_word_weights():
-    """读取关键词权重配置，读取失败时返回空列表。"""
-    try:
-        with open(WORD_WEIGHT_FILE, 'r', encoding='utf-8') as f:
-            raw_content = f.read()
-        cleaned = _strip_json_comments(raw_content)
-        return json.loads(cleaned)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return []
-
-
-def calculate_keyword_score(project_experience: str) -> float:
-    """根据项目经历文本匹配关键词得分。"""
+def calculate_keyword_score(project_experience: str, snapshot=None) -> float:
+    """根据项目经历文本匹配关键词得分（同一组命中一次即可）。"""
     if not project_experience:
         return 0.0
-    text_lower = project_experience.lower()
-    score = 0.0
-    for item in load_word_weights():
-        names = [item.get('name', '')]
-        aliases = item.get('aliases') or []
-        keywords = [kw for kw in names + aliases if kw]
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                score += float(item.get('base_weight', 0))
-                break  # 同一组命中一次即可
-    return score
+    snapshot = snapshot or word_weight_store.current()
+    return snapshot.matcher.score(project_experience)
 
 
 def calculate_proficiency_score(skills_data) -> float:
@@ -88,14 +71,16 @@ def calculate_proficiency_score(skills_data) -> float:
 
 
 def calculate_skill_score(project_experience: str, skills_data) -> dict:
-    """综合关键词与熟练度，返回总分及分项。"""
-    keyword_score = calculate_keyword_score(project_experience)
+    """综合关键词与熟练度，返回总分、分项及所用词表版本。"""
+    snapshot = word_weight_store.current()
+    keyword_score = calculate_keyword_score(project_experience, snapshot)
     proficiency_score = calculate_proficiency_score(skills_data)
     total_score = keyword_score * ALPHA_WEIGHT + proficiency_score * BETA_WEIGHT
     return {
         'total_score': round(total_score, 2),
         'keyword_score': round(keyword_score, 2),
-        'proficiency_score': round(proficiency_score, 2)
+        'proficiency_score': round(proficiency_score, 2),
+        'word_weight_version': snapshot.version
     }
 
 
@@ -124,6 +109,19 @@ def parse_hours_per_week(text: str) -> tuple[float, bool]:
     return 0.0, False
 
 
+def parse_spend_time(spend_time):
+    """解析可投入时间文本，返回 (hours_per_week, hours_parsed)，用于写入 SkillInformation"""
+    hours, parsed = parse_hours_per_week(spend_time)
+    return (hours if parsed else None), parsed
+
+
+def stored_hours_per_week(skill_info):
+    """读取已解析的每周可投入小时数，返回 (hours, parsed)；尚未回填的旧数据当场解析"""
+    if skill_info.hours_parsed is None:
+        return parse_spend_time(skill_info.spend_time)
+    return skill_info.hours_per_week, skill_info.hours_parsed
+
+
 def calc_project_hours_per_week(start_time, end_time):
     """根据项目起止时间计算周期和每周标准工时。无法计算时返回 None。"""
     if not start_time or not end_time:
@@ -154,7 +152,119 @@ def classify_match(student_hours: float, project_hours: float):
     return round(ratio, 2)
 
 
+# 列表分页查询只需要的列；条目内容来自卡片片段
+LIST_ROW_FIELDS = ('post_id', 'create_time', 'card__version')
+
+
+# 列表时间窗口筛选参数
+LIST_TIME_WINDOW_PARAMS = ('active_from', 'active_to', 'start_after', 'deadline_before')
+
+
+# 可统计的分面：名称 -> 分组字段
+LIST_FACETS = {
+    'post_type': 'post_type',
+    'direction': 'postdirection__direction__direction_name',
+    'stack': 'poststack__stack__tech_stack',
+    'tag': 'posttag__tag__name',
+    'recruit_status': 'recruit_status',
+}
+
+
+def parse_list_fields(value):
+    """解析 fields 参数（逗号分隔），返回字段集合；未传或没有有效字段时返回 None（全部字段）"""
+    if not value:
+        return None
+    valid = set(ProjectCard.LIST_ITEM_COLUMNS) | {'relevance_score'}
+    fields = {name.strip() for name in value.split(',')} & valid
+    if not fields:
+        return None
+    fields.add('post_id')
+    return fields
+
+
+def parse_facets(value):
+    """解析 facets 参数（逗号分隔），忽略未知分面，保持 LIST_FACETS 中的顺序"""
+    if not value:
+        return []
+    requested = {name.strip() for name in value.split(',')}
+    return [name for name in LIST_FACETS if name in requested]
+
+
+def compute_facets(posts_query, facet_names):
+    """在当前筛选/搜索条件下统计各分面取值的项目数
+    
+    各分面的分组统计用 UNION ALL 合并为一条 SQL 执行
+    
+    返回:
+        {facet: [{'value': 取值, 'count': 数量}, ...]}，按数量倒序
+    """
+    facets = {name: [] for name in facet_names}
+    if not facet_names:
+        return facets
+    
+    grouped = [
+        posts_query.order_by()
+        .annotate(facet_value=Cast(LIST_FACETS[name], output_field=models.CharField()))
+        .values('facet_value')
+        .annotate(facet_count=Count('post_id', distinct=True))
+        .annotate(facet_name=Value(name, output_field=models.CharField()))
+        .values_list('facet_name', 'facet_value', 'facet_count')
+        for name in facet_names
+    ]
+    union_query = grouped[0].union(*grouped[1:], all=True) if len(grouped) > 1 else grouped[0]
+    
+    for name, value, count in union_query:
+        if value is None:
+            continue
+        if name == 'post_type':
+            value = ProjectCard.POST_TYPE_NAMES.get(int(value), value)
+        elif name == 'recruit_status':
+            value = int(value)
+        facets[name].append({'value': value, 'count': count})
+    for items in facets.values():
+        items.sort(key=lambda item: -item['count'])
+    return facets
+
+
+def append_fragment_field(fragment, name, value):
+    """向条目 JSON 片段末尾追加一个字段"""
+    return f'{fragment[:-1]},{json.dumps(name)}:{json.dumps(value)}}}'
+
+
+def render_list_response(fragments, meta):
+    """把条目片段拼接为列表响应（与 Response 渲染的 JSON 结构一致）
+    
+    Args:
+        fragments: 条目 JSON 片段列表
+        meta: data 中除 items 外的分页字段
+    """
+    meta_json = json.dumps(meta, ensure_ascii=False, separators=(',', ':'))
+    body = (
+        '{"code":200,"msg":"获取成功","data":{"items":['
+        + ','.join(fragments)
+        + '],' + meta_json[1:] + '}'
+    )
+    return HttpResponse(body, content_type='application/json')
+
+
+def encode_list_cursor(post):
+    """把列表最后一条记录的 (create_time, post_id) 编码为不透明游标"""
+    payload = json.dumps([post.create_time.isoformat(), post.post_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_list_cursor(cursor):
+    """解析游标，返回 (create_time, post_id)；格式错误时抛出 ValueError"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        create_time, post_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return datetime.fromisoformat(create_time), int(post_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValueError('cursor 参数无效') from e
+
+
 @api_view(['GET'])
+@cache_project_list
 def list_projects(request):
     """获取项目列表接口（支持分页和关键词搜索）
     
@@ -165,9 +275,31 @@ def list_projects(request):
     - search: 关键词搜索，在多个字段中进行模糊搜索
     - page: 页码，从1开始（默认：1）
     - page_size: 每页数量（默认：20）
+    - sort: 排序方式，默认按发布时间倒序
+        relevance=按搜索相关度（仅在 search 命中倒排索引时生效）
+        skill_score=按个人技能评分倒序（其他类型没有评分，排在最后）
+        hot=按热度分倒序（互动数加权并随发布时间衰减，由 refresh_hot_scores 命令定期增量更新）
+    - active_from / active_to: 科研项目进行期与 [active_from, active_to] 有交集（毫秒时间戳，可只传一端）
+    - start_after: 科研项目开始时间不早于该时刻（毫秒时间戳）
+    - deadline_before: 竞赛报名截止时间不晚于该时刻（毫秒时间戳）
+      以上科研/竞赛时间条件各自只返回对应类型，同时传入两类条件时结果为空
+    - min_hours / max_hours: 每周可投入小时数区间（含端点），传入后只返回个人技能，
+      无法解析可投入时间的发布不会出现在结果中
+    - fields: 稀疏字段选择，逗号分隔的条目字段名（如 title,like_num,create_time），
+      只返回这些字段（post_id 始终返回），未传时返回全部字段
+    - facets: 分面统计，逗号分隔，可选 post_type,direction,stack,tag,recruit_status；
+      在当前筛选/搜索条件下统计各取值的项目数，结果放在 data.facets 中
+    - cursor: 游标分页，首页传空字符串，之后传上一页返回的 next_cursor；
+      传入后忽略 page，不计算 total/total_pages（仅支持默认排序）
     
     搜索范围：competition_name, team_require, reward, post_direction, 
     post_stack, research_name, outcome, project_name, habit_tag, stu_skill
+    搜索实现：关键词按字符二元组在 Post_search_term 倒排索引中求交集，
+    不足两个字符的关键词回退到多字段模糊匹配
+    响应缓存：按调用方可见性分组（匿名/学生/教师/管理员）和规范化参数缓存 PROJECT_LIST_CACHE_TTL 秒，
+    发布/更新、招募状态、附件、点赞/收藏/评论会使相关分组的缓存失效
+    相关度排序：BM25 打分，按字段加权（标题 > 方向/技术栈 > 标签 > 正文），
+    同分按发布时间倒序；此时每条结果额外返回 relevance_score
     
     返回:
     {
@@ -193,12 +325,36 @@ def list_projects(request):
             "total_pages": 5  # 总页数
         }
     }
+    游标模式下 data 为 {"items": [...], "page_size": 20, "next_cursor": "...", "has_more": true}，
+    没有下一页时 next_cursor 为 null
     """
     try:
         # 获取筛选参数
         post_type_filter = request.GET.get('post_type', None)
         user_id_filter = request.GET.get('user_id', None)
         search_keyword = request.GET.get('search', None)
+        sort_by = request.GET.get('sort', None)
+        facet_names = parse_facets(request.GET.get('facets', None))
+        list_fields = parse_list_fields(request.GET.get('fields', None))
+        # 时间窗口参数均为 Unix 时间戳（毫秒）
+        try:
+            time_window = {
+                name: timestamp_to_datetime(int(request.GET[name]))
+                for name in LIST_TIME_WINDOW_PARAMS if request.GET.get(name)
+            }
+        except (ValueError, OverflowError, OSError):
+            return Response(
+                {'code': 400, 'msg': f'{"/".join(LIST_TIME_WINDOW_PARAMS)} 必须是毫秒时间戳'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            min_hours = float(request.GET['min_hours']) if request.GET.get('min_hours') else None
+            max_hours = float(request.GET['max_hours']) if request.GET.get('max_hours') else None
+        except ValueError:
+            return Response(
+                {'code': 400, 'msg': 'min_hours/max_hours 必须是数字'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
         # 获取分页参数
         try:
@@ -212,6 +368,19 @@ def list_projects(request):
         page = max(1, page)
         page_size = max(1, min(100, page_size))  # 限制每页最多100条
         
+        # 游标分页：按 (create_time, post_id) 倒序定位，不做 COUNT 和 OFFSET
+        cursor = request.GET.get('cursor', None)
+        cursor_mode = cursor is not None and sort_by not in ('relevance', 'skill_score', 'hot')
+        cursor_position = None
+        if cursor_mode and cursor:
+            try:
+                cursor_position = decode_list_cursor(cursor)
+            except ValueError as e:
+                return Response(
+                    {'code': 400, 'msg': str(e)},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        
         # 类型映射：字符串 -> 整数
         post_type_map = {
             'research': 1,
@@ -221,308 +390,155 @@ def list_projects(request):
         
         # 获取当前用户（如果已登录）
         current_user = get_user_from_token(request)
-        current_user_identity = None
-        if current_user:
-            current_user_identity = current_user.identity  # 0=学生, 1=教师
         
         # 构建查询
-        posts_query = PostEntity.objects.all().order_by('-create_time')
+        posts_query = PostEntity.objects.select_related('card').only(*LIST_ROW_FIELDS).order_by('-create_time', '-post_id')
+        if sort_by == 'skill_score':
+            # 走 Skill_information.skill_score 索引；降序时非个人技能（NULL）排在最后
+            posts_query = posts_query.order_by('-skillinformation__skill_score', '-create_time', '-post_id')
+        elif sort_by == 'hot':
+            # 走 (hot_score, post_id) 索引倒序扫描，分数已落库，不在请求内计算
+            posts_query = posts_query.order_by('-hot_score', '-post_id')
         
-        # 根据可见权限过滤
-        # visibility: 0=公开（所有人可见）, 1=仅教师可见, 2=仅学生可见
-        if current_user_identity is not None:
-            # 如果用户已登录，根据身份和可见权限过滤
-            if current_user_identity == 0:  # 学生
-                # 学生可以看到：公开(0)和仅学生可见(2)的项目
-                posts_query = posts_query.filter(visibility__in=[0, 2])
-            elif current_user_identity == 1:  # 教师
-                # 教师可以看到：公开(0)和仅教师可见(1)的项目
-                posts_query = posts_query.filter(visibility__in=[0, 1])
-        else:
-            # 未登录用户只能看到公开的项目
-            posts_query = posts_query.filter(visibility=0)
+        # 根据可见权限过滤（与列表缓存使用同一分组）：
+        # 未登录只能看公开(0)，学生看公开和仅学生可见(2)，教师看公开和仅教师可见(1)，管理员不限
+        posts_query = filter_visible(posts_query, visibility_group(current_user))
         
         # 如果有类型筛选，添加过滤条件
         if post_type_filter and post_type_filter in post_type_map:
             posts_query = posts_query.filter(post_type=post_type_map[post_type_filter])
         
-        # 如果有用户ID筛选，添加过滤条件
+        # 每周可投入小时数区间（只有个人技能有该字段），走 Skill_information.hours_per_week 索引
+        if min_hours is not None or max_hours is not None:
+            posts_query = posts_query.filter(post_type=3)
+            if min_hours is not None:
+                posts_query = posts_query.filter(skillinformation__hours_per_week__gte=min_hours)
+            if max_hours is not None:
+                posts_query = posts_query.filter(skillinformation__hours_per_week__lte=max_hours)
+        
+        # 科研项目进行时间窗口 / 开始时间（走 Research_project (starttime, endtime) 索引）
+        if 'active_from' in time_window or 'active_to' in time_window or 'start_after' in time_window:
+            posts_query = posts_query.filter(post_type=1)
+            if 'active_to' in time_window:
+                posts_query = posts_query.filter(researchproject__starttime__lte=time_window['active_to'])
+            if 'active_from' in time_window:
+                posts_query = posts_query.filter(researchproject__endtime__gte=time_window['active_from'])
+            if 'start_after' in time_window:
+                posts_query = posts_query.filter(researchproject__starttime__gte=time_window['start_after'])
+        # 竞赛报名截止时间（走 Competition_project.deadline 索引）
+        if 'deadline_before' in time_window:
+            posts_query = posts_query.filter(post_type=2, competitionproject__deadline__lte=time_window['deadline_before'])
+        
+        # 如果有用户ID筛选，添加过滤条件（PostEntity.author 冗余保存发布人，单个索引条件即可）
         if user_id_filter:
             try:
-                user_id_int = int(user_id_filter)
-                # 获取该用户发布的所有项目post_id
-                # 对于科研项目和竞赛项目，通过TeacherEntity关联
-                # 对于个人技能项目，通过StudentEntity关联
-                teacher = TeacherEntity.objects.filter(user_id=user_id_int).first()
-                student = StudentEntity.objects.filter(user_id=user_id_int).first()
-                
-                user_post_ids = []
-                
-                if teacher:
-                    # 获取该教师发布的科研项目和竞赛项目
-                    research_posts = ResearchProject.objects.filter(teacher=teacher).values_list('post_id', flat=True)
-                    competition_posts = CompetitionProject.objects.filter(teacher=teacher).values_list('post_id', flat=True)
-                    user_post_ids.extend(research_posts)
-                    user_post_ids.extend(competition_posts)
-                
-                if student:
-                    # 获取该学生发布的个人技能项目
-                    skill_posts = SkillInformation.objects.filter(student=student).values_list('post_id', flat=True)
-                    user_post_ids.extend(skill_posts)
-                
-                # 如果用户没有发布任何项目，返回空结果
-                if not user_post_ids:
-                    return Response(
-                        {
-                            'code': 200,
-                            'msg': '获取成功',
-                            'data': {
-                                'items': [],
-                                'total': 0,
-                                'page': page,
-                                'page_size': page_size,
-                                'total_pages': 0
-                            }
-                        },
-                        status=status.HTTP_200_OK
-                    )
-                
-                # 筛选该用户发布的项目
-                posts_query = posts_query.filter(post_id__in=user_post_ids)
+                posts_query = posts_query.filter(author_id=int(user_id_filter))
             except (ValueError, TypeError):
                 # user_id无效，忽略该筛选条件
                 pass
         
-        # 如果有关键词搜索，进行多字段模糊搜索
+        # 如果有关键词搜索：优先走倒排索引（二元组交集），含单字片段的关键词回退到多字段模糊匹配
+        indexed_post_ids = None
         if search_keyword and search_keyword.strip():
             search_term = search_keyword.strip()
-            # 构建Q对象进行OR查询，在多个字段中搜索
-            search_query = Q()
-            
-            # 搜索科研项目字段
-            search_query |= Q(researchproject__research_name__icontains=search_term)
-            search_query |= Q(researchproject__outcome__icontains=search_term)
-            
-            # 搜索竞赛项目字段
-            search_query |= Q(competitionproject__competition_name__icontains=search_term)
-            search_query |= Q(competitionproject__team_require__icontains=search_term)
-            search_query |= Q(competitionproject__reward__icontains=search_term)
-            
-            # 搜索个人技能字段
-            search_query |= Q(skillinformation__project_experience__icontains=search_term)
-            
-            # 搜索方向和技术栈字段
-            search_query |= Q(postdirection__direction__direction_name__icontains=search_term)
-            search_query |= Q(poststack__stack__tech_stack__icontains=search_term)
-            
-            # 搜索标签字段
-            search_query |= Q(posttag__tag__name__icontains=search_term)
-            
-            # 搜索技能字段
-            
-            # 应用搜索过滤，并使用distinct去重，因为多个关联可能返回重复的post
-            posts_query = posts_query.filter(search_query).distinct()
-        
-        # 计算总数
-        total = posts_query.count()
+            indexed_post_ids = search_post_ids(search_term)
+            if indexed_post_ids is not None:
+                posts_query = posts_query.filter(post_id__in=indexed_post_ids)
+            else:
+                # 构建Q对象进行OR查询，在多个字段中搜索
+                search_query = Q()
+                
+                # 搜索科研项目字段
+                search_query |= Q(researchproject__research_name__icontains=search_term)
+                search_query |= Q(researchproject__outcome__icontains=search_term)
+                
+                # 搜索竞赛项目字段
+                search_query |= Q(competitionproject__competition_name__icontains=search_term)
+                search_query |= Q(competitionproject__team_require__icontains=search_term)
+                search_query |= Q(competitionproject__reward__icontains=search_term)
+                
+                # 搜索个人技能字段
+                search_query |= Q(skillinformation__project_experience__icontains=search_term)
+                
+                # 搜索方向和技术栈字段
+                search_query |= Q(postdirection__direction__direction_name__icontains=search_term)
+                search_query |= Q(poststack__stack__tech_stack__icontains=search_term)
+                
+                # 搜索标签字段
+                search_query |= Q(posttag__tag__name__icontains=search_term)
+                
+                # 应用搜索过滤，并使用distinct去重，因为多个关联可能返回重复的post
+                posts_query = posts_query.filter(search_query).distinct()
         
-        # 计算总页数
-        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
+        # 分面统计基于筛选/搜索后的结果集，需在游标条件之前计算
+        facets = compute_facets(posts_query, facet_names) if facet_names else None
         
-        # 分页查询
+        relevance_scores = None
         offset = (page - 1) * page_size
-        posts = list(posts_query[offset:offset + page_size])
-        post_ids = [post.post_id for post in posts]
-        
-        # 按类型分组，批量查询以优化性能
-        post_ids_by_type = {1: [], 2: [], 3: []}
-        for post in posts:
-            post_ids_by_type[post.post_type].append(post.post_id)
-        
-        # 批量查询各类项目
-        research_dict = {}
-        if post_ids_by_type[1]:
-            research_list = ResearchProject.objects.filter(
-                post_id__in=post_ids_by_type[1]
-            ).select_related('teacher', 'post')
-            research_dict = {r.post_id: r for r in research_list}
-        
-        competition_dict = {}
-        if post_ids_by_type[2]:
-            competition_list = CompetitionProject.objects.filter(
-                post_id__in=post_ids_by_type[2]
-            ).select_related('teacher', 'post')
-            competition_dict = {c.post_id: c for c in competition_list}
-        
-        skill_dict = {}
-        if post_ids_by_type[3]:
-            skill_list = SkillInformation.objects.filter(
-                post_id__in=post_ids_by_type[3]
-            ).select_related('student', 'post')
-            skill_dict = {s.post_id: s for s in skill_list}
-        
-        # 批量查询方向关联（用于个人技能和科研项目）
-        post_directions_dict = {}
-        post_directions_list = PostDirection.objects.filter(
-            post_id__in=post_ids
-        ).select_related('direction', 'post')
-        for pd in post_directions_list:
-            if pd.post_id not in post_directions_dict:
-                post_directions_dict[pd.post_id] = []
-            post_directions_dict[pd.post_id].append(pd.direction.direction_name)
-        
-        # 批量查询技术栈关联（用于科研项目，每个post只有一个技术栈字符串）
-        post_stacks_dict = {}
-        post_stacks_list = PostStack.objects.filter(
-            post_id__in=post_ids
-        ).select_related('stack', 'post')
-        for ps in post_stacks_list:
-            # 每个post只保存一个技术栈字符串（如果已有则覆盖，确保唯一）
-            post_stacks_dict[ps.post_id] = ps.stack.tech_stack
-        
-        # 批量查询技能关联（用于个人技能）
-        student_skills_dict = {}
-        student_skills_list = StudentSkill.objects.filter(
-            post_id__in=post_ids
-        ).select_related('skill', 'post')
-        for ss in student_skills_list:
-            if ss.post_id not in student_skills_dict:
-                student_skills_dict[ss.post_id] = []
-            student_skills_dict[ss.post_id].append({
-                'skill_name': ss.skill.skill_name,
-                'proficiency': ss.proficiency,  # 0=skillful, 1=known
-                'skill_degree': 'skillful' if ss.proficiency == 0 else 'known'
-            })
+        if sort_by == 'relevance' and indexed_post_ids is not None:
+            # 相关度排序：先取全部候选 id（已按发布时间倒序），打分后稳定排序再分页
+            candidate_ids = list(posts_query.values_list('post_id', flat=True))
+            total = len(candidate_ids)
+            relevance_scores = score_posts(search_term, candidate_ids)
+            candidate_ids.sort(key=lambda pid: -relevance_scores.get(pid, 0.0))
+            page_ids = candidate_ids[offset:offset + page_size]
+            posts_by_id = PostEntity.objects.select_related('card').only(*LIST_ROW_FIELDS).in_bulk(page_ids)
+            posts = [posts_by_id[pid] for pid in page_ids if pid in posts_by_id]
+        elif cursor_mode:
+            if cursor_position is not None:
+                cursor_time, cursor_post_id = cursor_position
+                posts_query = posts_query.filter(
+                    Q(create_time__lt=cursor_time) |
+                    Q(create_time=cursor_time, post_id__lt=cursor_post_id)
+                )
+            # 多取一条用于判断是否还有下一页
+            posts = list(posts_query[:page_size + 1])
+            has_more = len(posts) > page_size
+            posts = posts[:page_size]
+            next_cursor = encode_list_cursor(posts[-1]) if has_more else None
+        else:
+            # 计算总数
+            total = posts_query.count()
+            # 分页查询
+            posts = list(posts_query[offset:offset + page_size])
         
-        # 批量查询附件
-        attachments_dict = {}
-        attachments_list = PostAttachment.objects.filter(
-            post_id__in=post_ids,
-            is_active=True
-        ).order_by('-created_at')
-        for att in attachments_list:
-            if att.post_id not in attachments_dict:
-                attachments_dict[att.post_id] = []
-            attachments_dict[att.post_id].append({
-                'attachment_id': str(att.id),
-                'original_filename': att.original_filename,
-                'file_size': att.file_size,
-                'formatted_size': att.formatted_size,
-                'mime_type': att.mime_type,
-                'file_type': att.file_type,
-                'download_url': att.download_url,
-                'created_at': att.created_at.isoformat() if att.created_at else None
-            })
+        if not cursor_mode:
+            # 计算总页数
+            total_pages = (total + page_size - 1) // page_size if total > 0 else 0
+        # 只读出 post_id 和卡片版本号，条目 JSON 片段优先取缓存，未命中的才查库序列化
+        fragments = load_card_fragments([
+            (post.post_id, post.card.version if getattr(post, 'card', None) else None)
+            for post in posts
+        ], list_fields)
         
         result = []
-        
         for post in posts:
-            # 根据项目类型获取项目信息和发布人信息
-            post_type_str = None
-            title = None
-            publisher_name = None
-            
-            if post.post_type == 1:  # 科研项目
-                research = research_dict.get(post.post_id)
-                if not research:
-                    continue
-                post_type_str = 'research'
-                title = research.research_name
-                publisher_name = research.teacher.teacher_name
-                
-                # 获取技术栈（完整字符串）
-                tech_stack = post_stacks_dict.get(post.post_id, '')
-                
-                # 构建项目数据
-                project_data = {
-                    'post_id': post.post_id,
-                    'post_type': post_type_str,
-                    'title': title,
-                    'teacher_name': publisher_name,
-                    'like_num': post.like_num,
-                    'favorite_num': post.favorite_num,
-                    'comment_num': post.comment_num,
-                    'create_time': post.create_time.isoformat() if post.create_time else None,
-                    'tech_stack': tech_stack,  # 技术栈字符串
-                    'attachments': attachments_dict.get(post.post_id, []),  # 附件列表
-                    'recruit_status': post.recruit_status  # 招募状态
-                }
-            
-            elif post.post_type == 2:  # 竞赛项目
-                competition = competition_dict.get(post.post_id)
-                if not competition:
-                    continue
-                post_type_str = 'competition'
-                title = competition.competition_name
-                publisher_name = competition.teacher.teacher_name
-                
-                # 构建项目数据
-                project_data = {
-                    'post_id': post.post_id,
-                    'post_type': post_type_str,
-                    'title': title,
-                    'teacher_name': publisher_name,
-                    'like_num': post.like_num,
-                    'favorite_num': post.favorite_num,
-                    'comment_num': post.comment_num,
-                    'create_time': post.create_time.isoformat() if post.create_time else None,
-                    'attachments': attachments_dict.get(post.post_id, []),  # 附件列表
-                    'recruit_status': post.recruit_status  # 招募状态
-                }
-            
-            elif post.post_type == 3:  # 个人技能
-                skill = skill_dict.get(post.post_id)
-                if not skill:
-                    continue
-                post_type_str = 'personal'
-                # 个人技能使用专业方向作为标题，如果有方向则使用第一个，否则使用学生姓名
-                directions = post_directions_dict.get(post.post_id, [])
-                title = directions[0] if directions else skill.student.student_name
-                publisher_name = skill.student.student_name
-                
-                # 获取技能列表
-                skills = student_skills_dict.get(post.post_id, [])
-
-                # 计算技能评分
-                score_payload = calculate_skill_score(skill.project_experience, skills)
-                
-                # 构建项目数据
-                project_data = {
-                    'post_id': post.post_id,
-                    'post_type': post_type_str,
-                    'title': title,
-                    'teacher_name': publisher_name,  # 对于个人项目，这里实际是学生姓名
-                    'like_num': post.like_num,
-                    'favorite_num': post.favorite_num,
-                    'comment_num': post.comment_num,
-                    'create_time': post.create_time.isoformat() if post.create_time else None,
-                    'major': directions,  # 专业方向列表
-                    'skills': skills,  # 技能列表（包含技能名和熟练度）
-                    'attachments': attachments_dict.get(post.post_id, []),  # 附件列表
-                    'recruit_status': post.recruit_status,  # 招募状态（个人技能项目也有此字段，但通常不显示）
-                    'skill_score': score_payload['total_score'],
-                }
-            
+            fragment = fragments.get(post.post_id)
             # 如果无法获取项目信息，跳过
-            if not title or not publisher_name:
+            if fragment is None:
                 continue
-            
-            result.append(project_data)
+            if relevance_scores is not None and (list_fields is None or 'relevance_score' in list_fields):
+                fragment = append_fragment_field(
+                    fragment, 'relevance_score', round(relevance_scores.get(post.post_id, 0.0), 4)
+                )
+            result.append(fragment)
         
-        return Response(
-            {
-                'code': 200,
-                'msg': '获取成功',
-                'data': {
-                    'items': result,
-                    'total': total,
-                    'page': page,
-                    'page_size': page_size,
-                    'total_pages': total_pages
-                }
-            },
-            status=status.HTTP_200_OK
-        )
+        if cursor_mode:
+            meta = {
+                'page_size': page_size,
+                'next_cursor': next_cursor,
+                'has_more': has_more
+            }
+        else:
+            meta = {
+                'total': total,
+                'page': page,
+                'page_size': page_size,
+                'total_pages': total_pages
+            }
+        if facets is not None:
+            meta['facets'] = facets
+        return render_list_response(result, meta)
     
     except Exception as e:
         return Response(
@@ -699,7 +715,6 @@ def get_project_detail(request, post_id):
                 
                 # 获取该项目的技能
                 student_skills = StudentSkill.objects.filter(post=post).select_related('skill')
-                score_payload = calculate_skill_score(skill.project_experience, student_skills)
                 skills_list = [
                     {
                         'skill_name': ss.skill.skill_name,
@@ -721,10 +736,12 @@ def get_project_detail(request, post_id):
                     'student_name': skill.student.student_name,
                     'student_user_id': StudentEntity.objects.get(student_id=skill.student_id).user_id,
                     'tags': tags_list,  # 添加标签列表
-                    'skill_score': score_payload['total_score'],
+                    'skill_score': skill.skill_score,
                     'skill_score_detail': {
-                        'keyword_score': score_payload['keyword_score'],
-                        'proficiency_score': score_payload['proficiency_score'],
+                        'keyword_score': skill.keyword_score,
+                        'proficiency_score': skill.proficiency_score,
+                        'word_weight_version': skill.score_version,
+                        'current_word_weight_version': word_weight_store.current().version,
                         'alpha': ALPHA_WEIGHT,
                         'beta': BETA_WEIGHT
                     }
@@ -774,19 +791,94 @@ def get_project_detail(request, post_id):
         )
 
 
+@api_view(['GET'])
+def recommend_projects(request, post_id):
+    """为你推荐接口（学生 ↔ 项目双向）
+    
+    GET /project/recommend/<post_id>
+    - 个人技能 post：推荐仍在招募的科研/竞赛项目
+    - 科研/竞赛 post：推荐匹配的个人技能 post
+    查询参数（可选）:
+    - k: 返回条数（默认：10，最多 50）
+    
+    匹配度为双方技能/技术栈、方向、标签词项向量的余弦相似度（0~1），
+    每条结果在列表条目格式基础上额外返回 match_score；
+    结果按 post 和调用方可见性分组缓存，任一 post 的词项变化后失效
+    
+    返回:
+    {
+        "code": 200,
+        "msg": "获取成功",
+        "data": {
+            "items": [...],  # 同 /project/list 的条目
+            "post_id": 1,
+            "k": 10
+        }
+    }
+    """
+    try:
+        try:
+            k = int(request.GET.get('k', 10))
+        except (ValueError, TypeError):
+            k = 10
+        k = max(1, min(RECOMMEND_TOP_K, k))
+        
+        # 调用方只能看到自己可见的 post，源 post 同样受可见权限约束
+        group = visibility_group(get_user_from_token(request))
+        post = filter_visible(PostEntity.objects.filter(post_id=post_id), group).first()
+        if post is None:
+            return Response(
+                {'code': 404, 'msg': '项目不存在'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        matches = recommend_posts(post, group, k)
+        versions = dict(
+            ProjectCard.objects.filter(post_id__in=[pid for pid, _ in matches]).values_list('post_id', 'version')
+        )
+        fragments = load_card_fragments([(pid, versions.get(pid)) for pid, _ in matches])
+        result = [
+            append_fragment_field(fragments[pid], 'match_score', round(score, 4))
+            for pid, score in matches if pid in fragments
+        ]
+        return render_list_response(result, {'post_id': post.post_id, 'k': k})
+    
+    except Exception as e:
+        return Response(
+            {'code': 500, 'msg': f'获取推荐失败: {str(e)}'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
 @api_view(['GET'])
 @login_required
+@identity_required
 def time_match_overview(request):
     """学生-教师项目的可投入时间匹配度概览。
 
     GET /project/time-match
     查询参数:
-    - post_id :学生发布的技能信息的 post_id （必填）
+    - post_id :学生发布的技能信息的 post_id （单个模式必填）
 
     返回学生与该教师所有科研/竞赛项目的匹配度。
+
+    批量模式（传入以下任一参数时启用，忽略 post_id）:
+    - post_ids: 逗号分隔的多个学生技能 post_id（最多 TIME_MATCH_BATCH_LIMIT 个）
+    - applicants=1: 所有申请了该教师项目且待处理的学生（取各自最近发布的技能信息）
+    可选:
+    - min_ratio / max_ratio: 只返回匹配度在该区间内的组合（无法计算的组合被过滤）
+    批量模式返回 students、projects 以及按匹配度倒序的 matches 列表（学生 × 项目）。
     """
-    user = get_user_from_token(request)
+    user = request.user
     post_id = request.GET.get('post_id', None)
+    batch_mode = bool(request.GET.get('post_ids')) or request.GET.get('applicants') in ('1', 'true')
+    if batch_mode:
+        if user.identity == 0:
+            return Response({'code': 403, 'msg': '无权查看时间匹配度'}, status=status.HTTP_403_FORBIDDEN)
+        teacher = request.identity.teacher
+        if not teacher:
+            return Response({'code': 404, 'msg': '教师不存在'}, status=status.HTTP_404_NOT_FOUND)
+        return time_match_batch(request, teacher)
     if not post_id:
         return Response({'code': 400, 'msg': '缺少必要参数 post_id'}, status=status.HTTP_400_BAD_REQUEST)
     # 身份校验：教师只能查看自己的项目
@@ -794,23 +886,20 @@ def time_match_overview(request):
         return Response({'code': 403, 'msg': '无权查看时间匹配度'}, status=status.HTTP_403_FORBIDDEN)
     
     # 获取实体
-    try:
-        teacher = TeacherEntity.objects.get(user_id=user.user_id)
-    except TeacherEntity.DoesNotExist:
+    teacher = request.identity.teacher
+    if not teacher:
         return Response({'code': 404, 'msg': '教师不存在'}, status=status.HTTP_404_NOT_FOUND)
 
     # 学生可投入时间，取最近发布的个人技能记录
     skill_info = SkillInformation.objects.filter(post_id=post_id).select_related('post').order_by('-post__create_time').first()
-    student_hours, parsed = parse_hours_per_week(skill_info.spend_time if skill_info else '')
-    if not parsed:
-        student_hours = None
+    student_hours, parsed = stored_hours_per_week(skill_info) if skill_info else (None, False)
 
     projects = []
 
     # 科研项目
     research_list = ResearchProject.objects.filter(teacher_id=teacher.teacher_id).select_related('post')
     for rp in research_list:
-        duration_weeks, project_hours = calc_project_hours_per_week(rp.starttime, rp.endtime)
+        project_hours = rp.hours_per_week
         match_ratio = classify_match(student_hours, project_hours)
         projects.append({
             'post_id': rp.post_id,
@@ -833,6 +922,256 @@ def time_match_overview(request):
     )
 
 
+TIME_MATCH_BATCH_LIMIT = 500  # 批量模式单次最多的学生数
+
+
+def load_teacher_project_hours(teacher):
+    """教师所有科研/竞赛项目的每周标准工时（科研项目读取已存储的值，竞赛以发布时间到报名截止为周期）"""
+    projects = []
+    for rp in ResearchProject.objects.filter(teacher_id=teacher.teacher_id).only(
+        'post_id', 'research_name', 'hours_per_week'
+    ):
+        projects.append({
+            'post_id': rp.post_id,
+            'post_type': 'research',
+            'title': rp.research_name,
+            'project_hours_per_week': rp.hours_per_week
+        })
+    for cp in CompetitionProject.objects.filter(teacher_id=teacher.teacher_id).select_related('post').only(
+        'post_id', 'competition_name', 'deadline', 'post__create_time'
+    ):
+        _, project_hours = calc_project_hours_per_week(cp.post.create_time, cp.deadline)
+        projects.append({
+            'post_id': cp.post_id,
+            'post_type': 'competition',
+            'title': cp.competition_name,
+            'project_hours_per_week': project_hours
+        })
+    return projects
+
+
+def time_match_batch(request, teacher):
+    """批量计算学生 × 教师项目的时间匹配度矩阵（见 time_match_overview）"""
+    try:
+        min_ratio = float(request.GET['min_ratio']) if request.GET.get('min_ratio') else None
+        max_ratio = float(request.GET['max_ratio']) if request.GET.get('max_ratio') else None
+    except ValueError:
+        return Response({'code': 400, 'msg': 'min_ratio/max_ratio 必须是数字'}, status=status.HTTP_400_BAD_REQUEST)
+
+    skill_query = SkillInformation.objects.select_related('student').only(
+        'post_id', 'student_id', 'spend_time', 'hours_per_week', 'hours_parsed', 'student__student_name'
+    )
+    if request.GET.get('post_ids'):
+        try:
+            post_ids = {int(pid) for pid in request.GET['post_ids'].split(',') if pid.strip()}
+        except ValueError:
+            return Response({'code': 400, 'msg': 'post_ids 参数无效'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(post_ids) > TIME_MATCH_BATCH_LIMIT:
+            return Response(
+                {'code': 400, 'msg': f'post_ids 最多 {TIME_MATCH_BATCH_LIMIT} 个'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        skill_infos = list(skill_query.filter(post_id__in=post_ids).order_by('post_id'))
+    else:
+        # 待处理的申请（role=1 申请, status=2 待确认），每个学生取最近发布的技能信息
+        student_ids = TeacherStudentCooperation.objects.filter(
+            teacher_id=teacher.teacher_id, role=1, status=2
+        ).values_list('student_id', flat=True).distinct()[:TIME_MATCH_BATCH_LIMIT]
+        latest = {}
+        for info in skill_query.filter(student_id__in=list(student_ids)).order_by('student_id', '-post__create_time'):
+            latest.setdefault(info.student_id, info)
+        skill_infos = list(latest.values())
+
+    # 每周可投入小时数在发布时已解析入库
+    students = []
+    for info in skill_infos:
+        hours, parsed = stored_hours_per_week(info)
+        students.append({
+            'post_id': info.post_id,
+            'student_id': info.student_id,
+            'student_name': info.student.student_name,
+            'student_hours_per_week': hours,
+            'parsed': parsed
+        })
+
+    projects = load_teacher_project_hours(teacher)
+
+    matches = []
+    for student in students:
+        student_hours = student['student_hours_per_week']
+        for project in projects:
+            ratio = classify_match(student_hours, project['project_hours_per_week'])
+            if not isinstance(ratio, float):
+                ratio = None  # 无法计算
+            if ratio is None and (min_ratio is not None or max_ratio is not None):
+                continue
+            if min_ratio is not None and ratio < min_ratio:
+                continue
+            if max_ratio is not None and ratio > max_ratio:
+                continue
+            matches.append({
+                'student_post_id': student['post_id'],
+                'project_post_id': project['post_id'],
+                'match_ratio': ratio
+            })
+    # 匹配度倒序，无法计算的排在最后
+    matches.sort(key=lambda m: (m['match_ratio'] is None, -(m['match_ratio'] or 0)))
+
+    return Response(
+        {
+            'code': 200,
+            'msg': 'ok',
+            'data': {
+                'students': students,
+                'projects': projects,
+                'matches': matches,
+                'total': len(matches)
+            }
+        },
+        status=status.HTTP_200_OK
+    )
+
+
+# 分配建议单次最多参与求解的学生-项目组合数（约 5000 学生 × 50 项目，求解约 1 秒内）
+ASSIGNMENT_MAX_PAIRS = 250000
+
+
+@api_view(['GET'])
+@login_required
+@identity_required
+def suggest_assignment(request):
+    """招募分配建议：把待处理的申请学生分配到教师正在招募的科研项目
+
+    GET /project/assignment
+    查询参数（可选）:
+    - allow_cross=1: 允许把学生分配到他没有申请的项目（默认只在各自申请的项目中分配）
+
+    每个学生-项目组合的匹配度 = 技能评分 + 时间匹配度（classify_match，无法计算按 0），
+    在各项目剩余名额（recruit_quantity 减已确认人数）内求总匹配度最大的分配；
+    只是建议，不会修改任何合作记录。
+    学生-项目组合数超过 ASSIGNMENT_MAX_PAIRS 时返回 400（如 allow_cross=1 且申请人很多）。
+
+    返回:
+    {
+        "code": 200,
+        "msg": "ok",
+        "data": {
+            "projects": [
+                {"post_id": 1, "title": "...", "capacity": 3,
+                 "students": [{"post_id": 5, "student_id": 1, "student_name": "...",
+                               "skill_score": 6.2, "match_ratio": 1.2, "fit": 7.4}, ...]},
+                ...
+            ],
+            "unassigned": [...],  # 未分配到项目的学生，字段同上（不含 fit）
+            "total_fit": 20.5
+        }
+    }
+    """
+    try:
+        user = request.user
+        if user.identity == 0:
+            return Response({'code': 403, 'msg': '无权查看分配建议'}, status=status.HTTP_403_FORBIDDEN)
+        teacher = request.identity.teacher
+        if not teacher:
+            return Response({'code': 404, 'msg': '教师不存在'}, status=status.HTTP_404_NOT_FOUND)
+        allow_cross = request.GET.get('allow_cross') in ('1', 'true')
+
+        # 正在招募的科研项目及剩余名额
+        research_list = list(
+            ResearchProject.objects.filter(teacher_id=teacher.teacher_id, post__recruit_status=0)
+            .only('post_id', 'research_name', 'recruit_quantity', 'hours_per_week')
+            .order_by('post_id')
+        )
+        confirmed = dict(
+            TeacherStudentCooperation.objects.filter(
+                post_id__in=[rp.post_id for rp in research_list], status=3
+            ).values('post_id').annotate(count=Count('cooperation_id')).values_list('post_id', 'count')
+        )
+        capacities = [max(0, rp.recruit_quantity - confirmed.get(rp.post_id, 0)) for rp in research_list]
+        project_index = {rp.post_id: index for index, rp in enumerate(research_list)}
+
+        # 待处理的申请（role=1 申请, status=2 待确认）：学生 -> 申请的项目
+        applied = {}
+        for student_id, post_id in TeacherStudentCooperation.objects.filter(
+            teacher_id=teacher.teacher_id, role=1, status=2, post_id__in=list(project_index)
+        ).values_list('student_id', 'post_id'):
+            applied.setdefault(student_id, set()).add(project_index[post_id])
+
+        # 每个学生取最近发布的技能信息
+        latest = {}
+        for info in SkillInformation.objects.filter(student_id__in=list(applied)).select_related('student').only(
+            'post_id', 'student_id', 'spend_time', 'hours_per_week', 'hours_parsed', 'skill_score', 'student__student_name'
+        ).order_by('student_id', '-post__create_time'):
+            latest.setdefault(info.student_id, info)
+
+        pair_count = len(latest) * len(research_list) if allow_cross else sum(
+            len(applied[student_id]) for student_id in latest
+        )
+        if pair_count > ASSIGNMENT_MAX_PAIRS:
+            return Response(
+                {'code': 400, 'msg': f'学生-项目组合数 {pair_count} 超过上限 {ASSIGNMENT_MAX_PAIRS}，请关闭 allow_cross 或分批处理'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        students = []
+        weights = []
+        for student_id in sorted(latest):
+            info = latest[student_id]
+            student_hours, _ = stored_hours_per_week(info)
+            targets = range(len(research_list)) if allow_cross else applied[student_id]
+            edges = {}
+            ratios = {}
+            for index in targets:
+                ratio = classify_match(student_hours, research_list[index].hours_per_week)
+                ratios[index] = ratio if isinstance(ratio, float) else None
+                edges[index] = round(info.skill_score + (ratios[index] or 0.0), 4)
+            students.append({
+                'post_id': info.post_id,
+                'student_id': student_id,
+                'student_name': info.student.student_name,
+                'skill_score': info.skill_score,
+                'ratios': ratios
+            })
+            weights.append(edges)
+
+        assignment, total_fit = assign_students(weights, capacities)
+
+        projects = [
+            {'post_id': rp.post_id, 'title': rp.research_name, 'capacity': capacities[index], 'students': []}
+            for index, rp in enumerate(research_list)
+        ]
+        unassigned = []
+        for student, project, edges in zip(students, assignment, weights):
+            ratios = student.pop('ratios')
+            if project is None:
+                unassigned.append(student)
+                continue
+            student['match_ratio'] = ratios[project]
+            student['fit'] = edges[project]
+            projects[project]['students'].append(student)
+        for project in projects:
+            project['students'].sort(key=lambda item: -item['fit'])
+
+        return Response(
+            {
+                'code': 200,
+                'msg': 'ok',
+                'data': {
+                    'projects': projects,
+                    'unassigned': unassigned,
+                    'total_fit': round(total_fit, 4)
+                }
+            },
+            status=status.HTTP_200_OK
+        )
+    
+    except Exception as e:
+        return Response(
+            {'code': 500, 'msg': f'获取分配建议失败: {str(e)}'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
 def timestamp_to_datetime(timestamp_ms):
     """将Unix时间戳（毫秒）转换为timezone-aware datetime"""
     try:
@@ -954,6 +1293,7 @@ def sync_post_skills(post, skills_data):
     
     # 删除该post的所有旧技能关联
     StudentSkill.objects.filter(post=post).delete()
+    saved_proficiency = {}  # skill_id -> proficiency，同名技能以最后一次为准
     
     # 处理每个技能
     for skill_item in skills_data:
@@ -984,10 +1324,66 @@ def sync_post_skills(post, skills_data):
             # 如果已存在，更新熟练度
             student_skill.proficiency = proficiency
             student_skill.save()
+        saved_proficiency[skill.skill_id] = proficiency
+    
+    # 技能变化后重新计算并保存技能评分
+    store_skill_score(post, [{'proficiency': p} for p in saved_proficiency.values()])
+
+
+def store_skill_score(post, skills_data):
+    """计算并保存个人技能发布的技能评分（需在项目经历写入之后调用）
+    
+    Args:
+        post: PostEntity对象
+        skills_data: 技能列表，元素为包含 proficiency 或 skill_degree 的字典
+    """
+    project_experience = SkillInformation.objects.filter(post=post).values_list(
+        'project_experience', flat=True
+    ).first()
+    if project_experience is None:
+        return
+    score_payload = calculate_skill_score(project_experience, skills_data)
+    SkillInformation.objects.filter(post=post).update(
+        skill_score=score_payload['total_score'],
+        keyword_score=score_payload['keyword_score'],
+        proficiency_score=score_payload['proficiency_score'],
+        score_version=score_payload['word_weight_version'] or ''
+    )
+
+
+def sync_post_search_index(post):
+    """重建post的搜索索引（在发布/更新的事务内调用）
+    
+    Args:
+        post: PostEntity对象
+    """
+    index_posts([post.post_id])
+
+
+def sync_post_terms(post):
+    """重建post的推荐词项向量（在发布/更新的事务内、技能/方向/技术栈同步之后调用）
+    
+    Args:
+        post: PostEntity对象
+    """
+    refresh_post_terms([post.post_id])
+
+
+def sync_post_card(post):
+    """重建post的列表卡片并使列表缓存失效（在发布/更新的事务内调用）
+    
+    Args:
+        post: PostEntity对象
+    """
+    refresh_project_cards([post.post_id])
+    refresh_hot_scores([post.post_id])
+    # 可见权限可能在本次更新中变化，所有分组的列表缓存都失效
+    invalidate_project_list()
 
 
 @api_view(['POST'])
 @login_required
+@identity_required
 def publish_research(request):
     """发布科研项目接口
     
@@ -1021,8 +1417,8 @@ def publish_research(request):
     user = request.user
     
     # 检查用户是否有未完成的合作流程
-    teacher = TeacherEntity.objects.filter(user_id=user.user_id).first()
-    student = StudentEntity.objects.filter(user_id=user.user_id).first()
+    teacher = request.identity.teacher
+    student = request.identity.student
     
     q_objects = models.Q()
     if teacher:
@@ -1056,17 +1452,15 @@ def publish_research(request):
     
     try:
         with transaction.atomic():
-            # 获取教师实体
-            try:
-                teacher = TeacherEntity.objects.get(teacher_id=validated_data['teacher_id'])
-            except TeacherEntity.DoesNotExist:
+            # 教师实体已由 identity_required 解析
+            if not teacher:
                 return Response(
                     {'code': 404, 'msg': '教师信息不存在'},
                     status=status.HTTP_404_NOT_FOUND
                 )
             
             # 验证教师ID是否匹配当前用户
-            if teacher.user != user:
+            if teacher.teacher_id != validated_data['teacher_id']:
                 return Response(
                     {'code': 403, 'msg': '无权操作其他教师的项目'},
                     status=status.HTTP_403_FORBIDDEN
@@ -1080,7 +1474,7 @@ def publish_research(request):
                     # 验证post是否属于该教师
                     try:
                         existing_research = ResearchProject.objects.get(post=post)
-                        if existing_research.teacher != teacher:
+                        if existing_research.teacher_id != teacher.teacher_id:
                             return Response(
                                 {'code': 403, 'msg': '无权修改其他教师的项目'},
                                 status=status.HTTP_403_FORBIDDEN
@@ -1090,6 +1484,9 @@ def publish_research(request):
                         existing_research.recruit_quantity = validated_data['recruit_quantity']
                         existing_research.starttime = timestamp_to_datetime(validated_data['starttime'])
                         existing_research.endtime = timestamp_to_datetime(validated_data['endtime'])
+                        existing_research.duration_weeks, existing_research.hours_per_week = calc_project_hours_per_week(
+                            existing_research.starttime, existing_research.endtime
+                        )
                         existing_research.outcome = validated_data['outcome']
                         existing_research.contact = validated_data['contact']
                         existing_research.save()
@@ -1104,6 +1501,11 @@ def publish_research(request):
                         sync_post_directions(post, validated_data.get('research_direction', ''))
                         sync_post_stacks(post, validated_data.get('tech_stack', ''))
                         
+                        # 同步搜索索引、推荐词项和列表卡片
+                        sync_post_search_index(post)
+                        sync_post_terms(post)
+                        sync_post_card(post)
+                        
                         return Response(
                             {
                                 'code': 200,
@@ -1131,17 +1533,23 @@ def publish_research(request):
                 like_num=0,
                 favorite_num=0,
                 comment_num=0,
-                visibility=visibility
+                visibility=visibility,
+                author_id=teacher.user_id
             )
             
             # 创建ResearchProject
+            starttime = timestamp_to_datetime(validated_data['starttime'])
+            endtime = timestamp_to_datetime(validated_data['endtime'])
+            duration_weeks, hours_per_week = calc_project_hours_per_week(starttime, endtime)
             ResearchProject.objects.create(
                 post=post,
                 teacher=teacher,
                 research_name=validated_data['research_name'],
                 recruit_quantity=validated_data['recruit_quantity'],
-                starttime=timestamp_to_datetime(validated_data['starttime']),
-                endtime=timestamp_to_datetime(validated_data['endtime']),
+                starttime=starttime,
+                endtime=endtime,
+                duration_weeks=duration_weeks,
+                hours_per_week=hours_per_week,
                 outcome=validated_data['outcome'],
                 contact=validated_data['contact']
             )
@@ -1150,6 +1558,11 @@ def publish_research(request):
             sync_post_directions(post, validated_data.get('research_direction', ''))
             sync_post_stacks(post, validated_data.get('tech_stack', ''))
             
+            # 同步搜索索引、推荐词项和列表卡片
+            sync_post_search_index(post)
+            sync_post_terms(post)
+            sync_post_card(post)
+            
             return Response(
                 {
                     'code': 200,
@@ -1173,6 +1586,7 @@ def publish_research(request):
 
 @api_view(['POST'])
 @login_required
+@identity_required
 def publish_competition(request):
     """发布竞赛项目接口
     
@@ -1205,8 +1619,8 @@ def publish_competition(request):
     user = request.user
     
     # 检查用户是否有未完成的合作流程
-    teacher = TeacherEntity.objects.filter(user_id=user.user_id).first()
-    student = StudentEntity.objects.filter(user_id=user.user_id).first()
+    teacher = request.identity.teacher
+    student = request.identity.student
     
     q_objects = models.Q()
     if teacher:
@@ -1240,17 +1654,15 @@ def publish_competition(request):
     
     try:
         with transaction.atomic():
-            # 获取教师实体
-            try:
-                teacher = TeacherEntity.objects.get(teacher_id=validated_data['teacher_id'])
-            except TeacherEntity.DoesNotExist:
+            # 教师实体已由 identity_required 解析
+            if not teacher:
                 return Response(
                     {'code': 404, 'msg': '教师信息不存在'},
                     status=status.HTTP_404_NOT_FOUND
                 )
             
             # 验证教师ID是否匹配当前用户
-            if teacher.user != user:
+            if teacher.teacher_id != validated_data['teacher_id']:
                 return Response(
                     {'code': 403, 'msg': '无权操作其他教师的项目'},
                     status=status.HTTP_403_FORBIDDEN
@@ -1291,7 +1703,7 @@ def publish_competition(request):
                     # 验证post是否属于该教师
                     try:
                         existing_competition = CompetitionProject.objects.get(post=post)
-                        if existing_competition.teacher != teacher:
+                        if existing_competition.teacher_id != teacher.teacher_id:
                             return Response(
                                 {'code': 403, 'msg': '无权修改其他教师的项目'},
                                 status=status.HTTP_403_FORBIDDEN
@@ -1311,6 +1723,11 @@ def publish_competition(request):
                             post.visibility = visibility
                             post.save(update_fields=['visibility'])
                         
+                        # 同步搜索索引、推荐词项和列表卡片
+                        sync_post_search_index(post)
+                        sync_post_terms(post)
+                        sync_post_card(post)
+                        
                         return Response(
                             {
                                 'code': 200,
@@ -1338,7 +1755,8 @@ def publish_competition(request):
                 like_num=0,
                 favorite_num=0,
                 comment_num=0,
-                visibility=visibility
+                visibility=visibility,
+                author_id=teacher.user_id
             )
             
             # 创建CompetitionProject
@@ -1353,6 +1771,11 @@ def publish_competition(request):
                 reward=validated_data.get('reward') or None
             )
             
+            # 同步搜索索引、推荐词项和列表卡片
+            sync_post_search_index(post)
+            sync_post_terms(post)
+            sync_post_card(post)
+            
             return Response(
                 {
                     'code': 200,
@@ -1376,6 +1799,7 @@ def publish_competition(request):
 
 @api_view(['POST'])
 @login_required
+@identity_required
 def publish_personal(request):
     """发布个人技能接口
     
@@ -1419,8 +1843,8 @@ def publish_personal(request):
     user = request.user
     
     # 检查用户是否有未完成的合作流程
-    teacher = TeacherEntity.objects.filter(user_id=user.user_id).first()
-    student = StudentEntity.objects.filter(user_id=user.user_id).first()
+    teacher = request.identity.teacher
+    student = request.identity.student
     
     q_objects = models.Q()
     if teacher:
@@ -1454,17 +1878,15 @@ def publish_personal(request):
     
     try:
         with transaction.atomic():
-            # 获取学生实体
-            try:
-                student = StudentEntity.objects.get(student_id=validated_data['student_id'])
-            except StudentEntity.DoesNotExist:
+            # 学生实体已由 identity_required 解析
+            if not student:
                 return Response(
                     {'code': 404, 'msg': '学生信息不存在'},
                     status=status.HTTP_404_NOT_FOUND
                 )
             
             # 验证学生ID是否匹配当前用户
-            if student.user != user:
+            if student.student_id != validated_data['student_id']:
                 return Response(
                     {'code': 403, 'msg': '无权操作其他学生的项目'},
                     status=status.HTTP_403_FORBIDDEN
@@ -1527,7 +1949,7 @@ def publish_personal(request):
                     # 验证post是否属于该学生
                     try:
                         existing_skill = SkillInformation.objects.get(post=post)
-                        if existing_skill.student != student:
+                        if existing_skill.student_id != student.student_id:
                             return Response(
                                 {'code': 403, 'msg': '无权修改其他学生的项目'},
                                 status=status.HTTP_403_FORBIDDEN
@@ -1537,6 +1959,7 @@ def publish_personal(request):
                         existing_skill.experience_link = validated_data.get('experience_link') or None
                         existing_skill.habit_tag = habit_tag_str
                         existing_skill.spend_time = validated_data['spend_time']
+                        existing_skill.hours_per_week, existing_skill.hours_parsed = parse_spend_time(validated_data['spend_time'])
                         existing_skill.expect_worktype = expect_worktype_str
                         existing_skill.filter = filter_str
                         existing_skill.save()
@@ -1553,6 +1976,11 @@ def publish_personal(request):
                         # 处理技能关联
                         sync_post_skills(post, skills_data)
                         
+                        # 同步搜索索引、推荐词项和列表卡片
+                        sync_post_search_index(post)
+                        sync_post_terms(post)
+                        sync_post_card(post)
+                        
                         return Response(
                             {
                                 'code': 200,
@@ -1580,10 +2008,12 @@ def publish_personal(request):
                 like_num=0,
                 favorite_num=0,
                 comment_num=0,
-                visibility=visibility
+                visibility=visibility,
+                author_id=student.user_id
             )
             
             # 创建SkillInformation
+            hours_per_week, hours_parsed = parse_spend_time(validated_data['spend_time'])
             SkillInformation.objects.create(
                 post=post,
                 student=student,
@@ -1591,6 +2021,8 @@ def publish_personal(request):
                 experience_link=validated_data.get('experience_link') or None,
                 habit_tag=habit_tag_str,
                 spend_time=validated_data['spend_time'],
+                hours_per_week=hours_per_week,
+                hours_parsed=hours_parsed,
                 expect_worktype=expect_worktype_str,
                 filter=filter_str
             )
@@ -1601,6 +2033,11 @@ def publish_personal(request):
             # 处理技能关联
             sync_post_skills(post, skills_data)
             
+            # 同步搜索索引、推荐词项和列表卡片
+            sync_post_search_index(post)
+            sync_post_terms(post)
+            sync_post_card(post)
+            
             return Response(
                 {
                     'code': 200,
@@ -1619,6 +2056,7 @@ def publish_personal(request):
 
 @api_view(['POST'])
 @login_required
+@identity_required
 def update_recruit_status(request, post_id):
     """更新项目招募状态接口
     
@@ -1670,8 +2108,8 @@ def update_recruit_status(request, post_id):
         if post.post_type == 1:  # 科研项目
             try:
                 research = ResearchProject.objects.get(post=post)
-                teacher = TeacherEntity.objects.get(user=user)
-                if research.teacher != teacher:
+                teacher = request.identity.teacher
+                if teacher is None or research.teacher_id != teacher.teacher_id:
                     return Response(
                         {'code': 403, 'msg': '无权修改其他教师的项目'},
                         status=status.HTTP_403_FORBIDDEN
@@ -1684,8 +2122,8 @@ def update_recruit_status(request, post_id):
         elif post.post_type == 2:  # 竞赛项目
             try:
                 competition = CompetitionProject.objects.get(post=post)
-                teacher = TeacherEntity.objects.get(user=user)
-                if competition.teacher != teacher:
+                teacher = request.identity.teacher
+                if teacher is None or competition.teacher_id != teacher.teacher_id:
                     return Response(
                         {'code': 403, 'msg': '无权修改其他教师的项目'},
                         status=status.HTTP_403_FORBIDDEN
@@ -1721,6 +2159,10 @@ def update_recruit_status(request, post_id):
         # 更新招募状态
         post.recruit_status = recruit_status
         post.save(update_fields=['recruit_status'])
+        update_cards([post.post_id], recruit_status=recruit_status)
+        invalidate_project_list(post.visibility)
+        # 推荐只向学生返回招募中的项目
+        invalidate_recommendations()
         
         return Response(
             {
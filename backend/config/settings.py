@@ -125,6 +125,33 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 20,
 }
 
+# Token 缓存（进程内 LRU + TTL）
+# 跨 worker 吊销依赖 Django 缓存中的用户吊销标记，多进程部署需配置共享缓存（如 Redis），
+# 默认的 LocMemCache 下不做标记比对，其他进程中被吊销的 token 最长在 TOKEN_CACHE_TTL 后失效
+TOKEN_CACHE_MAX_SIZE = int(os.getenv('TOKEN_CACHE_MAX_SIZE', '1024'))
+TOKEN_CACHE_TTL = int(os.getenv('TOKEN_CACHE_TTL', '300'))  # 秒
+
+# 登录会话
+SESSION_TOKEN_MAX_AGE = int(os.getenv('SESSION_TOKEN_MAX_AGE', str(7 * 24 * 3600)))  # 秒
+SESSION_LAST_SEEN_FLUSH_INTERVAL = int(os.getenv('SESSION_LAST_SEEN_FLUSH_INTERVAL', '60'))  # 秒
+
+# 签名令牌（HMAC，使用 SECRET_KEY），开启后鉴权不查库
+AUTH_SIGNED_TOKENS = os.getenv('AUTH_SIGNED_TOKENS', 'False') == 'True'
+SIGNED_TOKEN_MAX_AGE = int(os.getenv('SIGNED_TOKEN_MAX_AGE', str(7 * 24 * 3600)))  # 秒
+TOKEN_VERSION_CACHE_TTL = int(os.getenv('TOKEN_VERSION_CACHE_TTL', '60'))  # 秒，吊销最长生效延迟
+
+# 技能评分关键词权重表（修改后各 worker 在检查间隔内自动加载新版本）
+WORD_WEIGHT_FILE = os.getenv('WORD_WEIGHT_FILE', str(BASE_DIR / 'api' / 'data' / 'word_weight.txt'))
+WORD_WEIGHT_CHECK_INTERVAL = int(os.getenv('WORD_WEIGHT_CHECK_INTERVAL', '5'))  # 秒
+
+# /project/list 响应缓存（按可见性分组），0 表示关闭
+# 失效依赖 Django 缓存中的代数计数，多进程部署需配置共享缓存（如 Redis），否则各进程只能靠 TTL 过期
+PROJECT_LIST_CACHE_TTL = int(os.getenv('PROJECT_LIST_CACHE_TTL', '30'))  # 秒
+# 列表条目 JSON 片段缓存，键含卡片版本号，写入即失效，TTL 只用于回收内存
+PROJECT_CARD_FRAGMENT_TTL = int(os.getenv('PROJECT_CARD_FRAGMENT_TTL', '3600'))  # 秒
+# 热度分衰减尺度：晚发布这么多秒，等价于互动数多一个数量级（修改后需 refresh_hot_scores --all）
+HOT_SCORE_DECAY_SECONDS = int(os.getenv('HOT_SCORE_DECAY_SECONDS', str(3 * 24 * 3600)))
+
 # CORS settings
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",